@@ -1,17 +1,611 @@
-from fastapi import FastAPI
-import multiprocessing
-import flet as fl
+import functools
+import json
+import os
+import time
+from dataclasses import asdict
+from datetime import date, datetime
+from typing import List, Optional
 
-from frontend.app.portalapp import Portalapp
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
+
+from backend.app.cache.respuestas import CacheRespuestas
+from backend.app.cambios.productos import CambiosProductos
+from backend.app.enums.cambios import Cambios
+from backend.app.enums.despliegue import Despliegue
+from backend.app.enums.idempotencia import Idempotencia
+from backend.app.enums.imagenes import Imagenes
+from backend.app.enums.metricas import Metricas
+from backend.app.metricas.portalapp import MetricasPortalapp
+from backend.app.enums.cache import Cache
+from backend.app.enums.reports import Reports
+from backend.app.routes.deudas import DeudaRoutes
+from backend.app.routes.deudores import DeudorRoutes
+from backend.app.routes.productos import ProductoRoutes
+from backend.app.routes.reportes import ReporteRoutes
+from backend.app.routes.ventas import VentaRoutes
+from backend.app.schemas.comunes import Pagina, paginar
+from backend.app.schemas.deudores import (
+    AbonoEntrada,
+    AbonoSchema,
+    AntiguedadSchema,
+    DeudaSchema,
+    DeudorDetalleSchema,
+    DeudorEntrada,
+    DeudorSchema,
+)
+from backend.app.schemas.productos import (
+    ProductoActualizacion,
+    ProductoEntrada,
+    ProductoSchema,
+)
+from backend.app.schemas.ventas import (
+    DetalleVentaSchema,
+    PaginaVentasSchema,
+    RendimientoProductoSchema,
+    ResumenSchema,
+    VentaEntrada,
+    VentaSchema,
+)
+from backend.app.serializacion.rapida import respuesta_json
+from backend.app.services.deudas import DeudaService
+from backend.app.services.deudores import DeudorService
+from backend.app.services.productos import ProductoService
+from backend.app.services.reportes import ReporteService
+from backend.app.services.ventas import VentaService
+from backend.data.imagenes.almacen import AlmacenImagenes
+from backend.data.managers.csv_manager import CSVManager
+from backend.data.managers.remoto import CSVManagerRemoto
+from backend.models.abono import Abono
+from backend.models.deuda import Deuda
+from backend.models.deudor import Deudor
+from backend.models.producto import Producto
+from backend.models.resumen import ResumenDiario, ResumenMensual
+from backend.models.venta import Venta
+from backend.models.venta_producto import VentaProducto
 
 app = FastAPI()
 
+MODO_DESPLIEGUE = os.environ.get(Despliegue.VARIABLE, Despliegue.PROCESOS)
+
+if MODO_DESPLIEGUE == Despliegue.SERVIDOR:
+    # Worker de la API: los datos y las escrituras viven en el servidor de datos
+    data_manager = CSVManagerRemoto()
+else:
+    data_manager = CSVManager()
+
+
+def servicio(clase: type):
+    """Instancia local del servicio o, con servidor de datos, su representante remoto."""
+    if isinstance(data_manager, CSVManagerRemoto):
+        return data_manager.servicio(clase)
+    return clase(data_manager)
+
+
+producto_routes = ProductoRoutes(servicio(ProductoService))
+venta_routes = VentaRoutes(servicio(VentaService))
+deudor_routes = DeudorRoutes(servicio(DeudorService))
+deuda_routes = DeudaRoutes(servicio(DeudaService))
+reporte_routes = ReporteRoutes(servicio(ReporteService))
+cache: CacheRespuestas = data_manager.get_component(CacheRespuestas)
+metricas: MetricasPortalapp = data_manager.get_component(MetricasPortalapp)
+
+# Tamaño de página por defecto y máximo de los listados
+LIMITE_PAGINA = Query(50, ge=1, le=500)
+DESPLAZAMIENTO = Query(0, ge=0)
+
+
+def no_encontrado(e: ValueError) -> HTTPException:
+    """Convierte el ValueError de una consulta por ID en un 404."""
+    return HTTPException(status_code=404, detail=str(e))
+
+
+def solicitud_invalida(e: ValueError) -> HTTPException:
+    """Convierte el ValueError de una escritura rechazada en un 400."""
+    return HTTPException(status_code=400, detail=str(e))
+
+
+def etag_de(*modelos: type) -> str:
+    """ETag débil derivada de la versión de las tablas que alimentan una respuesta.
+
+    La versión incluye el estado de cada CSV, así que también cambia con las
+    escrituras de la interfaz cuando corre en otro proceso (PORTALAPP_MODO=procesos).
+    """
+    versiones = '-'.join(
+        format(valor, 'x') for modelo in modelos for valor in data_manager.get_version(modelo)
+    )
+    return f'W/"{data_manager.instance_id}-{versiones}"'
+
+
+def condicional(*modelos: type):
+    """Dependencia para GET condicionales con ETag / If-None-Match.
+
+    Si la ETag del cliente coincide con la versión actual de las tablas se
+    responde `304 Not Modified` sin ejecutar el endpoint (ni leer el disco, solo
+    un `stat` de cada CSV); si no, la respuesta lleva la ETag nueva.
+
+    Args:
+        *modelos (type): Modelos de los que depende la respuesta.
+    """
+
+    def verificar(request: Request, response: Response):
+        # Se calcula antes de leer los datos: si una escritura se intercala, el
+        # cliente recibe datos nuevos con la ETag anterior y solo repite la consulta
+        etag = etag_de(*modelos)
+        recibidas = request.headers.get('if-none-match', '')
+        candidatas = {e.strip().removeprefix('W/') for e in recibidas.split(',')}
+        if '*' in candidatas or etag.removeprefix('W/') in candidatas:
+            raise HTTPException(status_code=304, headers={'ETag': etag})
+        response.headers['ETag'] = etag
+
+    return Depends(verificar)
+
+
+@app.middleware('http')
+async def medir_solicitudes(request: Request, call_next):
+    """Registra la latencia por ruta, método y estado, y las solicitudes en curso.
+
+    En respuestas por bloques (reportes, feeds) se mide hasta enviar los
+    encabezados, no la transferencia completa.
+    """
+    metricas.en_curso.incrementar()
+    inicio = time.perf_counter()
+    estado = 500
+    try:
+        respuesta = await call_next(request)
+        estado = respuesta.status_code
+        return respuesta
+    finally:
+        metricas.en_curso.decrementar()
+        # Se etiqueta con la plantilla de la ruta para no crear una serie por ID
+        ruta = request.scope.get('route')
+        metricas.solicitudes.observar(
+            time.perf_counter() - inicio,
+            metodo=request.method,
+            ruta=getattr(ruta, 'path', 'sin_ruta'),
+            estado=str(estado),
+        )
+
+
+@app.get('/metrics')
+def exponer_metricas():
+    """Métricas de la API y de la capa de datos en el formato de texto de Prometheus."""
+    return Response(metricas.exponer(), media_type=Metricas.CONTENT_TYPE)
+
 
 @app.get('/')
 async def root():
     return {'message': 'Servidor FastAPI está corriendo correctamente.'}
 
 
+# --- Productos ---
+
+
+@app.get('/productos', response_model=Pagina[ProductoSchema], dependencies=[condicional(Producto)])
+@respuesta_json
+@cache.cacheado(Producto)
+def listar_productos(
+    q: Optional[str] = None,
+    disponibles: bool = False,
+    bajo_minimo: bool = False,
+    limite: int = LIMITE_PAGINA,
+    desplazamiento: int = DESPLAZAMIENTO,
+):
+    """Lista productos por ID, o por relevancia si se busca por nombre (`q`)."""
+    if q and not (disponibles or bajo_minimo):
+        # Solo se ordenan las coincidencias hasta el final de la página pedida
+        productos, total = producto_routes.buscar_productos(q, desplazamiento + limite)
+        return paginar(productos, limite, desplazamiento, total)
+    productos = producto_routes.get_productos(q, disponibles, bajo_minimo)
+    return paginar(productos, limite, desplazamiento)
+
+
+@app.get(
+    '/productos/{producto_id}',
+    response_model=ProductoSchema,
+    dependencies=[condicional(Producto)],
+)
+def obtener_producto(producto_id: int):
+    try:
+        return producto_routes.get_producto(producto_id)
+    except ValueError as e:
+        raise no_encontrado(e)
+
+
+@app.post('/productos', response_model=ProductoSchema, status_code=201)
+def crear_producto(producto: ProductoEntrada):
+    try:
+        return producto_routes.create_producto(producto.model_dump())
+    except ValueError as e:
+        raise solicitud_invalida(e)
+
+
+@app.put('/productos/{producto_id}', response_model=ProductoSchema)
+def actualizar_producto(producto_id: int, cambios: ProductoActualizacion):
+    """Actualiza solo los campos enviados del producto."""
+    obtener_producto(producto_id)
+    try:
+        return producto_routes.update_producto(producto_id, cambios.model_dump(exclude_unset=True))
+    except ValueError as e:
+        raise solicitud_invalida(e)
+
+
+@app.delete('/productos/{producto_id}', status_code=204)
+def eliminar_producto(producto_id: int):
+    if not producto_routes.delete_producto(producto_id):
+        raise HTTPException(status_code=404, detail=f'Producto {producto_id} no existe')
+    return Response(status_code=204)
+
+
+@app.get('/imagenes/{nombre}')
+def obtener_imagen(nombre: str, miniatura: bool = False):
+    """Imagen de un producto (`imagen_ruta`) o, con `miniatura`, su versión para tarjetas.
+
+    Las imágenes se nombran por el hash de su contenido, así que se cachean sin
+    caducidad. Si la miniatura aún no existe se responde con la original, sin
+    caché de larga duración, y se encola su generación.
+    """
+    almacen: AlmacenImagenes = data_manager.get_component(AlmacenImagenes)
+    ruta = almacen.ruta(nombre, miniatura)
+    cache_control = Imagenes.CACHE_CONTROL
+    if ruta is None and miniatura:
+        almacen.miniatura(nombre)
+        ruta = almacen.ruta(nombre)
+        cache_control = 'no-cache'
+    if ruta is None:
+        raise HTTPException(status_code=404, detail=f'Imagen {nombre} no existe')
+    return FileResponse(ruta, headers={'Cache-Control': cache_control})
+
+
+async def eventos_productos(secuencia: int):
+    """Genera los cambios de productos posteriores a `secuencia` como Server-Sent Events.
+
+    Cada cambio es un evento `producto` con su secuencia como `id`. Si el
+    cliente quedó fuera del historial se envía un evento `recargar` para que
+    vuelva a leer `/productos`, y sin cambios se envía un comentario cada
+    `Cambios.HEARTBEAT` segundos para mantener la conexión. Las conexiones
+    esperan en el event loop, sin ocupar hilos del threadpool.
+    """
+    instancia = data_manager.instance_id
+    cambios_productos: CambiosProductos = data_manager.get_component(CambiosProductos)
+    while True:
+        pendientes = await cambios_productos.esperar(secuencia, Cambios.HEARTBEAT)
+        if pendientes is None:
+            secuencia = cambios_productos.secuencia
+            yield f'id: {instancia}-{secuencia}\nevent: recargar\ndata: {{}}\n\n'
+        elif not pendientes:
+            yield ': ping\n\n'
+        for cambio in pendientes or []:
+            datos = json.dumps(asdict(cambio), ensure_ascii=False)
+            yield f'id: {instancia}-{cambio.secuencia}\nevent: producto\ndata: {datos}\n\n'
+            secuencia = cambio.secuencia
+
+
+@app.get('/cambios/productos')
+def feed_productos(ultimo_evento: Optional[str] = Header(None, alias='Last-Event-ID')):
+    """Feed en vivo (Server-Sent Events) de los cambios de stock y precio.
+
+    Sin `Last-Event-ID` se envían solo los cambios posteriores a la conexión;
+    al reconectarse, el navegador envía el último ID recibido y el feed
+    continúa desde allí.
+
+    Con PORTALAPP_MODO=procesos (el modo por defecto) la interfaz escribe desde
+    otro proceso y sus ventas no aparecen en el feed; para verlas se despliega
+    con PORTALAPP_MODO=unico o servidor.
+    """
+    # El feed se crea con la primera conexión: solo interesan cambios posteriores
+    cambios_productos: CambiosProductos = data_manager.get_component(CambiosProductos)
+    secuencia = cambios_productos.secuencia
+    if ultimo_evento:
+        instancia, _, numero = ultimo_evento.rpartition('-')
+        # Un ID de otra instancia del servidor fuerza un evento `recargar`
+        valido = instancia == data_manager.instance_id and numero.isdigit()
+        secuencia = int(numero) if valido else -1
+    return StreamingResponse(
+        eventos_productos(secuencia),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache'},
+    )
+
+
+# --- Ventas ---
+
+
+@app.get('/ventas', response_model=PaginaVentasSchema, dependencies=[condicional(Venta)])
+@respuesta_json
+@cache.cacheado(Venta)
+def listar_ventas(
+    limite: int = LIMITE_PAGINA,
+    despues_fecha: Optional[datetime] = None,
+    despues_id: Optional[int] = None,
+    desde: Optional[datetime] = None,
+    hasta: Optional[datetime] = None,
+):
+    """Historial de ventas, de la más reciente a la más antigua.
+
+    Para la página siguiente se envían `siguiente_fecha` y `siguiente_id` de la
+    respuesta como `despues_fecha` y `despues_id`.
+    """
+    if (despues_fecha is None) != (despues_id is None):
+        raise HTTPException(status_code=400, detail='El cursor requiere despues_fecha y despues_id')
+    cursor = (despues_fecha, despues_id) if despues_fecha is not None else None
+    pagina = venta_routes.get_ventas(limite, cursor, desde, hasta)
+    siguiente_fecha, siguiente_id = pagina.siguiente or (None, None)
+    return {
+        'ventas': pagina.ventas,
+        'siguiente_fecha': siguiente_fecha,
+        'siguiente_id': siguiente_id,
+    }
+
+
+@app.get(
+    '/ventas/{venta_id}',
+    response_model=DetalleVentaSchema,
+    dependencies=[condicional(Venta, VentaProducto, Producto)],
+)
+@cache.cacheado(Venta, VentaProducto, Producto)
+def obtener_venta(venta_id: int):
+    try:
+        return venta_routes.get_venta(venta_id)
+    except ValueError as e:
+        raise no_encontrado(e)
+
+
+@app.post('/ventas', response_model=VentaSchema, status_code=201)
+def crear_venta(
+    venta: VentaEntrada,
+    clave: Optional[str] = Header(
+        None, alias=Idempotencia.ENCABEZADO, min_length=1, max_length=Idempotencia.MAX_LONGITUD
+    ),
+):
+    """Registra una venta; con `deudor`, el monto faltante queda como deuda.
+
+    Con el encabezado `Idempotency-Key`, reintentar la misma venta con la misma
+    clave devuelve la venta original sin registrarla de nuevo.
+    """
+    try:
+        return venta_routes.create_venta(
+            {
+                'productos': [item.model_dump() for item in venta.productos],
+                'monto_pagado': venta.monto_pagado,
+                'deudor_info': venta.deudor.model_dump() if venta.deudor else None,
+                'clave_idempotencia': clave,
+            }
+        )
+    except ValueError as e:
+        raise solicitud_invalida(e)
+
+
+# --- Deudores, deudas y abonos ---
+
+
+@app.get(
+    '/deudores',
+    response_model=Pagina[DeudorSchema],
+    dependencies=[condicional(Deudor, Deuda, Abono)],
+)
+@respuesta_json
+@cache.cacheado(Deudor, Deuda, Abono)
+def listar_deudores(
+    q: Optional[str] = None,
+    con_saldo: bool = False,
+    limite: int = LIMITE_PAGINA,
+    desplazamiento: int = DESPLAZAMIENTO,
+):
+    """Lista deudores por ID, o por relevancia si se busca por nombre (`q`)."""
+    return paginar(deudor_routes.get_deudores(q, con_saldo), limite, desplazamiento)
+
+
+@app.get(
+    '/deudores/{deudor_id}',
+    response_model=DeudorDetalleSchema,
+    dependencies=[condicional(Deudor, Deuda, Abono)],
+)
+@cache.cacheado(Deudor, Deuda, Abono)
+def obtener_deudor(deudor_id: int):
+    """Deudor con su saldo (deudas, abonos y último movimiento)."""
+    try:
+        deudor = deudor_routes.get_deudor(deudor_id)
+        saldo = deudor_routes.get_saldo(deudor_id)
+    except ValueError as e:
+        raise no_encontrado(e)
+    return {
+        'id': deudor.id,
+        'nombre': deudor.nombre,
+        'telefono': deudor.telefono,
+        'total_deudas': saldo.total_deudas,
+        'total_abonos': saldo.total_abonos,
+        'saldo': saldo.saldo,
+        'ultimo_movimiento': saldo.ultimo_movimiento,
+    }
+
+
+@app.post('/deudores', response_model=DeudorSchema, status_code=201)
+def crear_deudor(deudor: DeudorEntrada):
+    try:
+        return deudor_routes.create_deudor(deudor.nombre, deudor.telefono)
+    except ValueError as e:
+        raise solicitud_invalida(e)
+
+
+@app.get(
+    '/deudores/{deudor_id}/deudas',
+    response_model=List[DeudaSchema],
+    dependencies=[condicional(Deudor, Deuda, Abono)],
+)
+@respuesta_json
+def listar_deudas(deudor_id: int):
+    """Deudas del deudor, de la más antigua a la más reciente."""
+    obtener_deudor(deudor_id)
+    return deuda_routes.get_deudas(deudor_id)
+
+
+@app.get(
+    '/deudores/{deudor_id}/abonos',
+    response_model=List[AbonoSchema],
+    dependencies=[condicional(Deudor, Deuda, Abono)],
+)
+@respuesta_json
+def listar_abonos(deudor_id: int):
+    """Abonos del deudor, del más antiguo al más reciente."""
+    obtener_deudor(deudor_id)
+    return deuda_routes.get_abonos(deudor_id)
+
+
+@app.post('/deudores/{deudor_id}/abonos', response_model=AbonoSchema, status_code=201)
+def registrar_abono(deudor_id: int, abono: AbonoEntrada):
+    obtener_deudor(deudor_id)
+    try:
+        return deuda_routes.registrar_abono(deudor_id, abono.valor_abono)
+    except ValueError as e:
+        raise solicitud_invalida(e)
+
+
+@app.get('/deudas/antiguedad', response_model=List[AntiguedadSchema])
+# Sin fecha de corte depende de la hora actual: se guarda poco tiempo
+@cache.cacheado(Deudor, Deuda, Abono, ttl=Cache.TTL_CORTO)
+def antiguedad_deudas(fecha_corte: Optional[datetime] = None, incluir_saldados: bool = False):
+    """Saldo pendiente de cada deudor por antigüedad (0-30, 31-60, 61-90 y 90+ días)."""
+    return [
+        AntiguedadSchema.model_validate(antiguedad)
+        for antiguedad in deuda_routes.get_antiguedad(fecha_corte, incluir_saldados)
+    ]
+
+
+@app.get('/deudas/antiguedad/{deudor_id}', response_model=AntiguedadSchema)
+@cache.cacheado(Deudor, Deuda, Abono, ttl=Cache.TTL_CORTO)
+def antiguedad_deudor(deudor_id: int, fecha_corte: Optional[datetime] = None):
+    """Saldo pendiente de un deudor por antigüedad."""
+    # El total es una propiedad: se valida desde el objeto y no desde su asdict
+    return AntiguedadSchema.model_validate(
+        deuda_routes.get_antiguedad_deudor(deudor_id, fecha_corte)
+    )
+
+
+# --- Resúmenes ---
+
+
+@app.get(
+    '/resumenes/diarios',
+    response_model=List[ResumenSchema],
+    dependencies=[condicional(ResumenDiario)],
+)
+@cache.cacheado(ResumenDiario)
+def resumenes_diarios(desde: Optional[date] = None, hasta: Optional[date] = None):
+    """Totales de ventas por día (ventas, unidades, total y ganancia)."""
+    return venta_routes.get_resumenes_diarios(desde, hasta)
+
+
+@app.get(
+    '/resumenes/mensuales',
+    response_model=List[ResumenSchema],
+    dependencies=[condicional(ResumenMensual)],
+)
+@cache.cacheado(ResumenMensual)
+def resumenes_mensuales(desde: Optional[date] = None, hasta: Optional[date] = None):
+    """Totales de ventas por mes (ventas, unidades, total y ganancia)."""
+    return venta_routes.get_resumenes_mensuales(desde, hasta)
+
+
+# --- Analítica ---
+
+
+@functools.lru_cache(maxsize=None)
+def analitica_routes():
+    """Rutas de analítica, creadas con la primera consulta (así NumPy no se importa al arrancar)."""
+    from backend.app.routes.analitica import AnaliticaRoutes
+    from backend.app.services.analitica import AnaliticaService
+
+    return AnaliticaRoutes(servicio(AnaliticaService))
+
+
+@app.get(
+    '/analitica/productos',
+    response_model=List[RendimientoProductoSchema],
+    dependencies=[condicional(VentaProducto, Producto)],
+)
+@respuesta_json
+@cache.cacheado(VentaProducto, Producto)
+def rendimiento_productos(desde: Optional[datetime] = None, hasta: Optional[datetime] = None):
+    """Unidades, ingresos y margen de cada producto vendido, de más a menos unidades."""
+    return analitica_routes().rendimiento_productos(desde, hasta)
+
+
+@app.get(
+    '/analitica/top',
+    response_model=List[RendimientoProductoSchema],
+    dependencies=[condicional(VentaProducto, Producto)],
+)
+@respuesta_json
+@cache.cacheado(VentaProducto, Producto)
+def top_vendidos(
+    limite: int = Query(10, ge=1, le=500),
+    desde: Optional[datetime] = None,
+    hasta: Optional[datetime] = None,
+):
+    """Productos más vendidos por unidades en el rango."""
+    return analitica_routes().top_vendidos(limite, desde, hasta)
+
+
+@app.get('/cache/estadisticas')
+def estadisticas_cache():
+    """Aciertos, fallos, invalidaciones y ocupación de la caché de respuestas."""
+    return cache.estadisticas()
+
+
+# --- Reportes ---
+
+
+@app.get('/sincronizacion/ventas')
+def sincronizar_ventas(despues_id: int = Query(0, ge=0)):
+    """Historial de ventas y sus líneas como JSON Lines, desde un cursor.
+
+    Cada fila lleva el campo `tabla` ('ventas' o 'ventas_productos'). Para
+    continuar una descarga o traer solo lo nuevo, se envía como `despues_id`
+    el ID de la última venta recibida.
+    """
+    return StreamingResponse(
+        reporte_routes.sincronizar_ventas(despues_id),
+        media_type=Reports.MEDIA_TYPES[Reports.JSONL],
+    )
+
+
+@app.get('/reportes/{tipo}')
+def exportar_reporte(
+    tipo: str,
+    formato: str = Reports.CSV,
+    desde: Optional[datetime] = None,
+    hasta: Optional[datetime] = None,
+):
+    """Descarga un reporte (ventas, inventario o deudas) como CSV, JSON Lines o PDF.
+
+    El contenido se envía por bloques a medida que se genera.
+    """
+    try:
+        contenido = reporte_routes.exportar(tipo, formato, desde, hasta)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    nombre = reporte_routes.nombre_archivo(tipo, formato)
+    return StreamingResponse(
+        contenido,
+        media_type=Reports.MEDIA_TYPES[formato],
+        headers={'Content-Disposition': f'attachment; filename="{nombre}"'},
+    )
+
+
+# --- Interfaz ---
+
+if MODO_DESPLIEGUE == Despliegue.UNICO:
+    # Flet y la interfaz solo se importan en este modo: la API arranca sin ellos
+    import flet.fastapi as flet_fastapi
+
+    from frontend.app.portalapp import Portalapp
+
+    # La interfaz usa el mismo CSVManager que la API: comparten índices, caché y
+    # feed de cambios, y cada escritura se ve de inmediato en ambos lados
+    app.mount(Despliegue.RUTA_UI, flet_fastapi.app(Portalapp(data_manager).main))
+
+
 def start_flet():
     """
     Función principal de inicialización de la aplicación.
@@ -21,6 +615,10 @@ def start_flet():
     - Lanza la aplicación utilizando el framework Flet
     - Configura la vista de la aplicación como una aplicación Flet nativa
     """
+    import flet as fl
+
+    from frontend.app.portalapp import Portalapp
+
     portal_app = Portalapp()
     fl.app(
         target=portal_app.main,
@@ -28,8 +626,23 @@ def start_flet():
     )
 
 
-# Arrancar Flet en un proceso independiente
 @app.on_event('startup')
 async def startup_event():
+    if MODO_DESPLIEGUE == Despliegue.UNICO:
+        # Las sub-apps montadas no reciben el ciclo de vida: se arranca aquí
+        await flet_fastapi.app_manager.start()
+        return
+    if MODO_DESPLIEGUE == Despliegue.SERVIDOR:
+        # La interfaz corre en el proceso del servidor de datos (main.py)
+        return
+    import multiprocessing
+
+    # Arrancar Flet en un proceso independiente
     flet_process = multiprocessing.Process(target=start_flet)
     flet_process.start()
+
+
+@app.on_event('shutdown')
+async def shutdown_event():
+    if MODO_DESPLIEGUE == Despliegue.UNICO:
+        await flet_fastapi.app_manager.shutdown()
@@ -0,0 +1,173 @@
+# backend/app/cache/respuestas.py
+import functools
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Set, Tuple
+
+from backend.app.enums.cache import Cache
+
+
+@dataclass
+class EntradaCache:
+    """Respuesta guardada en la caché.
+
+    Attributes:
+        valor (Any): Resultado del endpoint.
+        expira (float): Instante (`time.monotonic`) a partir del cual la entrada vence.
+        generaciones (Tuple[Tuple[int, ...], ...]): Versión de cada modelo al calcular el valor.
+        modelos (Tuple[type, ...]): Modelos de los que depende el valor.
+    """
+
+    valor: Any
+    expira: float
+    generaciones: Tuple[Tuple[int, ...], ...]
+    modelos: Tuple[type, ...]
+
+
+class CacheRespuestas:
+    """Caché LRU de respuestas de la API con TTL por endpoint.
+
+    Cada entrada declara los modelos de los que depende. Las escrituras del
+    CSVManager sobre un modelo eliminan exactamente las entradas que dependen de
+    él, y además cada entrada guarda la versión de sus modelos al calcularse
+    (`data_manager.get_version`, que incluye el estado de cada CSV): si una
+    escritura ocurre mientras se calcula, o la hace otro proceso con su propio
+    manejador (PORTALAPP_MODO=procesos), el valor nunca se sirve.
+
+    Args:
+        data_manager (CSVManager): Manejador de datos cuyas escrituras invalidan la caché.
+        max_entradas (int): Número máximo de entradas antes de descartar la menos usada.
+
+    Note:
+        - Se obtiene con `data_manager.get_component(CacheRespuestas)`.
+        - Los endpoints se envuelven con el decorador `cacheado`.
+    """
+
+    def __init__(self, data_manager, max_entradas: int = Cache.MAX_ENTRADAS):
+        self.data_manager = data_manager
+        self.max_entradas = max_entradas
+        self.__lock = threading.Lock()
+        self.__entradas: 'OrderedDict[Hashable, EntradaCache]' = OrderedDict()
+        self.__por_modelo: Dict[type, Set[Hashable]] = {}
+        self.aciertos = 0
+        self.fallos = 0
+        self.invalidaciones = 0
+        self.expiradas = 0
+        self.descartadas = 0
+        for model_class in list(self.data_manager.file_map):
+            self.data_manager.subscribe(
+                model_class, functools.partial(self.__on_cambio, model_class)
+            )
+
+    def cacheado(self, *modelos: type, ttl: float = Cache.TTL_LARGO):
+        """Decorador que guarda el resultado de un endpoint según sus argumentos.
+
+        Args:
+            *modelos (type): Modelos de los que depende el resultado.
+            ttl (float): Segundos que la respuesta se considera vigente.
+
+        Note:
+            - Las excepciones (p. ej. HTTPException 404) no se guardan.
+        """
+
+        def decorador(funcion: Callable) -> Callable:
+            @functools.wraps(funcion)
+            def envoltura(*args, **kwargs):
+                clave = (funcion.__name__, args, tuple(sorted(kwargs.items())))
+                return self.obtener(clave, modelos, ttl, lambda: funcion(*args, **kwargs))
+
+            return envoltura
+
+        return decorador
+
+    def obtener(
+        self,
+        clave: Hashable,
+        modelos: Tuple[type, ...],
+        ttl: float,
+        calcular: Callable[[], Any],
+    ) -> Any:
+        """Devuelve el valor guardado para la clave o lo calcula y lo guarda.
+
+        Args:
+            clave (Hashable): Identificador de la consulta.
+            modelos (Tuple[type, ...]): Modelos de los que depende el valor.
+            ttl (float): Segundos que el valor se considera vigente.
+            calcular (Callable[[], Any]): Función que calcula el valor si no está guardado.
+
+        Returns:
+            Any: El valor guardado o recién calculado.
+        """
+        generaciones = self.__generaciones(modelos)
+        ahora = time.monotonic()
+        with self.__lock:
+            entrada = self.__entradas.get(clave)
+            if entrada is not None:
+                if entrada.expira > ahora and entrada.generaciones == generaciones:
+                    self.__entradas.move_to_end(clave)
+                    self.aciertos += 1
+                    return entrada.valor
+                self.expiradas += entrada.expira <= ahora
+                self.__quitar(clave)
+            self.fallos += 1
+
+        # El cálculo ocurre fuera del lock para no bloquear otras consultas
+        valor = calcular()
+
+        with self.__lock:
+            if self.__generaciones(modelos) != generaciones:
+                # Hubo una escritura durante el cálculo: el valor puede estar desactualizado
+                return valor
+            self.__quitar(clave)
+            self.__entradas[clave] = EntradaCache(valor, ahora + ttl, generaciones, modelos)
+            for modelo in modelos:
+                self.__por_modelo.setdefault(modelo, set()).add(clave)
+            while len(self.__entradas) > self.max_entradas:
+                self.__quitar(next(iter(self.__entradas)))
+                self.descartadas += 1
+        return valor
+
+    def estadisticas(self) -> Dict[str, Any]:
+        """Contadores de la caché.
+
+        Returns:
+            Dict[str, Any]: Aciertos, fallos, tasa de aciertos, invalidaciones,
+            entradas expiradas, descartadas por tamaño y entradas actuales.
+        """
+        with self.__lock:
+            consultas = self.aciertos + self.fallos
+            return {
+                'aciertos': self.aciertos,
+                'fallos': self.fallos,
+                'tasa_aciertos': self.aciertos / consultas if consultas else 0.0,
+                'invalidaciones': self.invalidaciones,
+                'expiradas': self.expiradas,
+                'descartadas': self.descartadas,
+                'entradas': len(self.__entradas),
+                'max_entradas': self.max_entradas,
+            }
+
+    def limpiar(self):
+        """Descarta todas las entradas (los contadores se conservan)."""
+        with self.__lock:
+            self.__entradas.clear()
+            self.__por_modelo.clear()
+
+    def __generaciones(self, modelos: Tuple[type, ...]) -> Tuple[Tuple[int, ...], ...]:
+        return tuple(self.data_manager.get_version(modelo) for modelo in modelos)
+
+    def __quitar(self, clave: Hashable):
+        entrada = self.__entradas.pop(clave, None)
+        if entrada is not None:
+            for modelo in entrada.modelos:
+                self.__por_modelo.get(modelo, set()).discard(clave)
+
+    def __on_cambio(self, model_class: type, event: str, item: Any):
+        # Se ejecuta bajo el lock del manejador; la caché nunca lo pide teniendo el suyo
+        with self.__lock:
+            claves = self.__por_modelo.pop(model_class, set())
+            for clave in claves:
+                self.__quitar(clave)
+            self.invalidaciones += len(claves)
@@ -0,0 +1,159 @@
+# backend/app/cambios/productos.py
+import asyncio
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Tuple
+
+from backend.app.enums.cambios import Cambios
+from backend.app.enums.manager import DataEvents
+from backend.models.producto import Producto
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CambioProducto:
+    """Cambio de stock o precio de un producto, tal como se publica en el feed.
+
+    Attributes:
+        secuencia (int): Número creciente del cambio; sirve como cursor del feed.
+        evento (str): Evento del manejador (DataEvents.ADD, PUT o DELETE).
+        id (int): Identificador del producto.
+        nombre (str): Nombre del producto.
+        stock (Optional[int]): Stock tras el cambio (None si se eliminó).
+        precio (Optional[int]): Precio tras el cambio (None si se eliminó).
+    """
+
+    secuencia: int
+    evento: str
+    id: int
+    nombre: str
+    stock: Optional[int]
+    precio: Optional[int]
+
+
+class CambiosProductos:
+    """Feed de cambios de stock y precio de los productos.
+
+    Se suscribe al CSVManager y, cada vez que una escritura cambia el stock o
+    el precio de un producto (o lo crea o elimina), registra un
+    `CambioProducto` con un número de secuencia creciente. Los cambios que
+    solo tocan otros campos no se publican.
+
+    Los clientes piden los cambios posteriores a la última secuencia recibida
+    con `desde`, o esperan a que lleguen con la corrutina `esperar` (el
+    endpoint de Server-Sent Events y las sesiones de la interfaz). La
+    notificación del manejador solo agrega el cambio al historial y despierta a
+    quienes esperan, en el event loop de cada uno: ningún cliente se ejecuta en
+    el hilo de la escritura ni con el lock del manejador tomado.
+
+    Args:
+        data_manager (CSVManager): Manejador de datos al que se suscribe el feed.
+        historial (int): Cambios recientes que se conservan para retomar el feed.
+
+    Note:
+        - Se obtiene con `data_manager.get_component(CambiosProductos)`.
+        - Si un cliente pide una secuencia más antigua que el historial, `desde`
+          devuelve None y el cliente debe recargar los productos completos.
+        - Solo publica las escrituras hechas con este manejador. Con
+          PORTALAPP_MODO=procesos la interfaz escribe con su propio CSVManager,
+          en otro proceso: el feed de la API no ve sus ventas (ni la interfaz las
+          de la API). Para compartirlos se usa PORTALAPP_MODO=unico o servidor.
+    """
+
+    def __init__(self, data_manager, historial: int = Cambios.HISTORIAL):
+        self.data_manager = data_manager
+        self.__lock = threading.Lock()
+        self.__secuencia = 0
+        self.__historial: Deque[CambioProducto] = deque(maxlen=historial)
+        # Esperas en curso de `esperar`: el event loop de cada una y su evento
+        self.__esperas: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+        self.__ultimos: Dict[int, Tuple[Optional[int], Optional[int]]] = {
+            producto.id: (producto.stock, producto.precio)
+            for producto in self.data_manager.get_data(Producto)
+        }
+        self.data_manager.subscribe(Producto, self.__on_producto)
+
+    @property
+    def secuencia(self) -> int:
+        """Secuencia del último cambio publicado (0 si aún no hay cambios)."""
+        return self.__secuencia
+
+    def desde(self, secuencia: int) -> Optional[List[CambioProducto]]:
+        """Cambios con secuencia mayor a la indicada, del más antiguo al más nuevo.
+
+        Args:
+            secuencia (int): Última secuencia recibida por el cliente.
+
+        Returns:
+            Optional[List[CambioProducto]]: Cambios pendientes, o None si algunos
+                ya salieron del historial.
+        """
+        with self.__lock:
+            return self.__pendientes(secuencia)
+
+    async def esperar(self, secuencia: int, timeout: float) -> Optional[List[CambioProducto]]:
+        """Como `desde`, pero espera hasta `timeout` segundos si no hay cambios.
+
+        Espera en el event loop que la llama, sin ocupar un hilo: la
+        notificación del manejador lo despierta con `call_soon_threadsafe`.
+
+        Returns:
+            Optional[List[CambioProducto]]: Cambios pendientes (vacío si se agotó
+                el tiempo), o None si algunos ya salieron del historial.
+        """
+        espera = (asyncio.get_running_loop(), asyncio.Event())
+        with self.__lock:
+            pendientes = self.__pendientes(secuencia)
+            if pendientes != []:
+                return pendientes
+            self.__esperas.append(espera)
+        try:
+            await asyncio.wait_for(espera[1].wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self.__lock:
+                self.__esperas.remove(espera)
+        return self.desde(secuencia)
+
+    def __pendientes(self, secuencia: int) -> Optional[List[CambioProducto]]:
+        if secuencia > self.__secuencia:
+            # Secuencia de otra instancia del manejador
+            return None
+        if secuencia == self.__secuencia:
+            return []
+        if not self.__historial or self.__historial[0].secuencia > secuencia + 1:
+            return None
+        # Las secuencias del historial son consecutivas: se ubica por desplazamiento
+        inicio = secuencia + 1 - self.__historial[0].secuencia
+        return [self.__historial[i] for i in range(inicio, len(self.__historial))]
+
+    def __on_producto(self, event: str, producto: Producto):
+        with self.__lock:
+            anterior = self.__ultimos.pop(producto.id, None)
+            if event == DataEvents.DELETE:
+                stock = precio = None
+            else:
+                stock, precio = producto.stock, producto.precio
+                self.__ultimos[producto.id] = (stock, precio)
+                if anterior == (stock, precio):
+                    return
+            self.__secuencia += 1
+            cambio = CambioProducto(
+                secuencia=self.__secuencia,
+                evento=event,
+                id=producto.id,
+                nombre=producto.nombre,
+                stock=stock,
+                precio=precio,
+            )
+            self.__historial.append(cambio)
+            for loop, evento in self.__esperas:
+                try:
+                    loop.call_soon_threadsafe(evento.set)
+                except RuntimeError:
+                    # Event loop ya cerrado (p. ej. una sesión terminada)
+                    logger.debug('Espera de %s en un event loop cerrado', cambio)
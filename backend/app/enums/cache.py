@@ -0,0 +1,6 @@
+class Cache:
+    # Número máximo de respuestas guardadas; al superarlo se descarta la menos usada
+    MAX_ENTRADAS: int = 512
+    # TTL en segundos: consultas que dependen de la hora actual y consultas estables
+    TTL_CORTO: float = 5.0
+    TTL_LARGO: float = 300.0
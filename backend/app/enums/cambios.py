@@ -0,0 +1,5 @@
+class Cambios:
+    # Cambios recientes que se conservan para que un cliente retome el feed
+    HISTORIAL: int = 1000
+    # Segundos sin cambios tras los que se envía un comentario para mantener la conexión
+    HEARTBEAT: float = 15.0
@@ -0,0 +1,22 @@
+import os
+
+
+class Despliegue:
+    # Variable de entorno que elige cómo se despliegan la API y la interfaz
+    VARIABLE: str = 'PORTALAPP_MODO'
+    # Flet en un proceso aparte, con su propio CSVManager (modo por defecto). Los
+    # componentes de cada proceso solo ven sus propias escrituras: p. ej. el feed
+    # /cambios/productos no incluye las ventas hechas desde la interfaz
+    PROCESOS: str = 'procesos'
+    # Flet montado en la app de FastAPI, compartiendo el CSVManager y sus componentes
+    UNICO: str = 'unico'
+    # Un proceso dueño de los datos (con la interfaz) y workers de la API conectados por IPC
+    SERVIDOR: str = 'servidor'
+    # Ruta en la que se monta la interfaz en el modo de proceso único
+    RUTA_UI: str = '/ui'
+    # Variable de entorno con el secreto compartido del servidor de datos y sus workers
+    CLAVE: str = 'PORTALAPP_CLAVE'
+    # Socket Unix (tubería con nombre en Windows) del servidor de datos
+    DIRECCION: str = os.environ.get(
+        'PORTALAPP_SOCKET', r'\\.\pipe\portalapp' if os.name == 'nt' else '/tmp/portalapp.sock'
+    )
@@ -0,0 +1,4 @@
+class Antiguedad:
+    # Límite superior (en días) de cada tramo; lo que los supera cae en el último
+    LIMITES: tuple = (30, 60, 90)
+    TRAMOS: tuple = ('0-30', '31-60', '61-90', '90+')
@@ -0,0 +1,7 @@
+class Idempotencia:
+    ENCABEZADO: str = 'Idempotency-Key'
+    MAX_LONGITUD: int = 255
+    # Claves recordadas; al superarlas se olvidan las más antiguas
+    MAX_CLAVES: int = 10000
+    # Segundos que un reintento espera a que termine la venta original en curso
+    ESPERA: float = 30.0
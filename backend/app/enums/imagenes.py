@@ -0,0 +1,17 @@
+class Imagenes:
+    # Imágenes originales de productos, nombradas por el hash de su contenido
+    DIRECTORIO: str = 'frontend/data/assets/productos'
+    # Miniaturas del tamaño de las tarjetas, con el mismo nombre que su original
+    MINIATURAS: str = 'frontend/data/assets/productos/miniaturas'
+    EXTENSIONES: tuple = ('.jpg', '.jpeg', '.png', '.gif', '.bmp')
+    # Doble del área de imagen de ProductoCard (150 x 100) para pantallas de alta densidad
+    TAMANO_MINIATURA: tuple = (300, 200)
+    CALIDAD_JPEG: int = 85
+    # Segundos que se conserva una imagen sin productos que la usen (p. ej. recién elegida)
+    GRACIA: float = 3600.0
+    # Archivo de bloqueo (en DIRECTORIO) que serializa guardar y borrar entre procesos
+    BLOQUEO: str = '.bloqueo'
+    # Archivo cuya fecha registra la última purga de imágenes huérfanas
+    MARCA_PURGA: str = '.purga'
+    # Las imágenes nombradas por contenido nunca cambian: se cachean un año
+    CACHE_CONTROL: str = 'public, max-age=31536000, immutable'
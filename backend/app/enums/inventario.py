@@ -0,0 +1,3 @@
+class Inventario:
+    # Umbral global de reposición: un producto con stock menor o igual está bajo
+    STOCK_MINIMO: int = 4
@@ -4,3 +4,14 @@ class CSVModels:
     DEUDAS: str = 'deudas.csv'
     DEUDORES: str = 'deudores.csv'
     VENTA_PRODUCTOS = 'venta_productos.csv'
+
+
+class DataEvents:
+    ADD: str = 'add'
+    PUT: str = 'put'
+    DELETE: str = 'delete'
+
+
+class IOEvents:
+    READ: str = 'read'
+    WRITE: str = 'write'
@@ -0,0 +1,6 @@
+class Metricas:
+    # Tipo de contenido del formato de texto de Prometheus
+    CONTENT_TYPE: str = 'text/plain; version=0.0.4; charset=utf-8'
+    # Límites (en segundos) de los histogramas de latencia
+    BUCKETS_HTTP: tuple = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+    BUCKETS_DATOS: tuple = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
@@ -1,2 +1,19 @@
 class Reports:
-    ENCODING: str = 'utf-8'
\ No newline at end of file
+    ENCODING: str = 'utf-8'
+    CHUNK_SIZE: int = 500  # Filas por bloque al exportar
+
+    # Tipos de reporte
+    VENTAS: str = 'ventas'
+    INVENTARIO: str = 'inventario'
+    DEUDAS: str = 'deudas'
+
+    # Formatos de exportación
+    CSV: str = 'csv'
+    JSONL: str = 'jsonl'
+    PDF: str = 'pdf'
+
+    MEDIA_TYPES: dict[str, str] = {
+        CSV: 'text/csv',
+        JSONL: 'application/x-ndjson',
+        PDF: 'application/pdf',
+    }
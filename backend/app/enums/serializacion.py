@@ -0,0 +1,8 @@
+class Serializacion:
+    MEDIA_TYPE: str = 'application/json'
+    # Respuestas desde este tamaño (bytes) se comprimen si el cliente acepta gzip
+    GZIP_MINIMO: int = 1024
+    # Nivel de gzip: los niveles altos cuestan mucho más y apenas reducen el JSON
+    GZIP_NIVEL: int = 5
+    # Cuerpos comprimidos que se recuerdan (respuestas repetidas desde la caché)
+    GZIP_MEMORIA: int = 64
@@ -0,0 +1,103 @@
+# backend/app/metricas/portalapp.py
+from backend.app.cache.respuestas import CacheRespuestas
+from backend.app.enums.manager import DataEvents
+from backend.app.enums.metricas import Metricas
+from backend.app.metricas.prometheus import Contador, Histograma, Medidor, RegistroMetricas
+from backend.models.venta import Venta
+
+
+class MetricasPortalapp:
+    """Métricas de la API y de la capa de datos en el formato de Prometheus.
+
+    Reúne:
+    - Latencia por ruta, método y estado, y solicitudes en curso (las registra
+      el middleware de `api.py`).
+    - Ventas registradas y monto vendido, a partir de los eventos de `Venta`.
+    - Duración de cada lectura y escritura de los CSV, por tabla.
+    - Aciertos, fallos, invalidaciones y tasa de aciertos de la caché de
+      respuestas, leídos al exponer.
+
+    Args:
+        data_manager (CSVManager): Manejador de datos que se observa.
+
+    Note:
+        - Se obtiene con `data_manager.get_component(MetricasPortalapp)`.
+        - Con servidor de datos, los workers no leen CSV: las duraciones de
+          lectura y escritura solo se miden en el proceso dueño de los datos.
+    """
+
+    def __init__(self, data_manager):
+        self.data_manager = data_manager
+        self.registro = RegistroMetricas()
+        self.solicitudes = self.registro.registrar(
+            Histograma(
+                'portalapp_http_duracion_segundos',
+                'Duración de las solicitudes HTTP hasta enviar los encabezados.',
+                Metricas.BUCKETS_HTTP,
+            )
+        )
+        self.en_curso = self.registro.registrar(
+            Medidor('portalapp_http_solicitudes_en_curso', 'Solicitudes HTTP en proceso.')
+        )
+        self.ventas = self.registro.registrar(
+            Contador('portalapp_ventas_total', 'Ventas registradas.')
+        )
+        self.monto_ventas = self.registro.registrar(
+            Contador('portalapp_ventas_monto_total', 'Suma del total de las ventas registradas.')
+        )
+        self.datos = self.registro.registrar(
+            Histograma(
+                'portalapp_csv_duracion_segundos',
+                'Duración de las lecturas y escrituras de los CSV.',
+                Metricas.BUCKETS_DATOS,
+            )
+        )
+
+        cache: CacheRespuestas = data_manager.get_component(CacheRespuestas)
+        for nombre, ayuda, funcion in (
+            ('aciertos_total', 'Consultas servidas desde la caché.', lambda: cache.aciertos),
+            ('fallos_total', 'Consultas calculadas por no estar en caché.', lambda: cache.fallos),
+            (
+                'invalidaciones_total',
+                'Entradas invalidadas por escrituras.',
+                lambda: cache.invalidaciones,
+            ),
+            (
+                'descartadas_total',
+                'Entradas descartadas por tamaño.',
+                lambda: cache.descartadas,
+            ),
+        ):
+            self.registro.registrar(Contador(f'portalapp_cache_{nombre}', ayuda, funcion))
+        self.registro.registrar(
+            Medidor(
+                'portalapp_cache_tasa_aciertos',
+                'Fracción de consultas servidas desde la caché.',
+                lambda: cache.estadisticas()['tasa_aciertos'],
+            )
+        )
+        self.registro.registrar(
+            Medidor(
+                'portalapp_cache_entradas',
+                'Respuestas guardadas en la caché.',
+                lambda: cache.estadisticas()['entradas'],
+            )
+        )
+
+        self.data_manager.subscribe(Venta, self.__on_venta)
+        # El manejador remoto de los workers no expone tiempos de lectura y escritura
+        observe_io = getattr(self.data_manager, 'observe_io', None)
+        if observe_io is not None:
+            observe_io(self.__on_io)
+
+    def exponer(self) -> str:
+        """Todas las métricas en el formato de texto de Prometheus."""
+        return self.registro.exponer()
+
+    def __on_venta(self, event: str, venta: Venta):
+        if event == DataEvents.ADD:
+            self.ventas.incrementar()
+            self.monto_ventas.incrementar(venta.total or 0)
+
+    def __on_io(self, operation: str, model_class: type, seconds: float):
+        self.datos.observar(seconds, operacion=operation, tabla=model_class.__name__)
@@ -0,0 +1,148 @@
+# backend/app/metricas/prometheus.py
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+Etiquetas = Tuple[Tuple[str, str], ...]
+
+
+def escapar(valor: str) -> str:
+    """Escapa el valor de una etiqueta (barras, comillas y saltos de línea)."""
+    return valor.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def formatear_etiquetas(etiquetas: Etiquetas, extra: Etiquetas = ()) -> str:
+    """Etiquetas en el formato de texto de Prometheus, p. ej. '{ruta="/ventas"}'."""
+    pares = etiquetas + extra
+    if not pares:
+        return ''
+    return '{' + ','.join(f'{nombre}="{escapar(valor)}"' for nombre, valor in pares) + '}'
+
+
+def formatear_numero(valor: float) -> str:
+    """Número en el formato de Prometheus ('+Inf' para infinito)."""
+    if valor == float('inf'):
+        return '+Inf'
+    return repr(valor)
+
+
+class Metrica:
+    """Base de las métricas: nombre, ayuda, tipo y valores por combinación de etiquetas.
+
+    Args:
+        nombre (str): Nombre de la métrica (p. ej. 'portalapp_ventas_total').
+        ayuda (str): Descripción que se publica en la línea `# HELP`.
+        funcion (Optional[Callable[[], float]]): Si se indica, el valor (sin
+            etiquetas) se obtiene al exponer en lugar de acumularse.
+    """
+
+    TIPO: str = 'untyped'
+
+    def __init__(self, nombre: str, ayuda: str, funcion: Optional[Callable[[], float]] = None):
+        self.nombre = nombre
+        self.ayuda = ayuda
+        self.funcion = funcion
+        self._lock = threading.Lock()
+        self._valores: Dict[Etiquetas, float] = {}
+
+    @staticmethod
+    def _clave(etiquetas: Dict[str, str]) -> Etiquetas:
+        return tuple(sorted(etiquetas.items()))
+
+    def _muestras(self) -> List[str]:
+        if self.funcion is not None:
+            return [f'{self.nombre} {formatear_numero(self.funcion())}']
+        with self._lock:
+            return [
+                f'{self.nombre}{formatear_etiquetas(etiquetas)} {formatear_numero(valor)}'
+                for etiquetas, valor in self._valores.items()
+            ]
+
+    def exponer(self) -> str:
+        """Bloque de la métrica en el formato de texto de Prometheus."""
+        lineas = [f'# HELP {self.nombre} {self.ayuda}', f'# TYPE {self.nombre} {self.TIPO}']
+        return '\n'.join(lineas + self._muestras())
+
+
+class Contador(Metrica):
+    """Valor que solo crece (solicitudes, ventas, aciertos de caché)."""
+
+    TIPO = 'counter'
+
+    def incrementar(self, cantidad: float = 1, **etiquetas: str):
+        clave = self._clave(etiquetas)
+        with self._lock:
+            self._valores[clave] = self._valores.get(clave, 0) + cantidad
+
+
+class Medidor(Metrica):
+    """Valor que sube y baja (solicitudes en curso, entradas de la caché)."""
+
+    TIPO = 'gauge'
+
+    def incrementar(self, cantidad: float = 1, **etiquetas: str):
+        clave = self._clave(etiquetas)
+        with self._lock:
+            self._valores[clave] = self._valores.get(clave, 0) + cantidad
+
+    def decrementar(self, cantidad: float = 1, **etiquetas: str):
+        self.incrementar(-cantidad, **etiquetas)
+
+
+class Histograma(Metrica):
+    """Distribución de duraciones en intervalos acumulados (`le`).
+
+    Args:
+        nombre (str): Nombre de la métrica.
+        ayuda (str): Descripción de la métrica.
+        limites (Sequence[float]): Límites superiores de los intervalos, en orden.
+    """
+
+    TIPO = 'histogram'
+
+    def __init__(self, nombre: str, ayuda: str, limites: Sequence[float]):
+        super().__init__(nombre, ayuda)
+        self.limites = tuple(limites)
+        # Por etiquetas: conteo por intervalo (sin acumular), suma y total
+        self._series: Dict[Etiquetas, Tuple[List[int], List[float]]] = {}
+
+    def observar(self, valor: float, **etiquetas: str):
+        clave = self._clave(etiquetas)
+        posicion = bisect_left(self.limites, valor)
+        with self._lock:
+            serie = self._series.get(clave)
+            if serie is None:
+                serie = self._series[clave] = ([0] * (len(self.limites) + 1), [0.0])
+            serie[0][posicion] += 1
+            serie[1][0] += valor
+
+    def _muestras(self) -> List[str]:
+        lineas = []
+        with self._lock:
+            series = [
+                (clave, list(conteos), suma[0]) for clave, (conteos, suma) in self._series.items()
+            ]
+        for etiquetas, conteos, suma in series:
+            acumulado = 0
+            for limite, conteo in zip(self.limites + (float('inf'),), conteos):
+                acumulado += conteo
+                le = formatear_etiquetas(etiquetas, (('le', formatear_numero(limite)),))
+                lineas.append(f'{self.nombre}_bucket{le} {acumulado}')
+            lineas.append(f'{self.nombre}_sum{formatear_etiquetas(etiquetas)} {suma!r}')
+            lineas.append(f'{self.nombre}_count{formatear_etiquetas(etiquetas)} {acumulado}')
+        return lineas
+
+
+class RegistroMetricas:
+    """Conjunto de métricas que se exponen juntas en `/metrics`."""
+
+    def __init__(self):
+        self.__metricas: List[Metrica] = []
+
+    def registrar(self, metrica: Metrica) -> Metrica:
+        self.__metricas.append(metrica)
+        return metrica
+
+    def exponer(self) -> str:
+        """Todas las métricas en el formato de texto de Prometheus."""
+        return '\n'.join(metrica.exponer() for metrica in self.__metricas) + '\n'
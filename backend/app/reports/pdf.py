@@ -0,0 +1,99 @@
+# backend/app/reports/pdf.py
+from typing import List
+
+
+class PDFResumen:
+    """Generador mínimo de PDF de texto (una columna, fuente Helvetica).
+
+    Suficiente para resúmenes de reportes sin depender de librerías externas.
+    Las líneas que no caben en una página continúan en páginas nuevas.
+
+    Args:
+        titulo (str): Título que encabeza la primera página.
+    """
+
+    LINEAS_POR_PAGINA: int = 48
+    ALTO_PAGINA: int = 842  # A4 en puntos
+    ANCHO_PAGINA: int = 595
+    MARGEN: int = 50
+    INTERLINEADO: int = 15
+
+    def __init__(self, titulo: str):
+        self.titulo = titulo
+        self.__lineas: List[str] = []
+
+    def agregar_linea(self, texto: str = ''):
+        """Agrega una línea de texto al documento."""
+        self.__lineas.append(texto)
+
+    def render(self) -> bytes:
+        """Genera el documento PDF completo.
+
+        Returns:
+            bytes: Contenido del archivo PDF.
+        """
+        paginas = [
+            self.__lineas[i : i + self.LINEAS_POR_PAGINA]
+            for i in range(0, len(self.__lineas), self.LINEAS_POR_PAGINA)
+        ] or [[]]
+
+        # Objetos fijos: 1 catálogo, 2 árbol de páginas, 3 fuente
+        objetos: List[bytes] = [
+            b'',
+            b'',
+            b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>',
+        ]
+        ids_paginas = []
+        for numero, lineas in enumerate(paginas):
+            contenido = self.__contenido(lineas, con_titulo=numero == 0)
+            objetos.append(
+                b'<< /Length %d >>\nstream\n' % len(contenido) + contenido + b'\nendstream'
+            )
+            id_contenido = len(objetos)
+            objetos.append(
+                b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] '
+                b'/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>'
+                % (self.ANCHO_PAGINA, self.ALTO_PAGINA, id_contenido)
+            )
+            ids_paginas.append(len(objetos))
+        objetos[0] = b'<< /Type /Catalog /Pages 2 0 R >>'
+        objetos[1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (
+            b' '.join(b'%d 0 R' % i for i in ids_paginas),
+            len(ids_paginas),
+        )
+
+        salida = bytearray(b'%PDF-1.4\n')
+        posiciones = []
+        for numero, objeto in enumerate(objetos, start=1):
+            posiciones.append(len(salida))
+            salida += b'%d 0 obj\n' % numero + objeto + b'\nendobj\n'
+        inicio_xref = len(salida)
+        salida += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objetos) + 1)
+        salida += b''.join(b'%010d 00000 n \n' % posicion for posicion in posiciones)
+        salida += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (
+            len(objetos) + 1,
+            inicio_xref,
+        )
+        return bytes(salida)
+
+    def __contenido(self, lineas: List[str], con_titulo: bool) -> bytes:
+        y = self.ALTO_PAGINA - self.MARGEN
+        partes = [b'BT']
+        if con_titulo:
+            partes.append(
+                b'/F1 16 Tf 1 0 0 1 %d %d Tm (%s) Tj'
+                % (self.MARGEN, y, self.__escapar(self.titulo))
+            )
+            y -= 2 * self.INTERLINEADO
+        partes.append(b'/F1 11 Tf')
+        for linea in lineas:
+            partes.append(b'1 0 0 1 %d %d Tm (%s) Tj' % (self.MARGEN, y, self.__escapar(linea)))
+            y -= self.INTERLINEADO
+        partes.append(b'ET')
+        return b'\n'.join(partes)
+
+    @staticmethod
+    def __escapar(texto: str) -> bytes:
+        # La fuente usa WinAnsi (~Latin-1); los caracteres fuera de rango se reemplazan
+        codificado = texto.encode('latin-1', errors='replace')
+        return codificado.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
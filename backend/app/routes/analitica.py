@@ -0,0 +1,24 @@
+# backend/app/routes/analitica.py
+from datetime import datetime
+from typing import List, Optional
+from backend.app.services.analitica import AnaliticaService, RendimientoProducto
+
+
+class AnaliticaRoutes:
+    def __init__(self, service: AnaliticaService):
+        self.service = service
+
+    def rendimiento_productos(
+        self, desde: Optional[datetime] = None, hasta: Optional[datetime] = None
+    ) -> List[RendimientoProducto]:
+        """Endpoint para obtener unidades, ingresos y margen de cada producto vendido"""
+        return self.service.rendimiento_productos(desde, hasta)
+
+    def top_vendidos(
+        self,
+        limite: int = 10,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+    ) -> List[RendimientoProducto]:
+        """Endpoint para obtener los productos más vendidos"""
+        return self.service.top_vendidos(limite, desde, hasta)
@@ -0,0 +1,35 @@
+# backend/app/routes/deudas.py
+from datetime import datetime
+from typing import List, Optional
+from backend.models.abono import Abono
+from backend.models.deuda import Deuda
+from backend.app.services.deudas import AntiguedadDeudor, DeudaService
+
+
+class DeudaRoutes:
+    def __init__(self, service: DeudaService):
+        self.service = service
+
+    def get_antiguedad(
+        self, fecha_corte: Optional[datetime] = None, incluir_saldados: bool = False
+    ) -> List[AntiguedadDeudor]:
+        """Endpoint para obtener el reporte de antigüedad de saldos"""
+        return self.service.get_antiguedad(fecha_corte, incluir_saldados)
+
+    def get_antiguedad_deudor(
+        self, deudor_id: int, fecha_corte: Optional[datetime] = None
+    ) -> AntiguedadDeudor:
+        """Endpoint para obtener la antigüedad del saldo de un deudor"""
+        return self.service.get_antiguedad_deudor(deudor_id, fecha_corte)
+
+    def get_deudas(self, deudor_id: int) -> List[Deuda]:
+        """Endpoint para obtener las deudas de un deudor"""
+        return self.service.get_deudas(deudor_id)
+
+    def get_abonos(self, deudor_id: int) -> List[Abono]:
+        """Endpoint para obtener los abonos de un deudor"""
+        return self.service.get_abonos(deudor_id)
+
+    def registrar_abono(self, deudor_id: int, valor_abono: int) -> Abono:
+        """Endpoint para registrar un abono de un deudor"""
+        return self.service.registrar_abono(deudor_id, valor_abono)
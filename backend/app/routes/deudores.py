@@ -0,0 +1,26 @@
+# backend/app/routes/deudores.py
+from typing import List, Optional
+from backend.data.ledgers.saldos import SaldoDeudor
+from backend.models.deudor import Deudor
+from backend.app.services.deudores import DeudorService
+
+
+class DeudorRoutes:
+    def __init__(self, service: DeudorService):
+        self.service = service
+
+    def get_deudores(self, termino: Optional[str] = None, con_saldo: bool = False) -> List[Deudor]:
+        """Endpoint para buscar y filtrar deudores"""
+        return self.service.get_deudores(termino, con_saldo)
+
+    def get_deudor(self, deudor_id: int) -> Deudor:
+        """Endpoint para obtener un deudor específico"""
+        return self.service.get_deudor(deudor_id)
+
+    def get_saldo(self, deudor_id: int) -> SaldoDeudor:
+        """Endpoint para obtener el saldo de un deudor"""
+        return self.service.get_saldo(deudor_id)
+
+    def create_deudor(self, nombre: str, telefono: Optional[str] = None) -> Deudor:
+        """Endpoint para registrar un deudor"""
+        return self.service.create_deudor(nombre, telefono)
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 from backend.models.producto import Producto
 from backend.app.services.productos import ProductoService
 
@@ -6,8 +6,36 @@ class ProductoRoutes:
     def __init__(self, service: ProductoService):
         self.service = service
 
+    def get_productos(
+        self,
+        termino: Optional[str] = None,
+        disponibles: bool = False,
+        bajo_minimo: bool = False,
+    ) -> List[Producto]:
+        """Endpoint para buscar y filtrar productos"""
+        return self.service.get_productos(termino, disponibles, bajo_minimo)
+
+    def buscar_productos(self, termino: str, limite: int) -> Tuple[List[Producto], int]:
+        """Endpoint para buscar productos por relevancia, con el total de coincidencias"""
+        return self.service.buscar_productos(termino, limite)
+
     def get_productos_disponibles(self) -> List[Producto]:
         return self.service.get_productos_disponibles()
 
     def get_producto(self, producto_id: int) -> Producto:
         return self.service.get_producto(producto_id)
+
+    def get_productos_bajo_minimo(self) -> List[Producto]:
+        return self.service.get_productos_bajo_minimo()
+
+    def create_producto(self, data: Dict[str, Any]) -> Producto:
+        """Endpoint para crear un producto"""
+        return self.service.create_producto(data)
+
+    def update_producto(self, producto_id: int, data: Dict[str, Any]) -> Producto:
+        """Endpoint para actualizar un producto"""
+        return self.service.update_producto(producto_id, data)
+
+    def delete_producto(self, producto_id: int) -> bool:
+        """Endpoint para eliminar un producto"""
+        return self.service.delete_producto(producto_id)
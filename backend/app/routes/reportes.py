@@ -0,0 +1,27 @@
+# backend/app/routes/reportes.py
+from datetime import datetime
+from typing import Iterator, Optional
+from backend.app.services.reportes import ReporteService
+
+
+class ReporteRoutes:
+    def __init__(self, service: ReporteService):
+        self.service = service
+
+    def exportar(
+        self,
+        tipo: str,
+        formato: str,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+    ) -> Iterator[bytes]:
+        """Endpoint para exportar un reporte como flujo de bloques"""
+        return self.service.exportar(tipo, formato, desde, hasta)
+
+    def sincronizar_ventas(self, despues_id: int = 0) -> Iterator[bytes]:
+        """Endpoint para descargar las ventas posteriores a un cursor como JSON Lines"""
+        return self.service.sincronizar_ventas(despues_id)
+
+    def nombre_archivo(self, tipo: str, formato: str) -> str:
+        """Nombre sugerido para el archivo exportado"""
+        return self.service.nombre_archivo(tipo, formato)
@@ -1,7 +1,9 @@
 # backend/app/routes/ventas.py
-from typing import List, Dict, Any
+from datetime import date, datetime
+from typing import Dict, Any, List, Optional, Tuple
+from backend.models.resumen import ResumenDiario, ResumenMensual
 from backend.models.venta import Venta
-from backend.app.services.ventas import VentaService
+from backend.app.services.ventas import VentaService, DetalleVenta, PaginaVentas
 
 
 class VentaRoutes:
@@ -14,16 +16,35 @@ class VentaRoutes:
             productos=data['productos'],
             monto_pagado=data['monto_pagado'],
             deudor_info=data.get('deudor_info'),  # Añadimos esto para ventas a crédito
+            clave_idempotencia=data.get('clave_idempotencia'),
         )
 
-    def get_ventas(self) -> List[Venta]:
-        """Endpoint para obtener todas las ventas"""
-        return self.service.get_ventas()
+    def get_ventas(
+        self,
+        limite: int = 50,
+        despues_de: Optional[Tuple[datetime, int]] = None,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+    ) -> PaginaVentas:
+        """Endpoint para obtener el historial de ventas paginado"""
+        return self.service.get_ventas(limite, despues_de, desde, hasta)
 
-    def get_venta(self, venta_id: int) -> Venta:
+    def get_resumenes_diarios(
+        self, desde: Optional[date] = None, hasta: Optional[date] = None
+    ) -> List[ResumenDiario]:
+        """Endpoint para obtener los totales de ventas por día"""
+        return self.service.get_resumenes_diarios(desde, hasta)
+
+    def get_resumenes_mensuales(
+        self, desde: Optional[date] = None, hasta: Optional[date] = None
+    ) -> List[ResumenMensual]:
+        """Endpoint para obtener los totales de ventas por mes"""
+        return self.service.get_resumenes_mensuales(desde, hasta)
+
+    def get_venta(self, venta_id: int) -> DetalleVenta:
         """Endpoint para obtener una venta específica"""
         return self.service.get_venta(venta_id)
 
     def update_venta(self, venta_id: int, data: Dict[str, Any]) -> Venta:
         """Endpoint para actualizar una venta"""
-        return self.service.update_venta(venta_id, data)
\ No newline at end of file
+        return self.service.update_venta(venta_id, data)
@@ -0,0 +1,42 @@
+# backend/app/schemas/comunes.py
+from typing import Generic, List, Optional, Sequence, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar('T')
+
+
+class Pagina(BaseModel, Generic[T]):
+    """Página de resultados paginados por desplazamiento.
+
+    Attributes:
+        items (List[T]): Elementos de la página.
+        total (int): Número total de elementos que cumplen los filtros.
+        limite (int): Tamaño máximo de la página.
+        desplazamiento (int): Elementos omitidos antes de la página.
+    """
+
+    items: List[T]
+    total: int
+    limite: int
+    desplazamiento: int
+
+
+def paginar(items: Sequence, limite: int, desplazamiento: int, total: Optional[int] = None) -> dict:
+    """Recorta una lista ya filtrada y ordenada en una página.
+
+    Args:
+        items (Sequence): Elementos ordenados, al menos hasta el final de la página.
+        limite (int): Tamaño máximo de la página.
+        desplazamiento (int): Elementos omitidos antes de la página.
+        total (Optional[int]): Total de elementos, si `items` no los incluye todos.
+
+    Returns:
+        dict: Campos de `Pagina`, listos para validarse como modelo de respuesta.
+    """
+    return {
+        'items': list(items[desplazamiento : desplazamiento + limite]),
+        'total': len(items) if total is None else total,
+        'limite': limite,
+        'desplazamiento': desplazamiento,
+    }
@@ -0,0 +1,72 @@
+# backend/app/schemas/deudores.py
+from datetime import datetime
+from typing import Dict, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class DeudorSchema(BaseModel):
+    """Deudor registrado."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    nombre: str
+    telefono: Optional[str] = None
+
+
+class DeudorDetalleSchema(DeudorSchema):
+    """Deudor con su saldo materializado."""
+
+    total_deudas: int
+    total_abonos: int
+    saldo: int
+    ultimo_movimiento: Optional[datetime] = None
+
+
+class DeudorEntrada(BaseModel):
+    """Datos para registrar un deudor."""
+
+    nombre: str
+    telefono: Optional[str] = None
+
+
+class DeudaSchema(BaseModel):
+    """Deuda generada por una venta a crédito."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    id_venta: int
+    id_deudor: int
+    valor_deuda: int
+    creacion_deuda: datetime
+
+
+class AbonoSchema(BaseModel):
+    """Abono (pago) de un deudor."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    id_deudor: int
+    valor_abono: int
+    fecha_abono: datetime
+
+
+class AbonoEntrada(BaseModel):
+    """Datos para registrar un abono."""
+
+    valor_abono: int = Field(gt=0)
+
+
+class AntiguedadSchema(BaseModel):
+    """Saldo pendiente de un deudor por tramo de antigüedad."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id_deudor: int
+    nombre: Optional[str]
+    telefono: Optional[str]
+    tramos: Dict[str, int]
+    total: int
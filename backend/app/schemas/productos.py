@@ -0,0 +1,57 @@
+# backend/app/schemas/productos.py
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+
+class ProductoSchema(BaseModel):
+    """Producto del inventario tal como lo expone la API."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    nombre: str
+    precio: int
+    stock: int
+    coste: int
+    imagen_ruta: Optional[str] = None
+    stock_minimo: Optional[int] = None
+
+
+class ProductoEntrada(BaseModel):
+    """Datos para crear un producto."""
+
+    nombre: str = Field(min_length=1)
+    precio: int = Field(gt=0)
+    stock: int = Field(ge=0)
+    coste: int = Field(ge=0)
+    imagen_ruta: Optional[str] = None
+    stock_minimo: Optional[int] = Field(default=None, ge=0)
+
+    @model_validator(mode='after')
+    def validar_coste(self):
+        if self.coste >= self.precio:
+            raise ValueError('Coste debe ser un número entero entre 0 y el precio')
+        return self
+
+
+class ProductoActualizacion(BaseModel):
+    """Campos a modificar de un producto; los omitidos no cambian.
+
+    Solo `imagen_ruta` admite null (quita la imagen): en los demás campos un null
+    explícito se rechaza en lugar de guardarse en el CSV.
+    """
+
+    nombre: Optional[str] = Field(default=None, min_length=1)
+    precio: Optional[int] = Field(default=None, gt=0)
+    stock: Optional[int] = Field(default=None, ge=0)
+    coste: Optional[int] = Field(default=None, ge=0)
+    imagen_ruta: Optional[str] = None
+    stock_minimo: Optional[int] = Field(default=None, ge=0)
+
+    @field_validator('nombre', 'precio', 'stock', 'coste', 'stock_minimo', mode='before')
+    @classmethod
+    def rechazar_nulo(cls, valor):
+        if valor is None:
+            raise ValueError('No puede ser nulo; omita el campo para no modificarlo')
+        return valor
@@ -0,0 +1,96 @@
+# backend/app/schemas/ventas.py
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class VentaSchema(BaseModel):
+    """Venta registrada."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    fecha: datetime
+    total: int
+    ganancia: int
+
+
+class LineaVentaSchema(BaseModel):
+    """Producto incluido en una venta."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id_producto: int
+    nombre: Optional[str]
+    cantidad: int
+
+
+class DetalleVentaSchema(BaseModel):
+    """Venta con sus líneas de productos."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    venta: VentaSchema
+    lineas: List[LineaVentaSchema]
+
+
+class PaginaVentasSchema(BaseModel):
+    """Página del historial de ventas, de la más reciente a la más antigua.
+
+    Attributes:
+        ventas (List[VentaSchema]): Ventas de la página.
+        siguiente_fecha (Optional[datetime]): Cursor (`despues_fecha`) de la página siguiente.
+        siguiente_id (Optional[int]): Cursor (`despues_id`) de la página siguiente.
+    """
+
+    ventas: List[VentaSchema]
+    siguiente_fecha: Optional[datetime] = None
+    siguiente_id: Optional[int] = None
+
+
+class ResumenSchema(BaseModel):
+    """Totales de ventas de un periodo ('YYYY-MM-DD' o 'YYYY-MM')."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    periodo: str
+    ventas: int
+    unidades: int
+    total: int
+    ganancia: int
+
+
+class RendimientoProductoSchema(BaseModel):
+    """Unidades, ingresos y margen de un producto en un rango de fechas."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id_producto: int
+    nombre: Optional[str]
+    unidades: int
+    ingresos: int
+    margen: int
+
+
+class ItemVentaEntrada(BaseModel):
+    """Producto y cantidad a vender."""
+
+    id_producto: int
+    cantidad: int = Field(gt=0)
+
+
+class DeudorVentaEntrada(BaseModel):
+    """Deudor de una venta a crédito: existente (por `id`) o nuevo (por nombre)."""
+
+    id: Optional[int] = None
+    nombre: Optional[str] = None
+    telefono: Optional[str] = None
+
+
+class VentaEntrada(BaseModel):
+    """Datos para registrar una venta; con `deudor` el faltante queda como deuda."""
+
+    productos: List[ItemVentaEntrada] = Field(min_length=1)
+    monto_pagado: float = Field(default=0, ge=0)
+    deudor: Optional[DeudorVentaEntrada] = None
@@ -0,0 +1,124 @@
+# backend/app/serializacion/rapida.py
+import dataclasses
+import functools
+import gzip
+import inspect
+import json
+from datetime import date, datetime
+from typing import Any, Callable, Dict, get_args
+
+from fastapi import Request, Response
+
+from backend.app.enums.serializacion import Serializacion
+
+try:
+    import orjson
+except ImportError:  # Opcional: sin orjson se usa json de la biblioteca estándar
+    orjson = None
+
+__serializadores: Dict[type, Callable[[Any], Dict[str, Any]]] = {}
+
+
+def serializador_de(model_class: type) -> Callable[[Any], Dict[str, Any]]:
+    """Función que convierte una instancia de un dataclass en un diccionario.
+
+    Se genera una sola vez por clase, con un acceso directo por campo: no
+    recorre el objeto como `asdict` (que además copia los valores) ni como
+    `jsonable_encoder`. Las fechas se escriben en ISO 8601, el formato que
+    `CSVManager` lee con `datetime.fromisoformat`.
+
+    Args:
+        model_class (type): Clase dataclass a serializar.
+
+    Returns:
+        Callable[[Any], Dict[str, Any]]: Serializador de la clase.
+    """
+    serializador = __serializadores.get(model_class)
+    if serializador is None:
+        valores = []
+        for campo in dataclasses.fields(model_class):
+            tipos = (campo.type, *get_args(campo.type))
+            es_fecha = any(tipo in (datetime, date) for tipo in tipos)
+            valor = f'_iso(o.{campo.name})' if es_fecha else f'o.{campo.name}'
+            valores.append(f'{campo.name!r}: {valor}')
+        codigo = f'def serializar(o):\n    return {{{", ".join(valores)}}}\n'
+        espacio = {'_iso': _iso}
+        exec(compile(codigo, f'<serializador {model_class.__name__}>', 'exec'), espacio)
+        serializador = __serializadores[model_class] = espacio['serializar']
+    return serializador
+
+
+def _iso(valor: Any) -> Any:
+    return valor.isoformat() if valor is not None else None
+
+
+def _por_defecto(valor: Any) -> Any:
+    if dataclasses.is_dataclass(valor) and not isinstance(valor, type):
+        return serializador_de(type(valor))(valor)
+    if isinstance(valor, (datetime, date)):
+        return valor.isoformat()
+    raise TypeError(f'Tipo no serializable: {type(valor).__name__}')
+
+
+def a_json(contenido: Any) -> bytes:
+    """Serializa listas, diccionarios y dataclasses (anidados) a JSON en bytes."""
+    if orjson is not None:
+        # orjson serializa dataclasses y fechas (ISO 8601) de forma nativa
+        return orjson.dumps(contenido, default=_por_defecto)
+    return json.dumps(
+        contenido, default=_por_defecto, ensure_ascii=False, separators=(',', ':')
+    ).encode()
+
+
+@functools.lru_cache(maxsize=Serializacion.GZIP_MEMORIA)
+def comprimir(cuerpo: bytes) -> bytes:
+    """Comprime un cuerpo con gzip; los cuerpos repetidos no se vuelven a comprimir."""
+    return gzip.compress(cuerpo, compresslevel=Serializacion.GZIP_NIVEL)
+
+
+class RespuestaJSON(Response):
+    """Respuesta JSON que serializa con `a_json` o recibe el cuerpo ya serializado."""
+
+    media_type = Serializacion.MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return a_json(content)
+
+
+def respuesta_json(funcion: Callable) -> Callable:
+    """Decorador para endpoints GET que devuelven listas grandes de dataclasses.
+
+    El resultado se serializa directamente con `a_json`, sin validarlo contra
+    el `response_model` (que se mantiene para la documentación), y se comprime
+    con gzip desde `Serializacion.GZIP_MINIMO` bytes si el cliente lo acepta.
+    Conserva los encabezados fijados por las dependencias (p. ej. la ETag).
+
+    Note:
+        Solo debe usarse cuando los campos del dataclass coinciden con los del
+        `response_model`, porque el modelo ya no filtra la respuesta.
+    """
+    firma = inspect.signature(funcion)
+    extra = [
+        inspect.Parameter('request', inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+        inspect.Parameter('response', inspect.Parameter.KEYWORD_ONLY, annotation=Response),
+    ]
+
+    @functools.wraps(funcion)
+    def envoltura(*args, request: Request, response: Response, **kwargs):
+        cuerpo = a_json(funcion(*args, **kwargs))
+        encabezados = {
+            nombre: valor
+            for nombre, valor in response.headers.items()
+            if nombre != 'content-length'
+        }
+        if len(cuerpo) >= Serializacion.GZIP_MINIMO:
+            encabezados['Vary'] = 'Accept-Encoding'
+            if 'gzip' in request.headers.get('accept-encoding', ''):
+                cuerpo = comprimir(cuerpo)
+                encabezados['Content-Encoding'] = 'gzip'
+        return RespuestaJSON(cuerpo, headers=encabezados)
+
+    envoltura.__signature__ = firma.replace(parameters=[*firma.parameters.values(), *extra])
+    return envoltura
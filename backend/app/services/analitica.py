@@ -0,0 +1,135 @@
+# backend/app/services/analitica.py
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+import numpy as np
+
+from backend.data.managers.csv_manager import CSVManager
+from backend.data.indexes.columnas import ColumnasVentas
+
+
+@dataclass
+class RendimientoProducto:
+    """Resultado de ventas de un producto en un rango de fechas.
+
+    Attributes:
+        id_producto (int): Identificador del producto.
+        nombre (Optional[str]): Nombre actual del producto, None si fue eliminado.
+        unidades (int): Unidades vendidas.
+        ingresos (int): Unidades por el precio actual del producto.
+        margen (int): Unidades por (precio - coste) del producto.
+    """
+
+    id_producto: int
+    nombre: Optional[str]
+    unidades: int
+    ingresos: int
+    margen: int
+
+
+class AnaliticaService:
+    """Consultas de rendimiento por producto sobre `ventas_productos`.
+
+    Todas las agrupaciones se calculan de forma vectorizada con NumPy
+    (`bincount` para agrupar por producto, indexación para el join con
+    `Producto` y `argsort` para ordenar), sin ciclos de Python por línea.
+
+    Args:
+        data_manager (CSVManager): Manejador de datos que aporta las columnas.
+    """
+
+    def __init__(self, data_manager: CSVManager):
+        self.data_manager = data_manager
+
+    def unidades_por_producto(
+        self, desde: Optional[datetime] = None, hasta: Optional[datetime] = None
+    ) -> np.ndarray:
+        """Calcula las unidades vendidas de cada producto en un rango de fechas.
+
+        Args:
+            desde (Optional[datetime]): Fecha mínima (inclusive).
+            hasta (Optional[datetime]): Fecha máxima (inclusive).
+
+        Returns:
+            np.ndarray: Arreglo indexado por ID de producto con las unidades vendidas.
+        """
+        columnas: ColumnasVentas = self.data_manager.get_component(ColumnasVentas)
+        fecha, id_producto, cantidad = columnas.lineas()
+        existe, _, _, _ = columnas.productos()
+
+        mascara = np.ones(len(fecha), dtype=bool)
+        if desde is not None:
+            mascara &= fecha >= np.datetime64(desde, 'us')
+        if hasta is not None:
+            mascara &= fecha <= np.datetime64(hasta, 'us')
+
+        tamano = max(len(existe), int(id_producto.max(initial=-1)) + 1)
+        return np.bincount(
+            id_producto[mascara], weights=cantidad[mascara], minlength=tamano
+        ).astype(np.int64)
+
+    def rendimiento_productos(
+        self, desde: Optional[datetime] = None, hasta: Optional[datetime] = None
+    ) -> List[RendimientoProducto]:
+        """Calcula unidades, ingresos y margen de cada producto vendido en el rango.
+
+        Args:
+            desde (Optional[datetime]): Fecha mínima (inclusive).
+            hasta (Optional[datetime]): Fecha máxima (inclusive).
+
+        Returns:
+            List[RendimientoProducto]: Productos con ventas, ordenados por unidades
+            de forma descendente.
+        """
+        unidades = self.unidades_por_producto(desde, hasta)
+        vendidos = np.flatnonzero(unidades)
+        return self.__resultados(unidades, vendidos[np.argsort(-unidades[vendidos], kind='stable')])
+
+    def top_vendidos(
+        self,
+        limite: int = 10,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+    ) -> List[RendimientoProducto]:
+        """Obtiene los productos más vendidos (por unidades) en un rango de fechas.
+
+        Args:
+            limite (int): Número máximo de productos a devolver.
+            desde (Optional[datetime]): Fecha mínima (inclusive).
+            hasta (Optional[datetime]): Fecha máxima (inclusive).
+
+        Returns:
+            List[RendimientoProducto]: Los productos más vendidos, de mayor a menor.
+        """
+        unidades = self.unidades_por_producto(desde, hasta)
+        vendidos = np.flatnonzero(unidades)
+        if len(vendidos) > limite:
+            # Selección parcial O(n) antes de ordenar solo los candidatos
+            vendidos = vendidos[np.argpartition(-unidades[vendidos], limite - 1)[:limite]]
+        return self.__resultados(unidades, vendidos[np.argsort(-unidades[vendidos], kind='stable')])
+
+    def __resultados(self, unidades: np.ndarray, ids: np.ndarray) -> List[RendimientoProducto]:
+        columnas: ColumnasVentas = self.data_manager.get_component(ColumnasVentas)
+        existe, precio, coste, nombres = columnas.productos()
+
+        # Join vectorizado con Producto a través de tablas indexadas por ID
+        conocidos = ids < len(existe)
+        precio_ids = np.zeros(len(ids), dtype=np.int64)
+        coste_ids = np.zeros(len(ids), dtype=np.int64)
+        precio_ids[conocidos] = precio[ids[conocidos]]
+        coste_ids[conocidos] = coste[ids[conocidos]]
+        unidades_ids = unidades[ids]
+        ingresos = unidades_ids * precio_ids
+        margen = unidades_ids * (precio_ids - coste_ids)
+
+        return [
+            RendimientoProducto(
+                id_producto=int(id_producto),
+                nombre=nombres[id_producto] if id_producto < len(nombres) else None,
+                unidades=int(u),
+                ingresos=int(i),
+                margen=int(m),
+            )
+            for id_producto, u, i, m in zip(ids.tolist(), unidades_ids, ingresos, margen)
+        ]
@@ -0,0 +1,194 @@
+# backend/app/services/deudas.py
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Deque, Dict, List, Optional
+
+from backend.app.enums.deudas import Antiguedad
+from backend.data.indexes.busqueda import BusquedaDeudores
+from backend.data.indexes.deudas import DeudasIndex
+from backend.data.managers.csv_manager import CSVManager
+from backend.models.abono import Abono
+from backend.models.deuda import Deuda
+from backend.models.deudor import Deudor
+
+
+@dataclass
+class AntiguedadDeudor:
+    """Saldo pendiente de un deudor repartido por antigüedad de sus deudas.
+
+    Attributes:
+        id_deudor (int): Identificador del deudor.
+        nombre (Optional[str]): Nombre del deudor, None si fue eliminado.
+        telefono (Optional[str]): Teléfono del deudor.
+        tramos (Dict[str, int]): Saldo pendiente por tramo (`Antiguedad.TRAMOS`).
+    """
+
+    id_deudor: int
+    nombre: Optional[str]
+    telefono: Optional[str]
+    tramos: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(Antiguedad.TRAMOS, 0))
+
+    @property
+    def total(self) -> int:
+        """Saldo pendiente total del deudor."""
+        return sum(self.tramos.values())
+
+
+class DeudaService:
+    """Consultas de cobranza sobre deudas y abonos.
+
+    Args:
+        data_manager (CSVManager): Manejador de datos que aporta el índice de deudas.
+    """
+
+    def __init__(self, data_manager: CSVManager):
+        self.data_manager = data_manager
+
+    def get_antiguedad(
+        self, fecha_corte: Optional[datetime] = None, incluir_saldados: bool = False
+    ) -> List[AntiguedadDeudor]:
+        """Reporte de antigüedad de saldos (0-30, 31-60, 61-90 y 90+ días).
+
+        Los abonos se aplican a las deudas más antiguas primero, de modo que el
+        saldo restante corresponde siempre a las deudas más recientes.
+
+        Args:
+            fecha_corte (Optional[datetime]): Fecha desde la que se mide la
+                antigüedad. Por defecto, ahora.
+            incluir_saldados (bool): Si se incluyen deudores sin saldo pendiente.
+
+        Returns:
+            List[AntiguedadDeudor]: Deudores ordenados por saldo total descendente.
+        """
+        fecha_corte = fecha_corte or datetime.now()
+        indice: DeudasIndex = self.data_manager.get_component(DeudasIndex)
+        deudores: BusquedaDeudores = self.data_manager.get_component(BusquedaDeudores)
+
+        reporte = []
+        for deudor_id in indice.deudores():
+            deudor = deudores.get_deudor(deudor_id)
+            antiguedad = self.__antiguedad(indice, deudor_id, deudor, fecha_corte)
+            if antiguedad.total or incluir_saldados:
+                reporte.append(antiguedad)
+        reporte.sort(key=lambda a: a.total, reverse=True)
+        return reporte
+
+    def get_antiguedad_deudor(
+        self, deudor_id: int, fecha_corte: Optional[datetime] = None
+    ) -> AntiguedadDeudor:
+        """Antigüedad del saldo pendiente de un deudor.
+
+        Args:
+            deudor_id (int): Identificador del deudor.
+            fecha_corte (Optional[datetime]): Fecha desde la que se mide la
+                antigüedad. Por defecto, ahora.
+
+        Returns:
+            AntiguedadDeudor: Saldo pendiente del deudor por tramo.
+        """
+        indice: DeudasIndex = self.data_manager.get_component(DeudasIndex)
+        deudores: BusquedaDeudores = self.data_manager.get_component(BusquedaDeudores)
+        deudor = deudores.get_deudor(deudor_id)
+        return self.__antiguedad(indice, deudor_id, deudor, fecha_corte or datetime.now())
+
+    def get_deudas(self, deudor_id: int) -> List[Deuda]:
+        """Deudas de un deudor, de la más antigua a la más reciente."""
+        indice: DeudasIndex = self.data_manager.get_component(DeudasIndex)
+        return indice.get_deudas(deudor_id)
+
+    def get_abonos(self, deudor_id: int) -> List[Abono]:
+        """Abonos de un deudor, del más antiguo al más reciente."""
+        indice: DeudasIndex = self.data_manager.get_component(DeudasIndex)
+        return indice.get_abonos(deudor_id)
+
+    def registrar_abono(self, deudor_id: int, valor_abono: int) -> Abono:
+        """Registra un abono de un deudor con la fecha actual.
+
+        Args:
+            deudor_id (int): Identificador del deudor.
+            valor_abono (int): Monto abonado.
+
+        Returns:
+            Abono: El abono registrado.
+
+        Raises:
+            ValueError: Si el deudor no existe o el monto no es mayor a 0.
+        """
+        deudores: BusquedaDeudores = self.data_manager.get_component(BusquedaDeudores)
+        if deudores.get_deudor(deudor_id) is None:
+            raise ValueError(f'Deudor {deudor_id} no existe')
+        if valor_abono <= 0:
+            raise ValueError('El monto del abono debe ser mayor a 0')
+        abono = Abono(
+            id=-1, id_deudor=deudor_id, valor_abono=valor_abono, fecha_abono=datetime.now()
+        )
+        return self.data_manager.add_data(abono)
+
+    def __antiguedad(
+        self,
+        indice: DeudasIndex,
+        deudor_id: int,
+        deudor: Optional[Deudor],
+        fecha_corte: datetime,
+    ) -> AntiguedadDeudor:
+        antiguedad = AntiguedadDeudor(
+            id_deudor=deudor_id,
+            nombre=deudor.nombre if deudor else None,
+            telefono=deudor.telefono if deudor else None,
+        )
+        pendientes = self.__aplicar_abonos(
+            indice.get_deudas(deudor_id), indice.get_abonos(deudor_id)
+        )
+        for deuda, restante in pendientes:
+            antiguedad.tramos[self.__tramo(deuda, fecha_corte)] += restante
+        return antiguedad
+
+    @staticmethod
+    def __aplicar_abonos(deudas: List[Deuda], abonos: List[Abono]) -> Deque[List]:
+        """Cruza deudas y abonos (ambos ordenados por fecha) en una sola pasada.
+
+        Cada abono cancela las deudas pendientes más antiguas existentes en su
+        fecha; el excedente queda como saldo a favor para las deudas siguientes.
+
+        Returns:
+            Deque[List]: Pares `[deuda, restante]` aún pendientes, de la más antigua
+            a la más reciente.
+        """
+        pendientes: Deque[List] = deque()
+        a_favor = 0
+        i = j = 0
+        while i < len(deudas) or j < len(abonos):
+            # Ante fechas iguales se registra primero la deuda
+            siguiente_es_deuda = j >= len(abonos) or (
+                i < len(deudas)
+                and (deudas[i].creacion_deuda or datetime.min)
+                <= (abonos[j].fecha_abono or datetime.min)
+            )
+            if siguiente_es_deuda:
+                deuda = deudas[i]
+                i += 1
+                restante = deuda.valor_deuda or 0
+                cubierto = min(a_favor, restante)
+                a_favor -= cubierto
+                if restante - cubierto > 0:
+                    pendientes.append([deuda, restante - cubierto])
+            else:
+                disponible = abonos[j].valor_abono or 0
+                j += 1
+                while disponible and pendientes:
+                    cubierto = min(disponible, pendientes[0][1])
+                    pendientes[0][1] -= cubierto
+                    disponible -= cubierto
+                    if not pendientes[0][1]:
+                        pendientes.popleft()
+                a_favor += disponible
+        return pendientes
+
+    @staticmethod
+    def __tramo(deuda: Deuda, fecha_corte: datetime) -> str:
+        dias = (fecha_corte - deuda.creacion_deuda).days if deuda.creacion_deuda else 0
+        for limite, tramo in zip(Antiguedad.LIMITES, Antiguedad.TRAMOS):
+            if dias <= limite:
+                return tramo
+        return Antiguedad.TRAMOS[-1]
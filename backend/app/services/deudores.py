@@ -0,0 +1,81 @@
+# backend/app/services/deudores.py
+from typing import List, Optional
+
+from backend.data.indexes.busqueda import BusquedaDeudores
+from backend.data.ledgers.saldos import SaldoDeudor, SaldosLedger
+from backend.data.managers.csv_manager import CSVManager
+from backend.models.deudor import Deudor
+
+
+class DeudorService:
+    """Consultas y altas de deudores sobre el índice de búsqueda y el ledger de saldos.
+
+    Args:
+        data_manager (CSVManager): Manejador de datos que aporta los índices.
+    """
+
+    def __init__(self, data_manager: CSVManager):
+        self.data_manager = data_manager
+
+    def get_deudores(self, termino: Optional[str] = None, con_saldo: bool = False) -> List[Deudor]:
+        """Obtiene los deudores que cumplen los filtros.
+
+        Args:
+            termino (Optional[str]): Texto cuyas palabras son prefijo del nombre; con
+                término los deudores se ordenan por relevancia, sin él por ID.
+            con_saldo (bool): Solo deudores con saldo pendiente.
+
+        Returns:
+            List[Deudor]: Deudores filtrados.
+        """
+        busqueda: BusquedaDeudores = self.data_manager.get_component(BusquedaDeudores)
+        deudores = busqueda.sugerir(termino, limite=None) if termino else busqueda.listar()
+        if con_saldo:
+            saldos: SaldosLedger = self.data_manager.get_component(SaldosLedger)
+            deudores = [d for d in deudores if saldos.get_saldo(d.id).saldo > 0]
+        return deudores
+
+    def get_deudor(self, deudor_id: int) -> Deudor:
+        """Obtiene un deudor por su ID a través del índice.
+
+        Raises:
+            ValueError: Si el deudor no existe.
+        """
+        busqueda: BusquedaDeudores = self.data_manager.get_component(BusquedaDeudores)
+        deudor = busqueda.get_deudor(deudor_id)
+        if deudor is None:
+            raise ValueError(f'Deudor {deudor_id} no existe')
+        return deudor
+
+    def get_saldo(self, deudor_id: int) -> SaldoDeudor:
+        """Obtiene el saldo materializado de un deudor existente.
+
+        Raises:
+            ValueError: Si el deudor no existe.
+        """
+        self.get_deudor(deudor_id)
+        saldos: SaldosLedger = self.data_manager.get_component(SaldosLedger)
+        return saldos.get_saldo(deudor_id)
+
+    def create_deudor(self, nombre: str, telefono: Optional[str] = None) -> Deudor:
+        """Registra un deudor nuevo.
+
+        Args:
+            nombre (str): Nombre del deudor (máximo 50 caracteres).
+            telefono (Optional[str]): Teléfono de hasta 10 dígitos.
+
+        Returns:
+            Deudor: El deudor creado con su ID asignado.
+
+        Raises:
+            ValueError: Si el nombre o el teléfono no son válidos.
+        """
+        nombre = (nombre or '').strip()
+        telefono = (telefono or '').strip() or None
+        if not nombre:
+            raise ValueError('El nombre del deudor es obligatorio.')
+        if len(nombre) > 50:
+            raise ValueError('El nombre del deudor no puede exceder los 50 caracteres.')
+        if telefono and (not telefono.isdigit() or len(telefono) > 10):
+            raise ValueError('El teléfono debe ser un número de hasta 10 dígitos.')
+        return self.data_manager.add_data(Deudor(id=-1, nombre=nombre, telefono=telefono))
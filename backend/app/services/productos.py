@@ -1,15 +1,132 @@
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 from backend.data.managers.csv_manager import CSVManager
+from backend.data.indexes.busqueda import BusquedaProductos
+from backend.data.indexes.stock import StockIndex
 from backend.models.producto import Producto
 
+# Campos que se pueden asignar al crear o actualizar un producto
+CAMPOS_PRODUCTO = ('nombre', 'precio', 'stock', 'coste', 'imagen_ruta', 'stock_minimo')
+
 
 class ProductoService:
     def __init__(self, data_manager: CSVManager):
         self.data_manager = data_manager
 
+    def get_productos(
+        self,
+        termino: Optional[str] = None,
+        disponibles: bool = False,
+        bajo_minimo: bool = False,
+    ) -> List[Producto]:
+        """Obtiene los productos que cumplen los filtros, a partir de los índices.
+
+        Args:
+            termino (Optional[str]): Texto buscado en el nombre; con término los
+                productos se ordenan por relevancia, sin él por ID.
+            disponibles (bool): Solo productos con stock mayor a 0.
+            bajo_minimo (bool): Solo productos en o bajo su umbral de reposición.
+
+        Returns:
+            List[Producto]: Productos filtrados.
+        """
+        busqueda: BusquedaProductos = self.data_manager.get_component(BusquedaProductos)
+        stock: StockIndex = self.data_manager.get_component(StockIndex)
+        productos = busqueda.buscar(termino or '')
+        if disponibles:
+            ids = {p.id for p in stock.disponibles()}
+            productos = [p for p in productos if p.id in ids]
+        if bajo_minimo:
+            ids = {p.id for p in stock.bajo_umbral()}
+            productos = [p for p in productos if p.id in ids]
+        return productos
+
+    def buscar_productos(self, termino: str, limite: int) -> Tuple[List[Producto], int]:
+        """Obtiene los primeros productos por relevancia y el total de coincidencias.
+
+        Solo se ordenan las coincidencias necesarias para llegar a `limite`.
+
+        Args:
+            termino (str): Texto buscado en el nombre.
+            limite (int): Número máximo de productos a devolver.
+
+        Returns:
+            Tuple[List[Producto], int]: Productos, del más al menos relevante, y el
+                número total de productos que coinciden con el término.
+        """
+        busqueda: BusquedaProductos = self.data_manager.get_component(BusquedaProductos)
+        return busqueda.buscar(termino, limite), busqueda.contar(termino)
+
     def get_productos_disponibles(self) -> List[Producto]:
-        productos = self.data_manager.get_data(Producto)
-        return [p for p in productos if p.stock > 0]
+        stock: StockIndex = self.data_manager.get_component(StockIndex)
+        return stock.disponibles()
+
+    def get_productos_bajo_minimo(self) -> List[Producto]:
+        stock: StockIndex = self.data_manager.get_component(StockIndex)
+        return stock.bajo_umbral()
 
     def get_producto(self, producto_id: int) -> Producto:
-        return self.data_manager.get_data(Producto, producto_id)
\ No newline at end of file
+        """Obtiene un producto por su ID a través del índice de búsqueda.
+
+        Raises:
+            ValueError: Si el producto no existe.
+        """
+        busqueda: BusquedaProductos = self.data_manager.get_component(BusquedaProductos)
+        producto = busqueda.get_producto(producto_id)
+        if producto is None:
+            raise ValueError(f'Producto {producto_id} no existe')
+        return producto
+
+    def create_producto(self, data: Dict[str, Any]) -> Producto:
+        """Crea un producto nuevo.
+
+        Args:
+            data (Dict[str, Any]): Campos del producto (ver `CAMPOS_PRODUCTO`).
+
+        Returns:
+            Producto: El producto creado con su ID asignado.
+
+        Raises:
+            ValueError: Si hay campos desconocidos o el coste no es menor al precio.
+        """
+        self.__validar_campos(data)
+        producto = Producto(id=-1, **{campo: data.get(campo) for campo in CAMPOS_PRODUCTO})
+        self.__validar_coste(producto.precio, producto.coste)
+        return self.data_manager.add_data(producto)
+
+    def update_producto(self, producto_id: int, data: Dict[str, Any]) -> Producto:
+        """Actualiza los campos indicados de un producto.
+
+        Args:
+            producto_id (int): Identificador del producto.
+            data (Dict[str, Any]): Campos a modificar (ver `CAMPOS_PRODUCTO`).
+
+        Returns:
+            Producto: El producto actualizado.
+
+        Raises:
+            ValueError: Si el producto no existe, hay campos desconocidos o el
+                coste resultante no es menor al precio.
+        """
+        self.__validar_campos(data)
+        actual = self.get_producto(producto_id)
+        self.__validar_coste(data.get('precio', actual.precio), data.get('coste', actual.coste))
+        return self.data_manager.put_data(Producto, producto_id, data)
+
+    def delete_producto(self, producto_id: int) -> bool:
+        """Elimina un producto; las ventas históricas conservan su nombre.
+
+        Returns:
+            bool: True si el producto existía y fue eliminado.
+        """
+        return self.data_manager.delete_data(Producto, producto_id)
+
+    @staticmethod
+    def __validar_campos(data: Dict[str, Any]):
+        invalidos = set(data) - set(CAMPOS_PRODUCTO)
+        if invalidos:
+            raise ValueError(f'Campos no editables en el producto: {sorted(invalidos)}')
+
+    @staticmethod
+    def __validar_coste(precio: int, coste: int):
+        if coste is not None and precio is not None and coste >= precio:
+            raise ValueError('Coste debe ser un número entero entre 0 y el precio')
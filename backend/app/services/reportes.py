@@ -0,0 +1,295 @@
+# backend/app/services/reportes.py
+import csv
+import io
+import json
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from backend.app.enums.reports import Reports
+from backend.app.reports.pdf import PDFResumen
+from backend.data.managers.csv_manager import CSVManager
+from backend.data.indexes.ventas import VentasIndex
+from backend.data.ledgers.saldos import SaldoDeudor, SaldosLedger
+from backend.models.deudor import Deudor
+from backend.models.producto import Producto
+from backend.models.venta import Venta
+from backend.models.venta_producto import VentaProducto
+
+COLUMNAS: Dict[str, List[str]] = {
+    Reports.VENTAS: ['id', 'fecha', 'total', 'ganancia', 'unidades'],
+    Reports.INVENTARIO: ['id', 'nombre', 'precio', 'coste', 'stock', 'valor_stock'],
+    Reports.DEUDAS: [
+        'id_deudor',
+        'nombre',
+        'telefono',
+        'total_deudas',
+        'total_abonos',
+        'saldo',
+        'ultimo_movimiento',
+    ],
+}
+
+# Valor del campo `tabla` de cada fila del flujo de sincronización
+TABLAS_SINCRONIZACION: Dict[type, str] = {
+    Venta: 'ventas',
+    VentaProducto: 'ventas_productos',
+}
+
+
+class ReporteService:
+    """Genera reportes de ventas, inventario y deudas como un flujo de bloques.
+
+    Los reportes se producen con generadores: las filas se obtienen de los
+    índices y ledgers en memoria, o del CSV fila a fila con `iter_data`, y se
+    codifican en bloques de `Reports.CHUNK_SIZE` filas, de modo que la memoria
+    usada no crece con el tamaño de lo exportado. Las fechas se escriben en
+    ISO 8601 en todos los formatos.
+
+    Args:
+        data_manager (CSVManager): Manejador de datos del que se leen los reportes.
+    """
+
+    def __init__(self, data_manager: CSVManager):
+        self.data_manager = data_manager
+
+    def exportar(
+        self,
+        tipo: str,
+        formato: str,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+    ) -> Iterator[bytes]:
+        """Exporta un reporte como un flujo de bloques de bytes.
+
+        Args:
+            tipo (str): Tipo de reporte (Reports.VENTAS, INVENTARIO o DEUDAS).
+            formato (str): Formato de salida (Reports.CSV, JSONL o PDF).
+            desde (Optional[datetime]): Fecha mínima (solo reporte de ventas).
+            hasta (Optional[datetime]): Fecha máxima (solo reporte de ventas).
+
+        Returns:
+            Iterator[bytes]: Bloques del archivo exportado.
+
+        Raises:
+            ValueError: Si el tipo o el formato no existen.
+        """
+        generadores: Dict[str, Callable[[], Iterable[Dict[str, Any]]]] = {
+            Reports.VENTAS: lambda: self.__filas_ventas(desde, hasta),
+            Reports.INVENTARIO: self.__filas_inventario,
+            Reports.DEUDAS: self.__filas_deudas,
+        }
+        if tipo not in generadores:
+            raise ValueError(f'Reporte {tipo} no existe')
+        if formato not in Reports.MEDIA_TYPES:
+            raise ValueError(f'Formato {formato} no soportado')
+
+        filas = generadores[tipo]()
+        if formato == Reports.CSV:
+            return self.__a_csv(COLUMNAS[tipo], filas)
+        if formato == Reports.JSONL:
+            return self.__a_jsonl(filas)
+        return self.__a_pdf(tipo, filas, desde, hasta)
+
+    def sincronizar_ventas(self, despues_id: int = 0) -> Iterator[bytes]:
+        """Exporta el historial de ventas como JSON Lines a partir de un cursor.
+
+        Cada venta se emite como una fila con `tabla = 'ventas'`, seguida de sus
+        líneas con `tabla = 'ventas_productos'`, en orden ascendente por ID de
+        venta. El cliente guarda el ID de la última venta recibida y lo envía
+        como `despues_id` para continuar o traer solo las ventas nuevas.
+
+        Args:
+            despues_id (int): ID de la última venta ya recibida (0 para todo el historial).
+
+        Returns:
+            Iterator[bytes]: Bloques de filas JSON separadas por saltos de línea.
+
+        Note:
+            Las ventas se leen del índice por páginas de `Reports.CHUNK_SIZE`, de
+            modo que las registradas durante la descarga también se incluyen.
+        """
+        return self.__a_jsonl(self.__filas_sincronizacion(despues_id))
+
+    @staticmethod
+    def nombre_archivo(tipo: str, formato: str) -> str:
+        """Nombre sugerido para el archivo exportado, p. ej. 'ventas_2024-12-01.csv'."""
+        return f'{tipo}_{datetime.now():%Y-%m-%d}.{formato}'
+
+    def __filas_ventas(
+        self, desde: Optional[datetime], hasta: Optional[datetime]
+    ) -> Iterator[Dict[str, Any]]:
+        indice: VentasIndex = self.data_manager.get_component(VentasIndex)
+        cursor = None
+        while True:
+            ventas = indice.paginar(Reports.CHUNK_SIZE, cursor, desde, hasta)
+            for venta in ventas:
+                yield {
+                    'id': venta.id,
+                    'fecha': venta.fecha,
+                    'total': venta.total,
+                    'ganancia': venta.ganancia,
+                    'unidades': sum(linea.cantidad for linea in indice.get_lineas(venta.id)),
+                }
+            if len(ventas) < Reports.CHUNK_SIZE:
+                return
+            cursor = (ventas[-1].fecha, ventas[-1].id)
+
+    def __filas_sincronizacion(self, despues_id: int) -> Iterator[Dict[str, Any]]:
+        indice: VentasIndex = self.data_manager.get_component(VentasIndex)
+        while True:
+            # La venta y sus líneas se escriben con el lock del manejador tomado: leer
+            # la página con él garantiza que ninguna venta salga sin sus líneas (y que
+            # el cursor no la salte). Las filas se entregan fuera del lock.
+            filas = []
+            with self.data_manager.atomic():
+                ventas = indice.posteriores(despues_id, Reports.CHUNK_SIZE)
+                for venta in ventas:
+                    filas.append({'tabla': TABLAS_SINCRONIZACION[Venta], **asdict(venta)})
+                    filas.extend(
+                        {'tabla': TABLAS_SINCRONIZACION[VentaProducto], **asdict(linea)}
+                        for linea in indice.get_lineas(venta.id)
+                    )
+            yield from filas
+            if len(ventas) < Reports.CHUNK_SIZE:
+                return
+            despues_id = ventas[-1].id
+
+    def __filas_inventario(self) -> Iterator[Dict[str, Any]]:
+        for producto in self.data_manager.iter_data(Producto):
+            yield {
+                'id': producto.id,
+                'nombre': producto.nombre,
+                'precio': producto.precio,
+                'coste': producto.coste,
+                'stock': producto.stock,
+                'valor_stock': (producto.stock or 0) * (producto.coste or 0),
+            }
+
+    def __filas_deudas(self) -> Iterator[Dict[str, Any]]:
+        ledger: SaldosLedger = self.data_manager.get_component(SaldosLedger)
+        # Los saldos ya están en memoria; los deudores se leen fila a fila
+        saldos = {saldo.id_deudor: saldo for saldo in ledger.get_saldos()}
+        for deudor in self.data_manager.iter_data(Deudor):
+            saldo = saldos.pop(deudor.id, None)
+            if saldo is not None:
+                yield self.__fila_deuda(saldo, deudor)
+        # Movimientos de deudores que ya no existen
+        for saldo in saldos.values():
+            yield self.__fila_deuda(saldo, None)
+
+    @staticmethod
+    def __fila_deuda(saldo: SaldoDeudor, deudor: Optional[Deudor]) -> Dict[str, Any]:
+        return {
+            'id_deudor': saldo.id_deudor,
+            'nombre': deudor.nombre if deudor else None,
+            'telefono': deudor.telefono if deudor else None,
+            'total_deudas': saldo.total_deudas,
+            'total_abonos': saldo.total_abonos,
+            'saldo': saldo.saldo,
+            'ultimo_movimiento': saldo.ultimo_movimiento,
+        }
+
+    @staticmethod
+    def __bloques(filas: Iterable[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+        bloque = []
+        for fila in filas:
+            bloque.append(fila)
+            if len(bloque) >= Reports.CHUNK_SIZE:
+                yield bloque
+                bloque = []
+        if bloque:
+            yield bloque
+
+    def __a_csv(self, columnas: List[str], filas: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=columnas)
+        writer.writeheader()
+        for bloque in self.__bloques(filas):
+            # Las fechas se escriben en ISO 8601, igual que en JSON Lines
+            writer.writerows(
+                {
+                    columna: valor.isoformat() if isinstance(valor, datetime) else valor
+                    for columna, valor in fila.items()
+                }
+                for fila in bloque
+            )
+            yield buffer.getvalue().encode(Reports.ENCODING)
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            # Reporte sin filas: solo encabezados
+            yield buffer.getvalue().encode(Reports.ENCODING)
+
+    def __a_jsonl(self, filas: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+        for bloque in self.__bloques(filas):
+            yield ''.join(
+                json.dumps(fila, ensure_ascii=False, default=self.__json_default) + '\n'
+                for fila in bloque
+            ).encode(Reports.ENCODING)
+
+    @staticmethod
+    def __json_default(valor: Any) -> Any:
+        if isinstance(valor, datetime):
+            return valor.isoformat()
+        raise TypeError(f'Tipo no serializable: {type(valor).__name__}')
+
+    def __a_pdf(
+        self,
+        tipo: str,
+        filas: Iterable[Dict[str, Any]],
+        desde: Optional[datetime],
+        hasta: Optional[datetime],
+    ) -> Iterator[bytes]:
+        pdf = PDFResumen(f'Portalapp - Reporte de {tipo}')
+        pdf.agregar_linea(f'Generado: {datetime.now():%Y-%m-%d %H:%M}')
+        if tipo == Reports.VENTAS and (desde or hasta):
+            pdf.agregar_linea(
+                f"Rango: {desde or 'inicio'} a {hasta or 'hoy'}",
+            )
+        pdf.agregar_linea()
+
+        # El resumen se acumula fila a fila, sin guardar el reporte completo
+        if tipo == Reports.VENTAS:
+            ventas = total = ganancia = unidades = 0
+            for fila in filas:
+                ventas += 1
+                total += fila['total'] or 0
+                ganancia += fila['ganancia'] or 0
+                unidades += fila['unidades']
+            pdf.agregar_linea(f'Ventas registradas: {ventas:,}')
+            pdf.agregar_linea(f'Unidades vendidas: {unidades:,}')
+            pdf.agregar_linea(f'Total vendido: ${total:,}')
+            pdf.agregar_linea(f'Total recibido: ${ganancia:,}')
+        elif tipo == Reports.INVENTARIO:
+            productos = unidades = valor = 0
+            agotados = []
+            for fila in filas:
+                productos += 1
+                unidades += fila['stock'] or 0
+                valor += fila['valor_stock']
+                if not fila['stock']:
+                    agotados.append(fila['nombre'])
+            pdf.agregar_linea(f'Productos: {productos:,}')
+            pdf.agregar_linea(f'Unidades en stock: {unidades:,}')
+            pdf.agregar_linea(f'Valor del inventario (coste): ${valor:,}')
+            pdf.agregar_linea(f'Productos agotados: {len(agotados):,}')
+            for nombre in agotados:
+                pdf.agregar_linea(f'  - {nombre}')
+        else:
+            deudores = 0
+            saldo_total = 0
+            pendientes = []
+            for fila in filas:
+                deudores += 1
+                saldo_total += fila['saldo']
+                if fila['saldo']:
+                    pendientes.append(fila)
+            pdf.agregar_linea(f'Deudores registrados: {deudores:,}')
+            pdf.agregar_linea(f'Deudores con saldo: {len(pendientes):,}')
+            pdf.agregar_linea(f'Saldo total por cobrar: ${saldo_total:,}')
+            pdf.agregar_linea()
+            for fila in sorted(pendientes, key=lambda f: f['saldo'], reverse=True):
+                pdf.agregar_linea(f"  {fila['nombre'] or fila['id_deudor']}: ${fila['saldo']:,}")
+
+        yield pdf.render()
@@ -1,12 +1,62 @@
 # backend/app/services/ventas.py
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import hashlib
+import json
+from dataclasses import dataclass, field, fields
+from datetime import date, datetime
+from typing import List, Dict, Any, Optional, Tuple
+from backend.models.resumen import ResumenDiario, ResumenMensual
 from backend.models.venta import Venta
 from backend.models.venta_producto import VentaProducto
-from backend.models.producto import Producto
 from backend.models.deuda import Deuda
 from backend.models.deudor import Deudor  # Asegúrate de importar Deudor
 from backend.data.managers.csv_manager import CSVManager
+from backend.data.ledgers.idempotencia import IdempotenciaVentas
+from backend.data.ledgers.inventario import InventarioLedger
+from backend.data.indexes.busqueda import BusquedaDeudores
+from backend.data.indexes.ventas import VentasIndex
+from backend.data.ledgers.resumenes import ResumenesVentas
+
+
+@dataclass
+class LineaVenta:
+    """Línea de una venta con el nombre del producto resuelto.
+
+    Attributes:
+        id_producto (int): Identificador del producto vendido.
+        nombre (Optional[str]): Nombre del producto, None si nunca existió.
+        cantidad (int): Unidades vendidas.
+    """
+
+    id_producto: int
+    nombre: Optional[str]
+    cantidad: int
+
+
+@dataclass
+class DetalleVenta:
+    """Venta junto con sus líneas de productos.
+
+    Attributes:
+        venta (Venta): La venta consultada.
+        lineas (List[LineaVenta]): Productos incluidos en la venta.
+    """
+
+    venta: Venta
+    lineas: List[LineaVenta] = field(default_factory=list)
+
+
+@dataclass
+class PaginaVentas:
+    """Página del historial de ventas paginada por keyset.
+
+    Attributes:
+        ventas (List[Venta]): Ventas de la página, de la más reciente a la más antigua.
+        siguiente (Optional[Tuple[datetime, int]]): Cursor `(fecha, id)` para pedir la
+            página siguiente, None si no hay más ventas.
+    """
+
+    ventas: List[Venta]
+    siguiente: Optional[Tuple[datetime, int]] = None
 
 
 class VentaService:
@@ -18,61 +68,226 @@ class VentaService:
         productos: List[Dict[str, Any]],
         monto_pagado: float,
         deudor_info: Optional[Dict[str, str]] = None,
+        clave_idempotencia: Optional[str] = None,
     ) -> Venta:
-        # 1. Validar productos y stock
-        total_venta = 0
-        for prod_info in productos:
-            producto = self.data_manager.get_data_by_id(Producto, prod_info['id_producto'])
-            if not producto:
-                raise ValueError(f"Producto {prod_info['id_producto']} no existe")
-            if producto.stock < prod_info['cantidad']:
-                raise ValueError(f'Stock insuficiente para {producto.nombre}')
-            total_venta += producto.precio * prod_info['cantidad']
-
-        # 2. Validar monto si no es a crédito
-        if not deudor_info and monto_pagado < total_venta:
-            raise ValueError('Monto insuficiente')
-
-        # 3. Crear venta
-        venta = Venta(
-            id=-1, fecha=datetime.now(), ganancia=min(monto_pagado, total_venta), total=total_venta
-        )
-        venta = self.data_manager.add_data(venta)
-
-        # 4. Registrar productos y actualizar stock
-        for prod_info in productos:
-            # Registrar venta-producto
-            venta_producto = VentaProducto(
-                id=-1,
-                id_venta=venta.id,
-                id_producto=prod_info['id_producto'],
-                cantidad=prod_info['cantidad'],
-                fecha=datetime.now(),
-            )
-            self.data_manager.add_data(venta_producto)
+        """Registra una venta, descontando stock y creando la deuda si es a crédito.
+
+        Args:
+            productos (List[Dict[str, Any]]): Productos con 'id_producto' y 'cantidad'.
+            monto_pagado (float): Monto pagado por el cliente.
+            deudor_info (Optional[Dict[str, str]]): Deudor existente ('id') o nuevo
+                ('nombre', 'telefono') para ventas a crédito.
+            clave_idempotencia (Optional[str]): Clave del cliente para reintentos; si
+                ya se usó con la misma solicitud se devuelve la venta original sin
+                volver a escribir nada.
+
+        Returns:
+            Venta: La venta registrada (o la original, en un reintento).
+
+        Raises:
+            ValueError: Si la venta no es válida o la clave se usó con otra solicitud.
+        """
+        if clave_idempotencia is None:
+            return self.__registrar_venta(productos, monto_pagado, deudor_info)
+
+        idempotencia: IdempotenciaVentas = self.data_manager.get_component(IdempotenciaVentas)
+        huella = hashlib.sha256(
+            json.dumps([productos, monto_pagado, deudor_info], sort_keys=True).encode()
+        ).hexdigest()
+        venta_id = idempotencia.reclamar(clave_idempotencia, huella)
+        if venta_id is not None:
+            index: VentasIndex = self.data_manager.get_component(VentasIndex)
+            venta = index.get_venta(venta_id)
+            if venta is None:
+                raise ValueError(f'La venta {venta_id} de esta clave de idempotencia fue eliminada')
+            return venta
 
-            # Actualizar stock
-            producto = self.data_manager.get_data_by_id(Producto, prod_info['id_producto'])
-            producto.stock -= prod_info['cantidad']
-            self.data_manager.put_data(Producto, producto.id, {'stock': producto.stock})
+        try:
+            venta = self.__registrar_venta(productos, monto_pagado, deudor_info)
+        except BaseException:
+            idempotencia.liberar(clave_idempotencia)
+            raise
+        idempotencia.registrar(clave_idempotencia, huella, venta.id)
+        return venta
+
+    def __registrar_venta(
+        self,
+        productos: List[Dict[str, Any]],
+        monto_pagado: float,
+        deudor_info: Optional[Dict[str, str]],
+    ) -> Venta:
+        # 0. Un deudor existente se identifica por su ID
+        deudor = None
+        if deudor_info and deudor_info.get('id') is not None:
+            busqueda: BusquedaDeudores = self.data_manager.get_component(BusquedaDeudores)
+            deudor = busqueda.get_deudor(int(deudor_info['id']))
+            if deudor is None:
+                raise ValueError(f"Deudor {deudor_info['id']} no existe")
+
+        # 1. Reservar stock (valida existencia y disponibilidad de forma atómica)
+        inventario: InventarioLedger = self.data_manager.get_component(InventarioLedger)
+        # Los acumulados se actualizan con las notificaciones de la venta: se crean antes
+        self.data_manager.get_component(ResumenesVentas)
+        reserva = inventario.reserve(productos)
+        total_venta = reserva.total
+
+        try:
+            # 2. Validar monto si no es a crédito
+            if not deudor_info and monto_pagado < total_venta:
+                raise ValueError('Monto insuficiente')
+
+            # 3. Crear venta y registrar productos; el stock se valida contra el archivo
+            # antes de escribirlas y se descuenta con una sola escritura después
+            with inventario.confirmar(reserva):
+                venta = Venta(
+                    id=-1,
+                    fecha=datetime.now(),
+                    # Los montos se guardan como enteros (el pago puede llegar como float)
+                    ganancia=int(min(monto_pagado, total_venta)),
+                    total=total_venta,
+                )
+                venta = self.data_manager.add_data(venta)
+
+                # 4. Registrar productos
+                self.data_manager.add_batch(
+                    [
+                        VentaProducto(
+                            id=-1,
+                            id_venta=venta.id,
+                            id_producto=prod_info['id_producto'],
+                            cantidad=prod_info['cantidad'],
+                            fecha=venta.fecha,
+                        )
+                        for prod_info in productos
+                    ]
+                )
+        finally:
+            inventario.release(reserva)
 
         # 5. Crear deuda si aplica
         if deudor_info:
             # Crear o recuperar deudor
-            deudor = Deudor(
-                id=-1, nombre=deudor_info['nombre'], telefono=deudor_info.get('telefono')
-            )
-            deudor = self.data_manager.add_data(deudor)
+            if deudor is None:
+                deudor = Deudor(
+                    id=-1, nombre=deudor_info['nombre'], telefono=deudor_info.get('telefono')
+                )
+                deudor = self.data_manager.add_data(deudor)
 
             deuda = Deuda(
                 id=-1,
                 id_venta=venta.id,
                 id_deudor=deudor.id,
-                valor_deuda=total_venta - monto_pagado,
+                valor_deuda=int(total_venta - monto_pagado),
                 creacion_deuda=datetime.now(),
             )
             self.data_manager.add_data(deuda)
 
         return venta
 
-    # Implementar otros métodos según sea necesario...
\ No newline at end of file
+    def get_ventas(
+        self,
+        limite: int = 50,
+        despues_de: Optional[Tuple[datetime, int]] = None,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+    ) -> PaginaVentas:
+        """Obtiene una página del historial de ventas.
+
+        Args:
+            limite (int): Número máximo de ventas por página.
+            despues_de (Optional[Tuple[datetime, int]]): Cursor devuelto en
+                `PaginaVentas.siguiente` por la página anterior.
+            desde (Optional[datetime]): Fecha mínima de las ventas (inclusive).
+            hasta (Optional[datetime]): Fecha máxima de las ventas (inclusive).
+
+        Returns:
+            PaginaVentas: Ventas de la página y el cursor de la siguiente.
+
+        Raises:
+            ValueError: Si el límite no es positivo.
+        """
+        if limite <= 0:
+            raise ValueError('El límite debe ser mayor a 0')
+        indice: VentasIndex = self.data_manager.get_component(VentasIndex)
+        # Se pide una venta extra para saber si existe una página siguiente
+        ventas = indice.paginar(limite + 1, despues_de, desde, hasta)
+        siguiente = None
+        if len(ventas) > limite:
+            ventas = ventas[:limite]
+            siguiente = (ventas[-1].fecha, ventas[-1].id)
+        return PaginaVentas(ventas=ventas, siguiente=siguiente)
+
+    def get_resumenes_diarios(
+        self, desde: Optional[date] = None, hasta: Optional[date] = None
+    ) -> List[ResumenDiario]:
+        """Obtiene los totales de ventas por día desde los acumulados precalculados.
+
+        Args:
+            desde (Optional[date]): Primer día del rango (inclusive).
+            hasta (Optional[date]): Último día del rango (inclusive).
+
+        Returns:
+            List[ResumenDiario]: Acumulados ordenados por día.
+        """
+        resumenes: ResumenesVentas = self.data_manager.get_component(ResumenesVentas)
+        return resumenes.get_diarios(desde, hasta)
+
+    def get_resumenes_mensuales(
+        self, desde: Optional[date] = None, hasta: Optional[date] = None
+    ) -> List[ResumenMensual]:
+        """Obtiene los totales de ventas por mes desde los acumulados precalculados.
+
+        Args:
+            desde (Optional[date]): Fecha dentro del primer mes del rango (inclusive).
+            hasta (Optional[date]): Fecha dentro del último mes del rango (inclusive).
+
+        Returns:
+            List[ResumenMensual]: Acumulados ordenados por mes.
+        """
+        resumenes: ResumenesVentas = self.data_manager.get_component(ResumenesVentas)
+        return resumenes.get_mensuales(desde, hasta)
+
+    def get_venta(self, venta_id: int) -> DetalleVenta:
+        """Obtiene una venta con sus productos a través del índice de ventas.
+
+        Args:
+            venta_id (int): Identificador de la venta.
+
+        Returns:
+            DetalleVenta: La venta y sus líneas con el nombre de cada producto.
+
+        Raises:
+            ValueError: Si la venta no existe.
+        """
+        indice: VentasIndex = self.data_manager.get_component(VentasIndex)
+        venta = indice.get_venta(venta_id)
+        if venta is None:
+            raise ValueError(f'Venta {venta_id} no existe')
+        lineas = [
+            LineaVenta(
+                id_producto=linea.id_producto,
+                nombre=indice.get_nombre_producto(linea.id_producto),
+                cantidad=linea.cantidad,
+            )
+            for linea in indice.get_lineas(venta_id)
+        ]
+        return DetalleVenta(venta=venta, lineas=lineas)
+
+    def update_venta(self, venta_id: int, data: Dict[str, Any]) -> Venta:
+        """Actualiza los campos editables de una venta.
+
+        Args:
+            venta_id (int): Identificador de la venta.
+            data (Dict[str, Any]): Campos a actualizar ('fecha', 'total', 'ganancia').
+
+        Returns:
+            Venta: La venta actualizada.
+
+        Raises:
+            ValueError: Si la venta no existe o se intenta modificar un campo inválido.
+        """
+        editables = {f.name for f in fields(Venta)} - {'id'}
+        invalidos = set(data) - editables
+        if invalidos:
+            raise ValueError(f'Campos no editables en la venta: {sorted(invalidos)}')
+        return self.data_manager.put_data(Venta, venta_id, data)
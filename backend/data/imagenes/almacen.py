@@ -0,0 +1,312 @@
+# backend/data/imagenes/almacen.py
+import hashlib
+import importlib.util
+import os
+import queue
+import re
+import shutil
+import tempfile
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Set
+
+from backend.app.enums.imagenes import Imagenes
+from backend.app.enums.manager import DataEvents
+from backend.models.producto import Producto
+
+# Opcional: sin Pillow no hay miniaturas y se muestran las imágenes originales. Se
+# importa en el hilo de miniaturas para no cargarlo al arrancar.
+PILLOW = importlib.util.find_spec('PIL') is not None
+
+# Nombre de una imagen guardada por el almacén: hash SHA-256 del contenido y extensión
+NOMBRE_IMAGEN = re.compile(r'^[0-9a-f]{64}\.(jpg|jpeg|png|gif|bmp)$')
+
+logger = logging.getLogger(__name__)
+
+
+def es_nombre_imagen(nombre: Optional[str]) -> bool:
+    """Indica si `nombre` corresponde a una imagen direccionada por contenido."""
+    return bool(nombre) and NOMBRE_IMAGEN.match(nombre) is not None
+
+
+@contextmanager
+def bloqueo_archivo(ruta: Path, esperar: bool = True) -> Iterator[bool]:
+    """Bloqueo exclusivo entre procesos sobre un archivo (flock, o msvcrt en Windows).
+
+    Args:
+        ruta (Path): Archivo de bloqueo; se crea si no existe.
+        esperar (bool): Esperar a que se libere; con False no espera.
+
+    Yields:
+        bool: True si se obtuvo el bloqueo (siempre, si `esperar`).
+    """
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    with open(ruta, 'a+b') as f:
+        if os.name == 'nt':
+            import msvcrt
+
+            f.seek(0)
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK if esperar else msvcrt.LK_NBLCK, 1)
+            except OSError:
+                if esperar:
+                    raise
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX if esperar else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            # Cerrar el archivo libera el bloqueo
+            yield True
+
+
+class AlmacenImagenes:
+    """Imágenes de productos guardadas por el hash de su contenido, con miniaturas.
+
+    Cada imagen se guarda con el SHA-256 de su contenido como nombre: la misma
+    imagen elegida para varios productos se guarda una sola vez, y como un
+    nombre nunca cambia de contenido, las imágenes pueden cachearse sin
+    caducidad. Un hilo en segundo plano genera la miniatura del tamaño de las
+    tarjetas de cada imagen y borra las imágenes que ya ningún producto usa
+    (al reemplazarlas o eliminar el producto).
+
+    Varios procesos pueden compartir el directorio (la interfaz y los workers
+    de la API): guardar y borrar se serializan con un bloqueo de archivo, antes
+    de borrar se comprueba en `productos.csv` que ningún producto use la
+    imagen, y una imagen se conserva `Imagenes.GRACIA` segundos desde que se
+    guardó por última vez (su fecha de modificación). La purga completa al
+    iniciar la hace un solo proceso por periodo de gracia.
+
+    Args:
+        data_manager (CSVManager): Manejador de datos al que se suscribe el almacén.
+        directorio (str): Carpeta de las imágenes originales.
+        miniaturas (str): Carpeta de las miniaturas.
+
+    Note:
+        - Se obtiene con `data_manager.get_component(AlmacenImagenes)`.
+        - Sin Pillow instalado no se generan miniaturas y `miniatura` devuelve
+          la imagen original.
+        - Solo se borran imágenes guardadas por el almacén; las anteriores
+          (nombradas con UUID) se conservan.
+    """
+
+    def __init__(
+        self,
+        data_manager,
+        directorio: str = Imagenes.DIRECTORIO,
+        miniaturas: str = Imagenes.MINIATURAS,
+    ):
+        self.data_manager = data_manager
+        self.directorio = Path(directorio)
+        self.miniaturas = Path(miniaturas)
+        self.__bloqueo = self.directorio / Imagenes.BLOQUEO
+        self.__lock = threading.Lock()
+        self.__imagenes: Dict[int, str] = {}
+        self.__usos: Dict[str, int] = {}
+        self.__pendientes: Set[str] = set()
+        self.__tareas: 'queue.Queue[Callable[[], None]]' = queue.Queue()
+
+        for producto in self.data_manager.get_data(Producto):
+            self.__asignar(producto.id, producto.imagen_ruta)
+        self.data_manager.subscribe(Producto, self.__on_producto)
+        threading.Thread(target=self.__trabajar, name='imagenes', daemon=True).start()
+        self.__tareas.put(self.__purgar)
+
+    def guardar(self, ruta_origen: str) -> str:
+        """Guarda una imagen en el almacén y encola la generación de su miniatura.
+
+        Args:
+            ruta_origen (str): Ruta del archivo elegido por el usuario.
+
+        Returns:
+            str: Nombre de la imagen en el almacén, a guardar en `Producto.imagen_ruta`.
+
+        Raises:
+            ValueError: Si la extensión no es de una imagen admitida.
+        """
+        extension = Path(ruta_origen).suffix.lower()
+        if extension not in Imagenes.EXTENSIONES:
+            raise ValueError(f'Formato de imagen no admitido: {extension or "sin extensión"}')
+
+        resumen = hashlib.sha256()
+        with open(ruta_origen, 'rb') as f:
+            for bloque in iter(lambda: f.read(1 << 16), b''):
+                resumen.update(bloque)
+        nombre = f'{resumen.hexdigest()}{extension}'
+
+        destino = self.directorio / nombre
+        with bloqueo_archivo(self.__bloqueo):
+            if destino.exists():
+                # Protege la imagen del borrado de huérfanas hasta que un producto la use
+                os.utime(destino)
+            else:
+                with open(ruta_origen, 'rb') as origen:
+                    self.__escribir(destino, lambda f: shutil.copyfileobj(origen, f))
+        self.__encolar_miniatura(nombre)
+        return nombre
+
+    def miniatura(self, nombre: str) -> str:
+        """Ruta de la imagen a mostrar en una tarjeta de producto.
+
+        Args:
+            nombre (str): Nombre de la imagen (`Producto.imagen_ruta`).
+
+        Returns:
+            str: Ruta de la miniatura si ya existe; si no, la de la original (y la
+                miniatura se encola para la próxima vez).
+        """
+        miniatura = self.miniaturas / nombre
+        if miniatura.exists():
+            return miniatura.as_posix()
+        self.__encolar_miniatura(nombre)
+        return (self.directorio / nombre).as_posix()
+
+    def ruta(self, nombre: str, miniatura: bool = False) -> Optional[Path]:
+        """Archivo de una imagen del almacén, o None si el nombre no es válido o no existe.
+
+        Args:
+            nombre (str): Nombre de la imagen.
+            miniatura (bool): Buscar la miniatura en lugar de la original.
+        """
+        if not es_nombre_imagen(nombre):
+            return None
+        ruta = (self.miniaturas if miniatura else self.directorio) / nombre
+        return ruta if ruta.is_file() else None
+
+    def __encolar_miniatura(self, nombre: str):
+        if not PILLOW:
+            return
+        with self.__lock:
+            if nombre in self.__pendientes:
+                return
+            self.__pendientes.add(nombre)
+        self.__tareas.put(lambda: self.__generar_miniatura(nombre))
+
+    def __trabajar(self):
+        while True:
+            tarea = self.__tareas.get()
+            try:
+                tarea()
+            except Exception:
+                logger.exception('Error procesando imágenes')
+
+    def __generar_miniatura(self, nombre: str):
+        from PIL import Image, ImageOps
+
+        try:
+            origen = self.directorio / nombre
+            destino = self.miniaturas / nombre
+            if destino.exists() or not origen.exists():
+                return
+            with Image.open(origen) as imagen:
+                imagen = ImageOps.exif_transpose(imagen)
+                # Las tarjetas recortan la imagen para cubrir su área (ImageFit.COVER)
+                imagen = ImageOps.fit(imagen, Imagenes.TAMANO_MINIATURA, Image.LANCZOS)
+                if destino.suffix in ('.jpg', '.jpeg') and imagen.mode != 'RGB':
+                    imagen = imagen.convert('RGB')
+                self.miniaturas.mkdir(parents=True, exist_ok=True)
+                formato = Image.registered_extensions()[destino.suffix]
+                self.__escribir(
+                    destino, lambda f: imagen.save(f, format=formato, quality=Imagenes.CALIDAD_JPEG)
+                )
+        finally:
+            with self.__lock:
+                self.__pendientes.discard(nombre)
+
+    def __purgar(self):
+        """Borra las imágenes del almacén que ningún producto usa.
+
+        Solo la hace el proceso que obtiene el bloqueo, y solo si ningún otro la
+        hizo durante el último periodo de gracia.
+        """
+        if not self.directorio.is_dir():
+            return
+        with bloqueo_archivo(self.__bloqueo, esperar=False) as obtenido:
+            marca = self.directorio / Imagenes.MARCA_PURGA
+            if not obtenido or self.__antiguedad(marca) < Imagenes.GRACIA:
+                return
+            huerfanas = [
+                ruta.name
+                for ruta in self.directorio.iterdir()
+                if es_nombre_imagen(ruta.name) and self.__usos.get(ruta.name, 0) == 0
+            ]
+            self.__borrar(huerfanas)
+            marca.touch()
+
+    def __borrar_si_huerfana(self, nombre: str):
+        if self.__usos.get(nombre, 0) > 0:
+            return
+        with bloqueo_archivo(self.__bloqueo):
+            self.__borrar([nombre])
+
+    def __borrar(self, nombres: List[str]):
+        """Borra las imágenes que ningún producto usa en `productos.csv`; con el bloqueo tomado."""
+        candidatas = [
+            n for n in nombres if self.__antiguedad(self.directorio / n) >= Imagenes.GRACIA
+        ]
+        if not candidatas:
+            return
+        # Otros procesos pudieron asignar la imagen a un producto: se consulta el archivo
+        en_uso = {p.imagen_ruta for p in self.data_manager.get_data(Producto)}
+        for nombre in candidatas:
+            if nombre not in en_uso:
+                (self.directorio / nombre).unlink(missing_ok=True)
+                (self.miniaturas / nombre).unlink(missing_ok=True)
+
+    @staticmethod
+    def __antiguedad(ruta: Path) -> float:
+        """Segundos desde la última modificación de `ruta` (infinito si no existe)."""
+        try:
+            return time.time() - ruta.stat().st_mtime
+        except FileNotFoundError:
+            return float('inf')
+
+    def __asignar(self, producto_id: int, nombre: Optional[str]) -> Optional[str]:
+        """Registra la imagen de un producto; devuelve la anterior si quedó sin usos."""
+        anterior = self.__imagenes.pop(producto_id, None)
+        if nombre:
+            self.__imagenes[producto_id] = nombre
+            self.__usos[nombre] = self.__usos.get(nombre, 0) + 1
+        if anterior:
+            restantes = self.__usos.get(anterior, 0) - 1
+            if restantes > 0:
+                self.__usos[anterior] = restantes
+            else:
+                self.__usos.pop(anterior, None)
+                return anterior
+        return None
+
+    def __on_producto(self, event: str, producto: Producto):
+        # Se ejecuta con el lock del manejador tomado: el borrado se delega al hilo
+        with self.__lock:
+            nombre = None if event == DataEvents.DELETE else producto.imagen_ruta
+            huerfana = self.__asignar(producto.id, nombre)
+        if es_nombre_imagen(huerfana) and huerfana != nombre:
+            self.__tareas.put(lambda: self.__borrar_si_huerfana(huerfana))
+
+    @staticmethod
+    def __escribir(destino: Path, escribir: Callable[[BinaryIO], None]):
+        # Se escribe en un temporal y se renombra: nunca queda una imagen a medio escribir
+        with tempfile.NamedTemporaryFile(
+            dir=destino.parent, suffix=destino.suffix, delete=False
+        ) as temporal:
+            try:
+                escribir(temporal)
+            except BaseException:
+                temporal.close()
+                os.unlink(temporal.name)
+                raise
+        os.replace(temporal.name, destino)
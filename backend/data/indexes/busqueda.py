@@ -0,0 +1,338 @@
+# backend/data/indexes/busqueda.py
+import heapq
+import threading
+import unicodedata
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+
+from backend.app.enums.manager import DataEvents
+from backend.models.deudor import Deudor
+from backend.models.producto import Producto
+
+
+def normalizar(texto: Optional[str]) -> str:
+    """Normaliza un texto para búsqueda: sin tildes, en minúsculas y con espacios simples.
+
+    Args:
+        texto (Optional[str]): Texto a normalizar.
+
+    Returns:
+        str: Texto normalizado, p. ej. 'Café  Molido' -> 'cafe molido'.
+    """
+    descompuesto = unicodedata.normalize('NFKD', texto or '')
+    sin_tildes = ''.join(c for c in descompuesto if not unicodedata.combining(c))
+    return ' '.join(sin_tildes.casefold().split())
+
+
+def trigramas(texto: str) -> Set[str]:
+    """Trigramas de un texto normalizado, con relleno para marcar el inicio y fin de palabra."""
+    relleno = f'  {texto} '
+    return {relleno[i : i + 3] for i in range(len(relleno) - 2)}
+
+
+class BusquedaProductos:
+    """Índice de búsqueda de productos por nombre, por prefijo y por trigramas.
+
+    Los nombres se normalizan (sin tildes ni mayúsculas) y se indexan de tres formas:
+    - Una lista ordenada de `(nombre, id)`: los nombres que empiezan por el
+      término son un tramo contiguo, ya en el orden de los resultados.
+    - Una lista ordenada de `(palabra, id)` para encontrar por búsqueda binaria
+      los productos con alguna palabra que empieza por el término.
+    - Un índice invertido de trigramas a IDs para encontrar los nombres que
+      contienen el término y, si no hay coincidencias exactas, los más parecidos.
+
+    Args:
+        data_manager (CSVManager): Manejador de datos al que se suscribe el índice.
+
+    Note:
+        - Se obtiene con `data_manager.get_component(BusquedaProductos)`.
+        - Orden de los resultados: nombre idéntico, nombre que empieza por el
+          término, palabra que empieza por el término y nombre que lo contiene.
+        - Solo si no hay coincidencias se buscan nombres parecidos (tolerancia a
+          errores de tipeo), que es la consulta más costosa.
+        - Con `limite`, la búsqueda se detiene al reunir ese número de resultados:
+          si bastan los nombres que empiezan por el término no se recorren los
+          demás. `contar` da el total de coincidencias sin ordenarlas.
+    """
+
+    # Proporción mínima de los trigramas del término presentes en un nombre parecido
+    SIMILITUD_MINIMA: float = 0.6
+
+    def __init__(self, data_manager):
+        self.data_manager = data_manager
+        self.__lock = threading.Lock()
+        self.__productos: Dict[int, Producto] = {}
+        self.__nombres: Dict[int, str] = {}
+        self.__por_nombre: List[Tuple[str, int]] = []
+        self.__palabras: List[Tuple[str, int]] = []
+        self.__trigramas: Dict[str, Set[int]] = {}
+        for producto in self.data_manager.get_data(Producto):
+            self.__agregar(producto)
+        self.__por_nombre.sort()
+        self.__palabras.sort()
+        self.data_manager.subscribe(Producto, self.__on_producto)
+
+    def get_producto(self, producto_id: int) -> Optional[Producto]:
+        """Obtiene un producto por su ID en O(1)."""
+        return self.__productos.get(producto_id)
+
+    def buscar(self, termino: str, limite: Optional[int] = None) -> List[Producto]:
+        """Busca productos por nombre y los devuelve ordenados por relevancia.
+
+        Args:
+            termino (str): Texto buscado; sin término se devuelven todos por ID.
+            limite (Optional[int]): Número máximo de resultados.
+
+        Returns:
+            List[Producto]: Productos coincidentes, del más al menos relevante.
+        """
+        termino = normalizar(termino)
+        with self.__lock:
+            if not termino:
+                if limite is None:
+                    ids = sorted(self.__productos)
+                else:
+                    ids = heapq.nsmallest(limite, self.__productos)
+                return [self.__productos[i] for i in ids]
+            if limite is not None:
+                return [self.__productos[i] for i in self.__primeros(termino, limite)]
+
+            puntajes: Dict[int, Tuple[int, float]] = {}
+            for producto_id in self.__por_prefijo(termino):
+                nombre = self.__nombres[producto_id]
+                rango = 0 if nombre == termino else 1 if nombre.startswith(termino) else 2
+                puntajes[producto_id] = (rango, 0.0)
+            if len(termino) >= 3:
+                for producto_id in self.__por_contenido(termino):
+                    puntajes.setdefault(producto_id, (3, 0.0))
+                if not puntajes:
+                    # Sin coincidencias exactas se recurre a nombres parecidos
+                    for producto_id, similitud in self.__por_similitud(termino).items():
+                        puntajes[producto_id] = (4, -similitud)
+
+            clave = lambda i: (*puntajes[i], self.__nombres[i], i)  # noqa: E731
+            if limite is None:
+                ordenados = sorted(puntajes, key=clave)
+            else:
+                ordenados = heapq.nsmallest(limite, puntajes, key=clave)
+            return [self.__productos[i] for i in ordenados]
+
+    def contar(self, termino: str) -> int:
+        """Número de productos que devolvería `buscar` sin límite, sin ordenarlos."""
+        termino = normalizar(termino)
+        with self.__lock:
+            if not termino:
+                return len(self.__productos)
+            ids = self.__por_prefijo(termino)
+            if len(termino) >= 3:
+                ids = ids | self.__por_contenido(termino)
+                if not ids:
+                    return len(self.__por_similitud(termino))
+            return len(ids)
+
+    def __primeros(self, termino: str, limite: int) -> List[int]:
+        """IDs de los `limite` primeros resultados, en el mismo orden que sin límite."""
+        # Nombre idéntico y nombre que empieza por el término: tramo de la lista de nombres
+        ids = []
+        posicion = bisect_left(self.__por_nombre, (termino,))
+        while len(ids) < limite and posicion < len(self.__por_nombre):
+            nombre, producto_id = self.__por_nombre[posicion]
+            if not nombre.startswith(termino):
+                break
+            ids.append(producto_id)
+            posicion += 1
+        if len(ids) == limite:
+            return ids
+
+        def por_nombre(producto_id: int):
+            return (self.__nombres[producto_id], producto_id)
+
+        # Luego palabra que empieza por el término y nombre que lo contiene, por rango
+        vistos = self.__por_prefijo(termino)
+        restantes = [i for i in vistos if not self.__nombres[i].startswith(termino)]
+        ids += heapq.nsmallest(limite - len(ids), restantes, key=por_nombre)
+        if len(ids) < limite and len(termino) >= 3:
+            restantes = [i for i in self.__por_contenido(termino) if i not in vistos]
+            ids += heapq.nsmallest(limite - len(ids), restantes, key=por_nombre)
+        if not ids and len(termino) >= 3:
+            similitudes = self.__por_similitud(termino)
+            ids = heapq.nsmallest(
+                limite, similitudes, key=lambda i: (-similitudes[i], *por_nombre(i))
+            )
+        return ids
+
+    def __por_prefijo(self, termino: str) -> Set[int]:
+        # Todas las palabras del término deben ser prefijo de alguna palabra del nombre
+        ids: Optional[Set[int]] = None
+        for palabra in termino.split():
+            inicio = bisect_left(self.__palabras, (palabra,))
+            fin = bisect_left(self.__palabras, (palabra + chr(0x10FFFF),), inicio)
+            encontrados = {producto_id for _, producto_id in self.__palabras[inicio:fin]}
+            ids = encontrados if ids is None else ids & encontrados
+            if not ids:
+                return set()
+        return ids or set()
+
+    def __por_contenido(self, termino: str) -> Set[int]:
+        # Candidatos: intersección de los trigramas internos, de la lista más corta a la más larga
+        listas = sorted(
+            (self.__trigramas.get(termino[i : i + 3], set()) for i in range(len(termino) - 2)),
+            key=len,
+        )
+        candidatos = set(listas[0])
+        for ids in listas[1:]:
+            if not candidatos:
+                break
+            candidatos &= ids
+        return {i for i in candidatos if termino in self.__nombres[i]}
+
+    def __por_similitud(self, termino: str) -> Dict[int, float]:
+        trigramas_termino = trigramas(termino)
+        conteo = Counter(
+            producto_id
+            for trigrama in trigramas_termino
+            for producto_id in self.__trigramas.get(trigrama, ())
+        )
+        return {
+            producto_id: compartidos / len(trigramas_termino)
+            for producto_id, compartidos in conteo.items()
+            if compartidos / len(trigramas_termino) >= self.SIMILITUD_MINIMA
+        }
+
+    def __agregar(self, producto: Producto, ordenado: bool = False):
+        nombre = normalizar(producto.nombre)
+        self.__productos[producto.id] = producto
+        self.__nombres[producto.id] = nombre
+        # Al construir el índice se agrega al final y se ordena una sola vez
+        agregar = insort if ordenado else list.append
+        agregar(self.__por_nombre, (nombre, producto.id))
+        for palabra in set(nombre.split()):
+            agregar(self.__palabras, (palabra, producto.id))
+        for trigrama in trigramas(nombre):
+            self.__trigramas.setdefault(trigrama, set()).add(producto.id)
+
+    def __quitar(self, producto_id: int):
+        self.__productos.pop(producto_id, None)
+        nombre = self.__nombres.pop(producto_id, None)
+        if nombre is None:
+            return
+        self.__quitar_clave(self.__por_nombre, (nombre, producto_id))
+        for palabra in set(nombre.split()):
+            self.__quitar_clave(self.__palabras, (palabra, producto_id))
+        for trigrama in trigramas(nombre):
+            ids = self.__trigramas.get(trigrama)
+            if ids is not None:
+                ids.discard(producto_id)
+                if not ids:
+                    del self.__trigramas[trigrama]
+
+    @staticmethod
+    def __quitar_clave(lista: List[Tuple[str, int]], clave: Tuple[str, int]):
+        posicion = bisect_left(lista, clave)
+        if posicion < len(lista) and lista[posicion] == clave:
+            del lista[posicion]
+
+    def __on_producto(self, event: str, producto: Producto):
+        with self.__lock:
+            self.__quitar(producto.id)
+            if event != DataEvents.DELETE:
+                self.__agregar(Producto(**vars(producto)), ordenado=True)
+
+
+class BusquedaDeudores:
+    """Índice de prefijos sobre los nombres normalizados de los deudores.
+
+    Guarda una lista ordenada de `(palabra, id)`; las sugerencias para un texto
+    se obtienen con búsqueda binaria y solo se devuelven las `limite` mejores,
+    sin recorrer ni enviar todos los deudores.
+
+    Args:
+        data_manager (CSVManager): Manejador de datos al que se suscribe el índice.
+
+    Note:
+        - Se obtiene con `data_manager.get_component(BusquedaDeudores)`.
+        - Primero aparecen los nombres que empiezan por el texto y luego los que
+          tienen otra palabra que empieza por él; a igualdad, por orden alfabético.
+    """
+
+    def __init__(self, data_manager):
+        self.data_manager = data_manager
+        self.__lock = threading.Lock()
+        self.__deudores: Dict[int, Deudor] = {}
+        self.__nombres: Dict[int, str] = {}
+        self.__palabras: List[Tuple[str, int]] = []
+        for deudor in self.data_manager.get_data(Deudor):
+            self.__agregar(deudor)
+        self.__palabras.sort()
+        self.data_manager.subscribe(Deudor, self.__on_deudor)
+
+    def get_deudor(self, deudor_id: int) -> Optional[Deudor]:
+        """Obtiene un deudor por su ID en O(1)."""
+        return self.__deudores.get(deudor_id)
+
+    def listar(self) -> List[Deudor]:
+        """Todos los deudores, ordenados por ID."""
+        with self.__lock:
+            return [self.__deudores[i] for i in sorted(self.__deudores)]
+
+    def sugerir(self, texto: str, limite: Optional[int] = 8) -> List[Deudor]:
+        """Sugiere los deudores cuyo nombre coincide con el texto escrito.
+
+        Args:
+            texto (str): Texto escrito; todas sus palabras deben ser prefijo de
+                alguna palabra del nombre.
+            limite (Optional[int]): Número máximo de sugerencias; None para todas.
+
+        Returns:
+            List[Deudor]: Las mejores `limite` sugerencias, de la más a la menos relevante.
+        """
+        texto = normalizar(texto)
+        if not texto:
+            return []
+        with self.__lock:
+            ids: Optional[Set[int]] = None
+            for palabra in texto.split():
+                inicio = bisect_left(self.__palabras, (palabra,))
+                fin = bisect_left(self.__palabras, (palabra + chr(0x10FFFF),), inicio)
+                encontrados = {deudor_id for _, deudor_id in self.__palabras[inicio:fin]}
+                ids = encontrados if ids is None else ids & encontrados
+                if not ids:
+                    return []
+
+            def clave(deudor_id: int):
+                nombre = self.__nombres[deudor_id]
+                return (not nombre.startswith(texto), nombre, deudor_id)
+
+            if limite is None:
+                mejores = sorted(ids, key=clave)
+            else:
+                mejores = heapq.nsmallest(limite, ids, key=clave)
+            return [self.__deudores[i] for i in mejores]
+
+    def __agregar(self, deudor: Deudor, ordenado: bool = False):
+        nombre = normalizar(deudor.nombre)
+        self.__deudores[deudor.id] = deudor
+        self.__nombres[deudor.id] = nombre
+        for palabra in set(nombre.split()):
+            if ordenado:
+                insort(self.__palabras, (palabra, deudor.id))
+            else:
+                self.__palabras.append((palabra, deudor.id))
+
+    def __quitar(self, deudor_id: int):
+        self.__deudores.pop(deudor_id, None)
+        nombre = self.__nombres.pop(deudor_id, None)
+        for palabra in set((nombre or '').split()):
+            posicion = bisect_left(self.__palabras, (palabra, deudor_id))
+            if posicion < len(self.__palabras) and self.__palabras[posicion] == (
+                palabra,
+                deudor_id,
+            ):
+                del self.__palabras[posicion]
+
+    def __on_deudor(self, event: str, deudor: Deudor):
+        with self.__lock:
+            self.__quitar(deudor.id)
+            if event != DataEvents.DELETE:
+                self.__agregar(Deudor(**vars(deudor)), ordenado=True)
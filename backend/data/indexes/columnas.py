@@ -0,0 +1,168 @@
+# backend/data/indexes/columnas.py
+import threading
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+import numpy as np
+
+from backend.app.enums.manager import DataEvents
+from backend.models.producto import Producto
+from backend.models.venta_producto import VentaProducto
+
+
+class ColumnasVentas:
+    """Almacenamiento columnar en NumPy de las líneas de venta y los productos.
+
+    Convierte `ventas_productos.csv` en arreglos (`id`, `fecha`, `id_producto`,
+    `cantidad`) una sola vez, leyendo las columnas directamente del CSV con
+    `read_columns` (sin construir un `VentaProducto` por fila y sin bloquear las
+    escrituras mientras dura la carga). Después, cada notificación se aplica
+    sobre los arreglos en la siguiente consulta: las altas se concatenan y las
+    ediciones o bajas se ubican por ID con búsqueda binaria. Los productos se
+    guardan como tablas de búsqueda densas indexadas por ID (`precio[id]`,
+    `coste[id]`) para que el join sea una simple indexación vectorizada.
+
+    Args:
+        data_manager (CSVManager): Manejador de datos al que se suscribe el componente.
+
+    Note:
+        - Se obtiene con `data_manager.get_component(ColumnasVentas)`.
+        - Las notificaciones se encolan desde que empieza la carga: las que la
+          carga ya incluye se vuelven a aplicar sin efecto (un alta de un ID
+          existente lo reemplaza, una baja de un ID ausente se ignora).
+    """
+
+    def __init__(self, data_manager):
+        self.data_manager = data_manager
+        self.__lock = threading.Lock()
+        self.__lineas_cargadas = False
+        self.__productos_cargados = False
+        # Antes de la primera consulta no se encolan notificaciones
+        self.__encolar_lineas = False
+        self.__encolar_productos = False
+        self.__pendientes: Deque[Tuple[str, VentaProducto]] = deque()
+        self.__productos_pendientes: Deque[Tuple[str, Producto]] = deque()
+        self.data_manager.subscribe(VentaProducto, self.__on_venta_producto)
+        self.data_manager.subscribe(Producto, self.__on_producto)
+
+    def lineas(self):
+        """Devuelve las columnas de las líneas de venta.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Arreglos `fecha`
+            (datetime64[us]), `id_producto` (int64) y `cantidad` (int64).
+        """
+        with self.__lock:
+            if not self.__lineas_cargadas:
+                # Lo escrito antes de este punto ya está en el archivo que se lee
+                self.__encolar_lineas = True
+                self.__pendientes.clear()
+                columnas = self.data_manager.read_columns(VentaProducto)
+                self.__id = self.__enteros(columnas['id'])
+                self.__fecha = np.array(columnas['fecha'], dtype='datetime64[us]')
+                self.__id_producto = self.__enteros(columnas['id_producto'])
+                self.__cantidad = self.__enteros(columnas['cantidad'])
+                self.__lineas_cargadas = True
+            self.__aplicar_lineas()
+            return self.__fecha, self.__id_producto, self.__cantidad
+
+    def productos(self):
+        """Devuelve las tablas de búsqueda de productos indexadas por ID.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, List[Optional[str]]]:
+            `existe` (bool), `precio` (int64), `coste` (int64) y los nombres.
+        """
+        with self.__lock:
+            if not self.__productos_cargados:
+                self.__encolar_productos = True
+                self.__productos_pendientes.clear()
+                self.__existe = np.zeros(0, dtype=bool)
+                self.__precio = np.zeros(0, dtype=np.int64)
+                self.__coste = np.zeros(0, dtype=np.int64)
+                self.__nombres: List[Optional[str]] = []
+                for p in self.data_manager.get_data(Producto):
+                    self.__poner_producto(p)
+                self.__productos_cargados = True
+            while self.__productos_pendientes:
+                event, producto = self.__productos_pendientes.popleft()
+                if event == DataEvents.DELETE:
+                    if producto.id < len(self.__existe):
+                        self.__existe[producto.id] = False
+                        self.__nombres[producto.id] = None
+                else:
+                    self.__poner_producto(producto)
+            return self.__existe, self.__precio, self.__coste, self.__nombres
+
+    def __aplicar_lineas(self):
+        """Aplica a los arreglos las notificaciones de líneas encoladas."""
+        altas: List[VentaProducto] = []
+        while self.__pendientes:
+            event, linea = self.__pendientes.popleft()
+            ultimo = altas[-1].id if altas else (self.__id[-1] if len(self.__id) else 0)
+            if event == DataEvents.ADD and linea.id > ultimo:
+                # Las altas llegan con IDs crecientes: se concatenan por lotes
+                altas.append(linea)
+                continue
+            self.__concatenar(altas)
+            altas = []
+            pos = int(np.searchsorted(self.__id, linea.id))
+            existe = pos < len(self.__id) and self.__id[pos] == linea.id
+            if event == DataEvents.DELETE:
+                if existe:
+                    self.__id = np.delete(self.__id, pos)
+                    self.__fecha = np.delete(self.__fecha, pos)
+                    self.__id_producto = np.delete(self.__id_producto, pos)
+                    self.__cantidad = np.delete(self.__cantidad, pos)
+            elif existe:
+                self.__fecha[pos] = np.datetime64(linea.fecha, 'us')
+                self.__id_producto[pos] = linea.id_producto
+                self.__cantidad[pos] = linea.cantidad or 0
+            else:
+                self.__id = np.insert(self.__id, pos, linea.id)
+                self.__fecha = np.insert(self.__fecha, pos, np.datetime64(linea.fecha, 'us'))
+                self.__id_producto = np.insert(self.__id_producto, pos, linea.id_producto)
+                self.__cantidad = np.insert(self.__cantidad, pos, linea.cantidad or 0)
+        self.__concatenar(altas)
+
+    def __concatenar(self, lineas: List[VentaProducto]):
+        if not lineas:
+            return
+        n = len(lineas)
+        self.__id = np.concatenate([self.__id, np.fromiter((x.id for x in lineas), np.int64, n)])
+        fecha = np.array([x.fecha for x in lineas], dtype='datetime64[us]')
+        self.__fecha = np.concatenate([self.__fecha, fecha])
+        id_producto = np.fromiter((x.id_producto for x in lineas), np.int64, n)
+        self.__id_producto = np.concatenate([self.__id_producto, id_producto])
+        cantidad = np.fromiter((x.cantidad or 0 for x in lineas), np.int64, n)
+        self.__cantidad = np.concatenate([self.__cantidad, cantidad])
+
+    def __poner_producto(self, p: Producto):
+        if p.id >= len(self.__existe):
+            # Se crece al doble para que agregar productos uno a uno sea O(1) amortizado
+            tamano = max(p.id + 1, 2 * len(self.__existe))
+            extra = tamano - len(self.__existe)
+            self.__existe = np.concatenate([self.__existe, np.zeros(extra, dtype=bool)])
+            self.__precio = np.concatenate([self.__precio, np.zeros(extra, dtype=np.int64)])
+            self.__coste = np.concatenate([self.__coste, np.zeros(extra, dtype=np.int64)])
+            self.__nombres.extend([None] * extra)
+        self.__existe[p.id] = True
+        self.__precio[p.id] = p.precio or 0
+        self.__coste[p.id] = p.coste or 0
+        self.__nombres[p.id] = p.nombre
+
+    @staticmethod
+    def __enteros(valores: List[str]) -> np.ndarray:
+        try:
+            return np.fromiter(map(int, valores), np.int64, len(valores))
+        except ValueError:
+            # Celdas vacías (columnas agregadas después de escribir las filas)
+            return np.fromiter((int(v) if v else 0 for v in valores), np.int64, len(valores))
+
+    def __on_venta_producto(self, event: str, linea: VentaProducto):
+        if self.__encolar_lineas:
+            self.__pendientes.append((event, linea))
+
+    def __on_producto(self, event: str, producto: Producto):
+        if self.__encolar_productos:
+            self.__productos_pendientes.append((event, producto))
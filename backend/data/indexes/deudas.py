@@ -0,0 +1,78 @@
+# backend/data/indexes/deudas.py
+from bisect import insort
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from backend.app.enums.manager import DataEvents
+from backend.models.abono import Abono
+from backend.models.deuda import Deuda
+
+
+class DeudasIndex:
+    """Índice por deudor (clave foránea `id_deudor`) de deudas y abonos.
+
+    Agrupa las deudas y los abonos de cada deudor y los ordena una sola vez por
+    fecha, de modo que los reportes por deudor recorren listas ya ordenadas en
+    lugar de filtrar las tablas completas.
+
+    Args:
+        data_manager (CSVManager): Manejador de datos al que se suscribe el índice.
+
+    Note:
+        - Se obtiene con `data_manager.get_component(DeudasIndex)`.
+        - Las inserciones se ubican en su posición con búsqueda binaria; las
+          actualizaciones y eliminaciones reconstruyen el índice.
+    """
+
+    def __init__(self, data_manager):
+        self.data_manager = data_manager
+        self.rebuild()
+        self.data_manager.subscribe(Deuda, self.__on_deuda)
+        self.data_manager.subscribe(Abono, self.__on_abono)
+
+    def rebuild(self):
+        """Reconstruye el índice con una lectura de cada tabla y un orden por deudor."""
+        deudas: Dict[int, List[Tuple[datetime, int, Deuda]]] = {}
+        abonos: Dict[int, List[Tuple[datetime, int, Abono]]] = {}
+        for deuda in self.data_manager.get_data(Deuda):
+            deudas.setdefault(deuda.id_deudor, []).append(self.__clave_deuda(deuda))
+        for abono in self.data_manager.get_data(Abono):
+            abonos.setdefault(abono.id_deudor, []).append(self.__clave_abono(abono))
+        for grupo in (*deudas.values(), *abonos.values()):
+            grupo.sort(key=lambda clave: clave[:2])
+        self.__deudas = deudas
+        self.__abonos = abonos
+
+    def deudores(self) -> List[int]:
+        """IDs de los deudores con al menos una deuda o un abono."""
+        return sorted(self.__deudas.keys() | self.__abonos.keys())
+
+    def get_deudas(self, deudor_id: int) -> List[Deuda]:
+        """Deudas de un deudor, de la más antigua a la más reciente."""
+        return [deuda for *_, deuda in self.__deudas.get(deudor_id, [])]
+
+    def get_abonos(self, deudor_id: int) -> List[Abono]:
+        """Abonos de un deudor, del más antiguo al más reciente."""
+        return [abono for *_, abono in self.__abonos.get(deudor_id, [])]
+
+    @staticmethod
+    def __clave_deuda(deuda: Deuda) -> Tuple[datetime, int, Deuda]:
+        return (deuda.creacion_deuda or datetime.min, deuda.id, deuda)
+
+    @staticmethod
+    def __clave_abono(abono: Abono) -> Tuple[datetime, int, Abono]:
+        return (abono.fecha_abono or datetime.min, abono.id, abono)
+
+    def __on_deuda(self, event: str, deuda: Deuda):
+        if event == DataEvents.ADD:
+            grupo = self.__deudas.setdefault(deuda.id_deudor, [])
+            insort(grupo, self.__clave_deuda(deuda), key=lambda clave: clave[:2])
+        else:
+            self.rebuild()
+
+    def __on_abono(self, event: str, abono: Abono):
+        if event == DataEvents.ADD:
+            grupo = self.__abonos.setdefault(abono.id_deudor, [])
+            insort(grupo, self.__clave_abono(abono), key=lambda clave: clave[:2])
+        else:
+            self.rebuild()
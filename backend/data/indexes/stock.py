@@ -0,0 +1,138 @@
+# backend/data/indexes/stock.py
+import threading
+import weakref
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+
+from backend.app.enums.inventario import Inventario
+from backend.app.enums.manager import DataEvents
+from backend.models.producto import Producto
+
+
+@dataclass
+class AlertaStock:
+    """Evento emitido cuando un producto cruza su umbral de reposición.
+
+    Attributes:
+        producto (Producto): Producto con su stock ya actualizado.
+        umbral (int): Umbral de reposición aplicado al producto.
+    """
+
+    producto: Producto
+    umbral: int
+
+
+def umbral_de(producto: Producto) -> int:
+    """Umbral de reposición de un producto (propio o global)."""
+    if producto.stock_minimo is not None:
+        return producto.stock_minimo
+    return Inventario.STOCK_MINIMO
+
+
+class StockIndex:
+    """Índice de productos ordenado por stock y por margen sobre su umbral.
+
+    Mantiene dos listas ordenadas con búsqueda binaria:
+    - `(stock, id)` para obtener los productos con stock disponible.
+    - `(stock - umbral, id)` para obtener los productos en o bajo su umbral
+      de reposición, que son exactamente el prefijo con margen <= 0.
+
+    Cada cambio de stock se aplica en O(log n) (más el desplazamiento de la
+    lista) y, si el producto cruza su umbral hacia abajo, se emite una
+    `AlertaStock` a los suscriptores.
+
+    Args:
+        data_manager (CSVManager): Manejador de datos al que se suscribe el índice.
+
+    Note:
+        - Se obtiene con `data_manager.get_component(StockIndex)`.
+        - Los suscriptores de alertas se guardan con referencias débiles, por lo
+          que las vistas descartadas dejan de recibir alertas sin desuscribirse.
+    """
+
+    def __init__(self, data_manager):
+        self.data_manager = data_manager
+        self.__lock = threading.Lock()
+        self.__alertas: List[weakref.ref] = []
+        self.__productos: Dict[int, Producto] = {}
+        self.__por_stock: List[Tuple[int, int]] = []
+        self.__por_margen: List[Tuple[int, int]] = []
+        for producto in self.data_manager.get_data(Producto):
+            self.__agregar(producto, ordenado=False)
+        # Se ordena una sola vez en lugar de insertar cada producto en su posición
+        self.__por_stock.sort()
+        self.__por_margen.sort()
+        self.data_manager.subscribe(Producto, self.__on_producto)
+
+    def subscribe_alertas(self, listener: Callable[[AlertaStock], None]):
+        """Registra una función que recibe las alertas de stock bajo.
+
+        Args:
+            listener (Callable[[AlertaStock], None]): Función o método a notificar.
+        """
+        referencia = (
+            weakref.WeakMethod(listener) if hasattr(listener, '__self__') else weakref.ref(listener)
+        )
+        with self.__lock:
+            self.__alertas.append(referencia)
+
+    def disponibles(self) -> List[Producto]:
+        """Productos con stock mayor a 0, ordenados por ID."""
+        with self.__lock:
+            inicio = bisect_right(self.__por_stock, (0, float('inf')))
+            ids = [producto_id for _, producto_id in self.__por_stock[inicio:]]
+            return [self.__productos[producto_id] for producto_id in sorted(ids)]
+
+    def bajo_umbral(self) -> List[Producto]:
+        """Productos con stock en o bajo su umbral, del más urgente al menos urgente."""
+        with self.__lock:
+            fin = bisect_right(self.__por_margen, (0, float('inf')))
+            return [self.__productos[producto_id] for _, producto_id in self.__por_margen[:fin]]
+
+    def __agregar(self, producto: Producto, ordenado: bool = True):
+        self.__productos[producto.id] = producto
+        claves = (
+            (self.__por_stock, (producto.stock or 0, producto.id)),
+            (self.__por_margen, ((producto.stock or 0) - umbral_de(producto), producto.id)),
+        )
+        for lista, clave in claves:
+            if ordenado:
+                insort(lista, clave)
+            else:
+                lista.append(clave)
+
+    def __quitar(self, producto_id: int) -> Producto:
+        producto = self.__productos.pop(producto_id, None)
+        if producto is not None:
+            self.__quitar_clave(self.__por_stock, (producto.stock or 0, producto.id))
+            self.__quitar_clave(
+                self.__por_margen, ((producto.stock or 0) - umbral_de(producto), producto.id)
+            )
+        return producto
+
+    @staticmethod
+    def __quitar_clave(lista: List[Tuple[int, int]], clave: Tuple[int, int]):
+        posicion = bisect_left(lista, clave)
+        if posicion < len(lista) and lista[posicion] == clave:
+            del lista[posicion]
+
+    def __on_producto(self, event: str, producto: Producto):
+        with self.__lock:
+            anterior = self.__quitar(producto.id)
+            # Se guarda una copia: las claves no deben cambiar fuera del índice
+            actual = Producto(**vars(producto))
+            if event != DataEvents.DELETE:
+                self.__agregar(actual)
+            cruzo_umbral = (
+                event != DataEvents.DELETE
+                and (actual.stock or 0) <= umbral_de(actual)
+                and (anterior is None or (anterior.stock or 0) > umbral_de(anterior))
+            )
+            listeners = [referencia() for referencia in self.__alertas]
+            self.__alertas = [r for r, listener in zip(self.__alertas, listeners) if listener]
+        if cruzo_umbral:
+            alerta = AlertaStock(producto=actual, umbral=umbral_de(actual))
+            for listener in listeners:
+                if listener:
+                    listener(alerta)
@@ -0,0 +1,149 @@
+# backend/data/indexes/ventas.py
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from backend.app.enums.manager import DataEvents
+from backend.models.producto import Producto
+from backend.models.venta import Venta
+from backend.models.venta_producto import VentaProducto
+
+ClaveVenta = Tuple[datetime, int]
+
+
+class VentasIndex:
+    """Índice en memoria del historial de ventas.
+
+    Mantiene las ventas ordenadas por `(fecha, id)` para paginar por keyset con
+    búsqueda binaria, las líneas de cada venta agrupadas por `id_venta` y el
+    nombre de cada producto, de modo que consultar el historial no requiere
+    recorrer los CSV completos.
+
+    Args:
+        data_manager (CSVManager): Manejador de datos al que se suscribe el índice.
+
+    Note:
+        - Se obtiene con `data_manager.get_component(VentasIndex)`.
+        - Los nombres de productos eliminados se conservan para el historial.
+    """
+
+    def __init__(self, data_manager):
+        self.data_manager = data_manager
+        self.rebuild()
+        self.data_manager.subscribe(Venta, self.__on_venta)
+        self.data_manager.subscribe(VentaProducto, self.__on_venta_producto)
+        self.data_manager.subscribe(Producto, self.__on_producto)
+
+    def rebuild(self):
+        """Reconstruye el índice con una sola lectura de cada tabla."""
+        self.__ventas: Dict[int, Venta] = {}
+        self.__claves: List[ClaveVenta] = []
+        self.__ids: List[int] = []
+        self.__lineas: Dict[int, List[VentaProducto]] = {}
+        self.__nombres: Dict[int, str] = {}
+
+        for venta in self.data_manager.get_data(Venta):
+            self.__ventas[venta.id] = venta
+            self.__claves.append(self.__clave(venta))
+        self.__claves.sort()
+        self.__ids = sorted(self.__ventas)
+        for linea in self.data_manager.get_data(VentaProducto):
+            self.__lineas.setdefault(linea.id_venta, []).append(linea)
+        for producto in self.data_manager.get_data(Producto):
+            self.__nombres[producto.id] = producto.nombre
+
+    def get_venta(self, venta_id: int) -> Optional[Venta]:
+        """Obtiene una venta por su ID en O(1)."""
+        return self.__ventas.get(venta_id)
+
+    def get_lineas(self, venta_id: int) -> List[VentaProducto]:
+        """Obtiene las líneas (VentaProducto) de una venta en O(1)."""
+        return list(self.__lineas.get(venta_id, []))
+
+    def get_nombre_producto(self, producto_id: int) -> Optional[str]:
+        """Obtiene el nombre de un producto en O(1)."""
+        return self.__nombres.get(producto_id)
+
+    def paginar(
+        self,
+        limite: int,
+        despues_de: Optional[ClaveVenta] = None,
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+    ) -> List[Venta]:
+        """Devuelve una página de ventas, de la más reciente a la más antigua.
+
+        Args:
+            limite (int): Número máximo de ventas a devolver.
+            despues_de (Optional[ClaveVenta]): Clave `(fecha, id)` de la última venta
+                de la página anterior; solo se devuelven ventas anteriores a ella.
+            desde (Optional[datetime]): Fecha mínima (inclusive).
+            hasta (Optional[datetime]): Fecha máxima (inclusive).
+
+        Returns:
+            List[Venta]: Ventas de la página en orden descendente por `(fecha, id)`.
+
+        Note:
+            El costo es O(log n + limite) sin importar la posición de la página.
+        """
+        fin = len(self.__claves)
+        if hasta is not None:
+            fin = bisect_left(self.__claves, (hasta, float('inf')))
+        if despues_de is not None:
+            fin = min(fin, bisect_left(self.__claves, despues_de))
+        inicio = 0
+        if desde is not None:
+            inicio = bisect_left(self.__claves, (desde, float('-inf')))
+        inicio = max(inicio, fin - limite)
+        return [self.__ventas[venta_id] for _, venta_id in reversed(self.__claves[inicio:fin])]
+
+    def posteriores(self, despues_id: int, limite: int) -> List[Venta]:
+        """Devuelve las ventas con ID mayor a `despues_id`, en orden ascendente por ID.
+
+        Args:
+            despues_id (int): Último ID ya recibido; 0 para empezar desde el inicio.
+            limite (int): Número máximo de ventas a devolver.
+
+        Returns:
+            List[Venta]: Ventas siguientes al cursor, de la más antigua a la más nueva.
+
+        Note:
+            Los IDs se asignan de forma creciente, por lo que el ID sirve como
+            cursor de sincronización aunque se editen las fechas de las ventas.
+        """
+        inicio = bisect_right(self.__ids, despues_id)
+        return [self.__ventas[venta_id] for venta_id in self.__ids[inicio : inicio + limite]]
+
+    @staticmethod
+    def __clave(venta: Venta) -> ClaveVenta:
+        return (venta.fecha or datetime.min, venta.id)
+
+    def __quitar_clave(self, clave: ClaveVenta):
+        posicion = bisect_left(self.__claves, clave)
+        if posicion < len(self.__claves) and self.__claves[posicion] == clave:
+            del self.__claves[posicion]
+
+    def __on_venta(self, event: str, venta: Venta):
+        anterior = self.__ventas.pop(venta.id, None)
+        if anterior is not None:
+            self.__quitar_clave(self.__clave(anterior))
+        if event != DataEvents.DELETE:
+            self.__ventas[venta.id] = venta
+            insort(self.__claves, self.__clave(venta))
+            if anterior is None:
+                insort(self.__ids, venta.id)
+        elif anterior is not None:
+            del self.__ids[bisect_left(self.__ids, venta.id)]
+
+    def __on_venta_producto(self, event: str, linea: VentaProducto):
+        if event == DataEvents.ADD:
+            self.__lineas.setdefault(linea.id_venta, []).append(linea)
+            return
+        for lineas in self.__lineas.values():
+            lineas[:] = [actual for actual in lineas if actual.id != linea.id]
+        if event == DataEvents.PUT:
+            self.__lineas.setdefault(linea.id_venta, []).append(linea)
+
+    def __on_producto(self, event: str, producto: Producto):
+        if event != DataEvents.DELETE:
+            self.__nombres[producto.id] = producto.nombre
@@ -0,0 +1,105 @@
+# backend/data/ledgers/idempotencia.py
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Set
+
+from backend.app.enums.idempotencia import Idempotencia
+from backend.models.idempotencia import ClaveIdempotencia
+
+
+class IdempotenciaVentas:
+    """Índice persistido y acotado de claves de idempotencia de ventas.
+
+    Relaciona cada clave enviada por un cliente con la venta que produjo. Un
+    reintento con la misma clave obtiene el ID de la venta original en O(1) y
+    no vuelve a escribir ventas, líneas, deudas ni stock. Mientras la venta
+    original está en curso, los reintentos esperan a que termine.
+
+    Se recuerdan las `max_claves` claves más recientes. Cada venta agrega una
+    sola fila al final de `claves_idempotencia.csv` (`append_data`, sin
+    reescribir el archivo), y el archivo se reescribe con solo las claves
+    recordadas al duplicar ese límite, de modo que la lectura al iniciar
+    también está acotada.
+
+    Args:
+        data_manager (CSVManager): Manejador de datos donde se persisten las claves.
+        max_claves (int): Número de claves recordadas.
+
+    Note:
+        - Se obtiene con `data_manager.get_component(IdempotenciaVentas)`.
+        - Las escrituras se hacen con el lock del manejador tomado antes del
+          propio, en el mismo orden que sus notificaciones.
+    """
+
+    def __init__(self, data_manager, max_claves: int = Idempotencia.MAX_CLAVES):
+        self.data_manager = data_manager
+        self.max_claves = max_claves
+        self.__condicion = threading.Condition()
+        self.__en_curso: Set[str] = set()
+        filas = self.data_manager.get_data(ClaveIdempotencia)
+        self.__filas = len(filas)
+        self.__claves: 'OrderedDict[str, ClaveIdempotencia]' = OrderedDict(
+            (fila.clave, fila) for fila in filas[-max_claves:]
+        )
+
+    def reclamar(
+        self, clave: str, huella: str, espera: float = Idempotencia.ESPERA
+    ) -> Optional[int]:
+        """Reclama una clave antes de registrar la venta.
+
+        Args:
+            clave (str): Clave de idempotencia enviada por el cliente.
+            huella (str): Hash de la solicitud.
+            espera (float): Segundos que se espera a una venta en curso con la misma clave.
+
+        Returns:
+            Optional[int]: ID de la venta ya creada con la clave, o None si la
+                clave queda reclamada y la venta debe registrarse (y luego
+                confirmarse con `registrar` o liberarse con `liberar`).
+
+        Raises:
+            ValueError: Si la clave se usó con otra solicitud o la venta original
+                sigue en curso después de `espera` segundos.
+        """
+        with self.__condicion:
+            if not self.__condicion.wait_for(lambda: clave not in self.__en_curso, espera):
+                raise ValueError('Ya hay una venta en curso con esta clave de idempotencia')
+            registro = self.__claves.get(clave)
+            if registro is None:
+                self.__en_curso.add(clave)
+                return None
+            if registro.huella != huella:
+                raise ValueError('La clave de idempotencia ya se usó con otra venta')
+            return registro.id_venta
+
+    def registrar(self, clave: str, huella: str, venta_id: int):
+        """Persiste la venta creada con una clave reclamada y libera el reclamo.
+
+        Args:
+            clave (str): Clave reclamada con `reclamar`.
+            huella (str): Hash de la solicitud.
+            venta_id (int): ID de la venta registrada.
+        """
+        registro = ClaveIdempotencia(
+            id=-1, clave=clave, huella=huella, id_venta=venta_id, fecha=datetime.now()
+        )
+        with self.data_manager.atomic(), self.__condicion:
+            try:
+                self.data_manager.append_data(registro)
+                self.__filas += 1
+                self.__claves[clave] = registro
+                while len(self.__claves) > self.max_claves:
+                    self.__claves.popitem(last=False)
+                if self.__filas >= 2 * self.max_claves:
+                    self.data_manager.set_data(ClaveIdempotencia, list(self.__claves.values()))
+                    self.__filas = len(self.__claves)
+            finally:
+                self.__en_curso.discard(clave)
+                self.__condicion.notify_all()
+
+    def liberar(self, clave: str):
+        """Libera una clave reclamada cuya venta falló, para que pueda reintentarse."""
+        with self.__condicion:
+            self.__en_curso.discard(clave)
+            self.__condicion.notify_all()
@@ -0,0 +1,199 @@
+# backend/data/ledgers/inventario.py
+import threading
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List
+
+from backend.app.enums.manager import DataEvents
+from backend.models.producto import Producto
+
+
+@dataclass
+class Reserva:
+    """Reserva de stock para una venta en curso.
+
+    Args:
+        id (str): Identificador único de la reserva.
+        items (Dict[int, int]): Cantidad reservada por ID de producto.
+        total (int): Total de la venta calculado con los precios al reservar.
+    """
+
+    id: str
+    items: Dict[int, int] = field(default_factory=dict)
+    total: int = 0
+
+
+class InventarioLedger:
+    """Tabla de stock en memoria con reservas atómicas.
+
+    Mantiene el stock de cada producto y las unidades reservadas por ventas en
+    curso. Todas las operaciones se serializan con un lock, de modo que dos
+    terminales que venden a la vez nunca pueden reservar más unidades de las
+    disponibles. Al confirmar una reserva el stock se vuelve a leer de
+    `productos.csv` con el lock del manejador tomado y se descuenta sobre ese
+    valor, con una única escritura: otro proceso con su propio manejador (la
+    API y la interfaz con PORTALAPP_MODO=procesos) puede haber vendido desde
+    que se cargó la tabla en memoria.
+
+    Args:
+        data_manager (CSVManager): Manejador de datos al que se suscribe el ledger.
+
+    Note:
+        - Se obtiene con `data_manager.get_component(InventarioLedger)`.
+        - Los cambios de productos hechos por otras vías (edición, borrado) se
+          reflejan automáticamente a través de las notificaciones del manejador.
+    """
+
+    def __init__(self, data_manager):
+        self.data_manager = data_manager
+        self.__lock = threading.RLock()
+        self.__productos: Dict[int, Producto] = {}
+        self.__reservado: Dict[int, int] = {}
+        self.__reservas: Dict[str, Reserva] = {}
+        self.rebuild()
+        self.data_manager.subscribe(Producto, self.__on_producto)
+
+    def rebuild(self):
+        """Recarga la tabla de stock desde `productos.csv`."""
+        # Mismo orden de locks que `commit`: primero el del manejador
+        with self.data_manager.atomic(), self.__lock:
+            self.__productos = {p.id: p for p in self.data_manager.get_data(Producto)}
+
+    def disponible(self, producto_id: int) -> int:
+        """Unidades de un producto que aún pueden reservarse.
+
+        Args:
+            producto_id (int): Identificador del producto.
+
+        Returns:
+            int: Stock menos unidades reservadas, 0 si el producto no existe.
+        """
+        with self.__lock:
+            producto = self.__productos.get(producto_id)
+            if not producto:
+                return 0
+            return producto.stock - self.__reservado.get(producto_id, 0)
+
+    def reserve(self, items: List[Dict[str, Any]]) -> Reserva:
+        """Reserva el stock necesario para una venta.
+
+        La reserva es todo o nada: si algún producto no existe o no tiene stock
+        suficiente no se reserva ninguna unidad.
+
+        Args:
+            items (List[Dict[str, Any]]): Productos con 'id_producto' y 'cantidad'.
+
+        Returns:
+            Reserva: La reserva creada, con el total de la venta.
+
+        Raises:
+            ValueError: Si un producto no existe o su stock es insuficiente.
+        """
+        cantidades: Dict[int, int] = {}
+        for item in items:
+            cantidades[item['id_producto']] = (
+                cantidades.get(item['id_producto'], 0) + item['cantidad']
+            )
+
+        with self.__lock:
+            total = 0
+            for producto_id, cantidad in cantidades.items():
+                producto = self.__productos.get(producto_id)
+                if not producto:
+                    raise ValueError(f'Producto {producto_id} no existe')
+                if self.disponible(producto_id) < cantidad:
+                    raise ValueError(f'Stock insuficiente para {producto.nombre}')
+                total += producto.precio * cantidad
+
+            reserva = Reserva(id=str(uuid.uuid4()), items=cantidades, total=total)
+            for producto_id, cantidad in cantidades.items():
+                self.__reservado[producto_id] = self.__reservado.get(producto_id, 0) + cantidad
+            self.__reservas[reserva.id] = reserva
+            return reserva
+
+    def commit(self, reserva: Reserva) -> List[Producto]:
+        """Confirma una reserva descontando el stock leído del archivo, con una sola escritura.
+
+        Args:
+            reserva (Reserva): Reserva obtenida con `reserve`.
+
+        Returns:
+            List[Producto]: Los productos con su stock actualizado.
+
+        Raises:
+            ValueError: Si la reserva ya fue confirmada o liberada, o si otro
+                proceso dejó un producto sin stock suficiente (no se escribe nada).
+        """
+        with self.data_manager.atomic(), self.__lock:
+            return self.__descontar(reserva, self.__validar(reserva))
+
+    @contextmanager
+    def confirmar(self, reserva: Reserva) -> Iterator[None]:
+        """Confirma una reserva junto con las escrituras del bloque (la venta y sus líneas).
+
+        Valida el stock del archivo antes de ejecutar el bloque y lo descuenta al
+        terminarlo, todo con el lock del manejador tomado: si la validación falla
+        no se escribe nada, y si el bloque falla el stock no se descuenta.
+
+        Args:
+            reserva (Reserva): Reserva obtenida con `reserve`.
+
+        Raises:
+            ValueError: Igual que `commit`, antes de ejecutar el bloque.
+        """
+        with self.data_manager.atomic(), self.__lock:
+            updates = self.__validar(reserva)
+            yield
+            self.__descontar(reserva, updates)
+
+    def __validar(self, reserva: Reserva) -> Dict[int, Dict[str, Any]]:
+        """Stock resultante de cada producto según el archivo; requiere ambos locks."""
+        if reserva.id not in self.__reservas:
+            raise ValueError('La reserva ya no está activa')
+        # Stock vigente en el archivo, incluidas las escrituras de otros procesos
+        actuales = {p.id: p for p in self.data_manager.get_data(Producto)}
+        self.__productos = actuales
+        updates = {}
+        for producto_id, cantidad in reserva.items.items():
+            producto = actuales.get(producto_id)
+            if not producto:
+                raise ValueError(f'Producto {producto_id} no existe')
+            if producto.stock < cantidad:
+                raise ValueError(f'Stock insuficiente para {producto.nombre}')
+            updates[producto_id] = {'stock': producto.stock - cantidad}
+        return updates
+
+    def __descontar(self, reserva: Reserva, updates: Dict[int, Dict[str, Any]]) -> List[Producto]:
+        productos = self.data_manager.put_batch(Producto, updates)
+        self.__liberar(reserva)
+        return productos
+
+    def release(self, reserva: Reserva):
+        """Libera una reserva sin modificar el stock.
+
+        Args:
+            reserva (Reserva): Reserva obtenida con `reserve`. Liberar una reserva
+                inactiva no tiene efecto.
+        """
+        with self.__lock:
+            if reserva.id in self.__reservas:
+                self.__liberar(reserva)
+
+    def __liberar(self, reserva: Reserva):
+        for producto_id, cantidad in reserva.items.items():
+            restante = self.__reservado.get(producto_id, 0) - cantidad
+            if restante > 0:
+                self.__reservado[producto_id] = restante
+            else:
+                self.__reservado.pop(producto_id, None)
+        del self.__reservas[reserva.id]
+
+    def __on_producto(self, event: str, producto: Producto):
+        # Se ejecuta con el lock del manejador tomado; no se toma el lock propio para
+        # no invertir el orden de adquisición respecto a `commit` (reemplazar una
+        # entrada del diccionario es atómico).
+        if event == DataEvents.DELETE:
+            self.__productos.pop(producto.id, None)
+        else:
+            self.__productos[producto.id] = producto
@@ -0,0 +1,253 @@
+# backend/data/ledgers/resumenes.py
+import logging
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime
+from typing import Callable, Dict, List, Optional, Type
+
+from backend.app.enums.manager import DataEvents
+from backend.constants.application import __MAIN__
+from backend.models.resumen import ResumenDiario, ResumenMensual, ResumenVentas
+from backend.models.venta import Venta
+from backend.models.venta_producto import VentaProducto
+
+logger = logging.getLogger(__name__)
+
+
+def periodo_diario(fecha: datetime) -> str:
+    """Clave del periodo diario de una fecha ('YYYY-MM-DD')."""
+    return fecha.strftime('%Y-%m-%d')
+
+
+def periodo_mensual(fecha: datetime) -> str:
+    """Clave del periodo mensual de una fecha ('YYYY-MM')."""
+    return fecha.strftime('%Y-%m')
+
+
+@dataclass
+class TablaResumenes:
+    """Acumulados de una granularidad (días o meses) y hasta dónde cubren el historial.
+
+    Attributes:
+        model_class (Type[ResumenVentas]): Modelo con el que se persisten.
+        periodo (Callable[[datetime], str]): Clave del periodo de una fecha.
+        resumenes (Dict[str, ResumenVentas]): Acumulado vigente de cada periodo.
+        filas (int): Filas del CSV, contando las versiones anteriores de cada periodo.
+        ultima_venta (int): ID de la última venta acumulada.
+        ultima_linea (int): ID de la última línea (VentaProducto) acumulada.
+    """
+
+    model_class: Type[ResumenVentas]
+    periodo: Callable[[datetime], str]
+    resumenes: Dict[str, ResumenVentas] = field(default_factory=dict)
+    filas: int = 0
+    ultima_venta: int = 0
+    ultima_linea: int = 0
+
+
+class ResumenesVentas:
+    """Acumulados diarios y mensuales de ventas mantenidos de forma incremental.
+
+    Los acumulados se actualizan con las altas de `Venta` y `VentaProducto`
+    que notifica el manejador, sin importar por dónde se escriban (servicio de
+    ventas, `add_batch`, un worker remoto). Cada alta agrega al CSV una fila
+    con el acumulado nuevo de su periodo, en O(1); al cargar, la última fila de
+    cada periodo es la vigente, y el archivo se reescribe con solo las vigentes
+    cuando las versiones anteriores superan `COMPACTAR_FILAS` (o `COMPACTAR_VECES`
+    el número de periodos, si es mayor). Editar o eliminar ventas provoca una
+    reconstrucción completa.
+
+    Cada fila guarda el último ID de venta y de línea acumulados: al crearse, el
+    componente suma las altas escritas mientras no estaba en memoria (p. ej. por
+    un script), leyendo el historial solo si el último ID de las tablas avanzó.
+
+    Args:
+        data_manager (CSVManager): Manejador de datos al que se suscribe el componente.
+
+    Note:
+        - Se obtiene con `data_manager.get_component(ResumenesVentas)`.
+        - Para reparar los acumulados: `python -m backend.data.ledgers.resumenes`.
+    """
+
+    # Versiones anteriores acumuladas a partir de las que se reescribe el CSV con solo
+    # las vigentes: un mínimo fijo, o varias veces los periodos si hay muchos
+    COMPACTAR_FILAS: int = 500
+    COMPACTAR_VECES: int = 4
+
+    def __init__(self, data_manager):
+        self.data_manager = data_manager
+        with self.data_manager.atomic():
+            self.__tablas = [
+                self.__cargar(ResumenDiario, periodo_diario),
+                self.__cargar(ResumenMensual, periodo_mensual),
+            ]
+            if any(
+                tabla.filas and not (tabla.ultima_venta or tabla.ultima_linea)
+                for tabla in self.__tablas
+            ):
+                # Acumulados escritos antes de registrar hasta qué venta cubren
+                self.rebuild()
+            else:
+                self.__ponerse_al_dia()
+            self.data_manager.subscribe(Venta, self.__on_venta)
+            self.data_manager.subscribe(VentaProducto, self.__on_linea)
+
+    def rebuild(self):
+        """Recalcula todos los acumulados desde `ventas.csv` y `ventas_productos.csv`."""
+        with self.data_manager.atomic():
+            for tabla in self.__tablas:
+                tabla.resumenes = {}
+                tabla.ultima_venta = tabla.ultima_linea = 0
+            self.__ponerse_al_dia(forzar=True)
+
+    def get_diarios(
+        self, desde: Optional[date] = None, hasta: Optional[date] = None
+    ) -> List[ResumenDiario]:
+        """Obtiene los acumulados diarios, opcionalmente filtrados por rango (inclusive).
+
+        Returns:
+            List[ResumenDiario]: Acumulados ordenados por día.
+        """
+        inicio = desde.strftime('%Y-%m-%d') if desde else None
+        fin = hasta.strftime('%Y-%m-%d') if hasta else None
+        return self.__filtrar(self.__tablas[0].resumenes, inicio, fin)
+
+    def get_mensuales(
+        self, desde: Optional[date] = None, hasta: Optional[date] = None
+    ) -> List[ResumenMensual]:
+        """Obtiene los acumulados mensuales, opcionalmente filtrados por rango (inclusive).
+
+        Returns:
+            List[ResumenMensual]: Acumulados ordenados por mes.
+        """
+        inicio = desde.strftime('%Y-%m') if desde else None
+        fin = hasta.strftime('%Y-%m') if hasta else None
+        return self.__filtrar(self.__tablas[1].resumenes, inicio, fin)
+
+    def __cargar(
+        self, model_class: Type[ResumenVentas], periodo: Callable[[datetime], str]
+    ) -> TablaResumenes:
+        filas = self.data_manager.get_data(model_class)
+        tabla = TablaResumenes(model_class, periodo, filas=len(filas))
+        for fila in filas:
+            # Las filas están en orden de escritura: la última de cada periodo es la vigente
+            tabla.resumenes[fila.periodo] = fila
+            tabla.ultima_venta = max(tabla.ultima_venta, fila.ultima_venta or 0)
+            tabla.ultima_linea = max(tabla.ultima_linea, fila.ultima_linea or 0)
+        return tabla
+
+    def __ponerse_al_dia(self, forzar: bool = False):
+        """Suma las ventas y líneas posteriores a las ya acumuladas y reescribe las tablas."""
+        ultima_venta = min(tabla.ultima_venta for tabla in self.__tablas)
+        ultima_linea = min(tabla.ultima_linea for tabla in self.__tablas)
+        ventas, lineas = [], []
+        if self.data_manager.get_last_id(Venta) > ultima_venta:
+            ventas = [v for v in self.data_manager.get_data(Venta) if v.id > ultima_venta]
+        if self.data_manager.get_last_id(VentaProducto) > ultima_linea:
+            lineas = [
+                linea
+                for linea in self.data_manager.get_data(VentaProducto)
+                if linea.id > ultima_linea
+            ]
+        if not (ventas or lineas or forzar):
+            return
+
+        fechas = {venta.id: venta.fecha for venta in ventas}
+        for tabla in self.__tablas:
+            for venta in ventas:
+                if venta.id > tabla.ultima_venta:
+                    self.__sumar(
+                        tabla, venta.fecha, ventas=1, total=venta.total, ganancia=venta.ganancia
+                    )
+                    tabla.ultima_venta = venta.id
+            for linea in lineas:
+                if linea.id > tabla.ultima_linea:
+                    # Las unidades cuentan en el periodo de su venta, aunque se haya editado
+                    fecha = fechas.get(linea.id_venta) or linea.fecha or self.__fecha_venta(linea)
+                    self.__sumar(tabla, fecha, unidades=linea.cantidad)
+                    tabla.ultima_linea = linea.id
+            self.__compactar(tabla)
+
+    def __fecha_venta(self, linea: VentaProducto) -> datetime:
+        return self.data_manager.get_data_by_id(Venta, linea.id_venta).fecha
+
+    @staticmethod
+    def __sumar(tabla: TablaResumenes, fecha: datetime, **valores: Optional[int]) -> ResumenVentas:
+        """Reemplaza el acumulado del periodo de `fecha` por uno con `valores` sumados."""
+        periodo = tabla.periodo(fecha)
+        actual = tabla.resumenes.get(periodo) or tabla.model_class(
+            id=-1, periodo=periodo, ventas=0, unidades=0, total=0, ganancia=0
+        )
+        # Se reemplaza en lugar de modificarse: las consultas nunca ven un acumulado a medias
+        resumen = replace(
+            actual,
+            **{campo: getattr(actual, campo) + (valor or 0) for campo, valor in valores.items()},
+        )
+        tabla.resumenes[periodo] = resumen
+        return resumen
+
+    def __guardar(self, tabla: TablaResumenes, resumen: ResumenVentas):
+        """Agrega al CSV la versión nueva de un acumulado, compactando si hace falta."""
+        resumen.ultima_venta = tabla.ultima_venta
+        resumen.ultima_linea = tabla.ultima_linea
+        self.data_manager.append_data(resumen)
+        tabla.filas += 1
+        vigentes = len(tabla.resumenes)
+        if tabla.filas - vigentes >= max(self.COMPACTAR_FILAS, self.COMPACTAR_VECES * vigentes):
+            self.__compactar(tabla)
+
+    def __compactar(self, tabla: TablaResumenes):
+        """Reescribe el CSV de una tabla con solo la fila vigente de cada periodo."""
+        resumenes = sorted(tabla.resumenes.values(), key=lambda r: r.periodo)
+        for resumen in resumenes:
+            resumen.ultima_venta = tabla.ultima_venta
+            resumen.ultima_linea = tabla.ultima_linea
+        self.data_manager.set_data(tabla.model_class, resumenes)
+        tabla.filas = len(resumenes)
+
+    @staticmethod
+    def __filtrar(resumenes: Dict[str, ResumenVentas], inicio: Optional[str], fin: Optional[str]):
+        return sorted(
+            (
+                r
+                for r in list(resumenes.values())
+                if (inicio is None or r.periodo >= inicio) and (fin is None or r.periodo <= fin)
+            ),
+            key=lambda r: r.periodo,
+        )
+
+    def __on_venta(self, event: str, venta: Venta):
+        # Se ejecuta con el lock del manejador tomado, en el mismo orden que la escritura
+        if event != DataEvents.ADD:
+            self.rebuild()
+            return
+        for tabla in self.__tablas:
+            if venta.id > tabla.ultima_venta:
+                tabla.ultima_venta = venta.id
+                resumen = self.__sumar(
+                    tabla, venta.fecha, ventas=1, total=venta.total, ganancia=venta.ganancia
+                )
+                self.__guardar(tabla, resumen)
+
+    def __on_linea(self, event: str, linea: VentaProducto):
+        if event != DataEvents.ADD:
+            self.rebuild()
+            return
+        fecha = linea.fecha
+        for tabla in self.__tablas:
+            if linea.id > tabla.ultima_linea:
+                fecha = fecha or self.__fecha_venta(linea)
+                tabla.ultima_linea = linea.id
+                self.__guardar(tabla, self.__sumar(tabla, fecha, unidades=linea.cantidad))
+
+
+if __name__ == __MAIN__:
+    from backend.data.managers.csv_manager import CSVManager
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    resumenes = CSVManager().get_component(ResumenesVentas)
+    resumenes.rebuild()
+    logger.info(
+        'Acumulados reconstruidos: %d días, %d meses.',
+        len(resumenes.get_diarios()),
+        len(resumenes.get_mensuales()),
+    )
@@ -0,0 +1,117 @@
+# backend/data/ledgers/saldos.py
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from backend.app.enums.manager import DataEvents
+from backend.models.abono import Abono
+from backend.models.deuda import Deuda
+
+
+@dataclass
+class SaldoDeudor:
+    """Saldo materializado de un deudor.
+
+    Args:
+        id_deudor (int): Identificador único del deudor.
+        total_deudas (int): Suma de todas las deudas del deudor.
+        total_abonos (int): Suma de todos los abonos realizados por el deudor.
+        ultimo_movimiento (Optional[datetime]): Fecha de la última deuda o abono registrado.
+
+    Note:
+        - El saldo nunca es negativo, igual que en DeudoresPresenter.saldo_de_deudor
+    """
+
+    id_deudor: int
+    total_deudas: int = 0
+    total_abonos: int = 0
+    ultimo_movimiento: Optional[datetime] = None
+
+    @property
+    def saldo(self) -> int:
+        """Calcula el saldo pendiente del deudor.
+
+        Returns:
+            int: Deudas menos abonos, nunca negativo.
+        """
+        return max(self.total_deudas - self.total_abonos, 0)
+
+    def registrar_movimiento(self, fecha: Optional[datetime]):
+        """Actualiza la fecha del último movimiento si la nueva es posterior."""
+        if fecha and (self.ultimo_movimiento is None or fecha > self.ultimo_movimiento):
+            self.ultimo_movimiento = fecha
+
+
+class SaldosLedger:
+    """Ledger en memoria con el saldo de cada deudor.
+
+    Se construye con una única pasada sobre deudas y abonos y luego se mantiene
+    actualizado de forma incremental escuchando las inserciones del CSVManager,
+    evitando releer `abonos.csv` por cada deudor mostrado.
+
+    Args:
+        data_manager (CSVManager): Manejador de datos al que se suscribe el ledger.
+
+    Note:
+        - Se obtiene con `data_manager.get_component(SaldosLedger)` para compartir
+          una única instancia por manejador.
+        - Las actualizaciones y eliminaciones (poco frecuentes) provocan una
+          reconstrucción completa con `rebuild`.
+    """
+
+    def __init__(self, data_manager):
+        self.data_manager = data_manager
+        self.__saldos: Dict[int, SaldoDeudor] = {}
+        self.rebuild()
+        self.data_manager.subscribe(Deuda, self.__on_deuda)
+        self.data_manager.subscribe(Abono, self.__on_abono)
+
+    def rebuild(self):
+        """Reconstruye todos los saldos desde cero en una sola pasada por tabla."""
+        self.__saldos = {}
+        for deuda in self.data_manager.get_data(Deuda):
+            self.__aplicar_deuda(deuda)
+        for abono in self.data_manager.get_data(Abono):
+            self.__aplicar_abono(abono)
+
+    def get_saldo(self, deudor_id: int) -> SaldoDeudor:
+        """Obtiene el saldo materializado de un deudor.
+
+        Args:
+            deudor_id (int): Identificador único del deudor.
+
+        Returns:
+            SaldoDeudor: Saldo del deudor, vacío si no tiene movimientos.
+        """
+        return self.__saldos.get(deudor_id) or SaldoDeudor(id_deudor=deudor_id)
+
+    def get_saldos(self) -> List[SaldoDeudor]:
+        """Obtiene los saldos de todos los deudores con movimientos."""
+        return list(self.__saldos.values())
+
+    def __get_or_create(self, deudor_id: int) -> SaldoDeudor:
+        if deudor_id not in self.__saldos:
+            self.__saldos[deudor_id] = SaldoDeudor(id_deudor=deudor_id)
+        return self.__saldos[deudor_id]
+
+    def __aplicar_deuda(self, deuda: Deuda):
+        saldo = self.__get_or_create(deuda.id_deudor)
+        saldo.total_deudas += deuda.valor_deuda or 0
+        saldo.registrar_movimiento(deuda.creacion_deuda)
+
+    def __aplicar_abono(self, abono: Abono):
+        saldo = self.__get_or_create(abono.id_deudor)
+        saldo.total_abonos += abono.valor_abono or 0
+        saldo.registrar_movimiento(abono.fecha_abono)
+
+    def __on_deuda(self, event: str, deuda: Deuda):
+        if event == DataEvents.ADD:
+            self.__aplicar_deuda(deuda)
+        else:
+            self.rebuild()
+
+    def __on_abono(self, event: str, abono: Abono):
+        if event == DataEvents.ADD:
+            self.__aplicar_abono(abono)
+        else:
+            self.rebuild()
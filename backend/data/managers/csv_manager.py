@@ -1,10 +1,30 @@
 import csv
+import io
+import os
+import tempfile
+import threading
+import time
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Type, TypeVar, List, Dict, Any, Optional
+from typing import (
+    Type,
+    List,
+    Dict,
+    Any,
+    Callable,
+    BinaryIO,
+    Iterator,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from backend.app.enums.application import Portalapp
 from backend.app.enums.reports import Reports
-from backend.app.enums.manager import CSVModels
+from backend.app.enums.manager import DataEvents, IOEvents
 from datetime import datetime
 
 from backend.models.base_model import T
@@ -14,6 +34,8 @@ from backend.models.venta_producto import VentaProducto
 from backend.models.deudor import Deudor
 from backend.models.venta import Venta
 from backend.models.abono import Abono
+from backend.models.idempotencia import ClaveIdempotencia
+from backend.models.resumen import ResumenDiario, ResumenMensual
 
 from dataclasses import asdict, fields
 
@@ -29,6 +51,14 @@ class CSVManager:
         __data_dir (Path): Ruta del directorio donde se almacenarán los archivos CSV.
         file_map (dict): Mapea clases de modelos con sus rutas de archivos CSV correspondientes.
         column_map (dict): Mapea clases de modelos con sus nombres de columnas.
+        __listeners (dict): Mapea clases de modelos con las funciones a notificar en cada cambio.
+        __components (dict): Componentes compartidos (ledgers, índices) asociados al manejador.
+        __lock (threading.RLock): Serializa las operaciones de lectura-modificación-escritura.
+        __generations (dict): Número de escrituras de cada modelo desde que se creó el manejador.
+        __io_listeners (list): Funciones que reciben la duración de cada lectura y escritura.
+        __pending_files (set): Modelos cuyo archivo aún no se ha abierto.
+        instance_id (str): Identifica esta instancia; las generaciones solo son
+            comparables dentro de una misma instancia.
     """
 
     def __init__(self):
@@ -37,6 +67,15 @@ class CSVManager:
 
         self.file_map = {}
         self.column_map = {}
+        self.__listeners: Dict[Type, List[Callable[[str, Any], None]]] = defaultdict(list)
+        self.__components: Dict[Type, Any] = {}
+        self.__io_listeners: List[Callable[[str, Type, float], None]] = []
+        # Serializa lecturas y escrituras entre sesiones que comparten el manejador
+        self.__lock = threading.RLock()
+        self.__generations: Dict[Type, int] = defaultdict(int)
+        # Modelos cuyo archivo aún no se ha abierto; se crea, si falta, al primer uso
+        self.__pending_files: set = set()
+        self.instance_id = uuid.uuid4().hex[:12]
 
         self.register_model(Producto, 'productos')
         self.register_model(VentaProducto, 'ventas_productos')
@@ -44,32 +83,26 @@ class CSVManager:
         self.register_model(Deuda, 'deudas')
         self.register_model(Deudor, 'deudores')
         self.register_model(Abono, 'abonos')
+        self.register_model(ResumenDiario, 'resumenes_diarios')
+        self.register_model(ResumenMensual, 'resumenes_mensuales')
+        self.register_model(ClaveIdempotencia, 'claves_idempotencia')
 
     def register_model(self, model_class: Type[T], file_name: str):
         """
-        Lee datos de un archivo CSV y los convierte en una lista de instancias de modelo.
+        Registra un modelo y el archivo CSV donde se guardan sus datos.
 
-        Este método realiza los siguientes pasos:
-        - Obtiene la ruta del archivo para la clase de modelo
-        - Abre el archivo CSV con la codificación especificada
-        - Lee los datos utilizando un DictReader
-        - Convierte cada fila en una instancia del modelo
-        - Parsea los valores de cada campo para garantizar el tipo correcto
+        El archivo no se abre al registrar: se crea con sus encabezados, si no
+        existe, la primera vez que se lee o escribe el modelo. Así crear el
+        manejador no toca el disco por cada tabla.
 
         Args:
-            model_class (Type[T]): La clase de modelo utilizada para crear instancias.
-
-        Returns:
-            List[T]: Una lista de instancias de modelo parseadas desde el archivo CSV.
-
-        Raises:
-            IOError: Si hay un problema al leer el archivo.
-            ValueError: Si los datos no pueden ser convertidos al modelo.
+            model_class (Type[T]): La clase de modelo a registrar.
+            file_name (str): Nombre del archivo, sin la extensión `.csv`.
         """
         file_path = self.__data_dir / f'{file_name}.csv'
         self.file_map[model_class] = file_path
         self.column_map[model_class] = [field.name for field in fields(model_class)]
-        self.__init_file(file_path, self.column_map[model_class])
+        self.__pending_files.add(model_class)
 
     def __init_file(self, file_path: Path, columns: List[str]):
         """
@@ -116,17 +149,109 @@ class CSVManager:
             ValueError: Si los datos no pueden convertirse al modelo especificado.
         """
         file_path = self.file_map[model_class]
+        if model_class in self.__pending_files:
+            self.__init_file(file_path, self.column_map[model_class])
+            self.__pending_files.discard(model_class)
+        start = time.perf_counter()
         with open(file_path, 'r', encoding=Reports.ENCODING) as f:
             reader = csv.DictReader(f)
-            return [
-                model_class(
-                    **{
-                        field.name: self.__parse_value(field.type, row[field.name])
-                        for field in fields(model_class)
-                    }
-                )
-                for row in reader
-            ]
+            data = [self.__to_model(model_class, row) for row in reader]
+        self.__notify_io(IOEvents.READ, model_class, time.perf_counter() - start)
+        return data
+
+    def __to_model(self, model_class: Type[T], row: Dict[str, str]) -> T:
+        """Convierte una fila leída con DictReader en una instancia del modelo."""
+        return model_class(
+            **{
+                # Columnas ausentes (archivos previos a un campo nuevo) se leen vacías
+                field.name: self.__parse_value(field.type, row.get(field.name))
+                for field in fields(model_class)
+            }
+        )
+
+    def __iter_file(self, model_class: Type[T], f: BinaryIO, size: int) -> Iterator[T]:
+        """Recorre fila a fila los primeros `size` bytes de un archivo de `__open_snapshot`."""
+
+        def lines() -> Iterator[str]:
+            remaining = size
+            while remaining > 0:
+                line = f.readline(remaining)
+                if not line:
+                    return
+                remaining -= len(line)
+                yield line.decode(Reports.ENCODING)
+
+        with f:
+            for row in csv.DictReader(lines()):
+                yield self.__to_model(model_class, row)
+
+    def __tail(self, model_class: Type[T]) -> Tuple[List[str], int]:
+        """
+        Lee el encabezado y el ID de la última fila de un CSV sin recorrerlo completo.
+
+        Lee bloques desde el final del archivo hasta encontrar una línea completa.
+        Si la última fila no se puede interpretar así (p. ej. un texto con saltos
+        de línea), se recurre a leer el archivo completo.
+
+        Args:
+            model_class (Type[T]): Clase de modelo cuyo archivo se lee.
+
+        Returns:
+            Tuple[List[str], int]: Columnas del encabezado del archivo y el último ID
+                (0 si está vacío).
+        """
+        file_path = self.file_map[model_class]
+        if model_class in self.__pending_files:
+            self.__init_file(file_path, self.column_map[model_class])
+            self.__pending_files.discard(model_class)
+        with open(file_path, 'rb') as f:
+            header = next(csv.reader([f.readline().decode(Reports.ENCODING)]), [])
+            f.seek(0, os.SEEK_END)
+            end = f.tell()
+            size = 4096
+            while True:
+                start = max(0, end - size)
+                f.seek(start)
+                lines = f.read(end - start).splitlines()
+                # La primera línea del bloque puede estar cortada, salvo al inicio del archivo
+                lines = [line for line in (lines if start == 0 else lines[1:]) if line.strip()]
+                if lines or start == 0:
+                    break
+                size *= 2
+        if start == 0 and len(lines) <= 1:
+            return header, 0
+        try:
+            row = next(csv.reader([lines[-1].decode(Reports.ENCODING)]))
+            return header, int(row[header.index('id')])
+        except (ValueError, IndexError, StopIteration):
+            data = self.__read_file(model_class)
+            return header, int(data[-1].id) if data else 0
+
+    def __open_snapshot(self, model_class: Type[T]) -> Tuple[BinaryIO, int]:
+        """
+        Abre el CSV de un modelo para leerlo sin el lock tomado.
+
+        Debe llamarse con el lock tomado. Como `__write_file` reemplaza el archivo
+        en lugar de sobrescribirlo, el archivo abierto conserva el contenido de
+        este momento; lo que `append_data` agregue después queda fuera al leer
+        solo el tamaño devuelto. En Windows el contenido se copia a memoria.
+
+        Args:
+            model_class (Type[T]): Clase de modelo cuyo archivo se abre.
+
+        Returns:
+            Tuple[BinaryIO, int]: El archivo abierto en modo binario y los bytes a leer.
+        """
+        file_path = self.file_map[model_class]
+        if model_class in self.__pending_files:
+            self.__init_file(file_path, self.column_map[model_class])
+            self.__pending_files.discard(model_class)
+        f = open(file_path, 'rb')
+        size = os.fstat(f.fileno()).st_size
+        if os.name == 'nt':
+            with f:
+                f = io.BytesIO(f.read(size))
+        return f, size
 
     def __write_file(self, model_class: Type[T], data: List[T]):
         """
@@ -148,16 +273,42 @@ class CSVManager:
         - Sobrescribe completamente el archivo existente
         - Utiliza la codificación definida en Reports.ENCODING
         - Mantiene el formato CSV con encabezados
+        - Escribe en un archivo temporal y lo renombra sobre el original, de modo
+          que un archivo abierto para leer (ver `read_columns`) no cambia. En
+          Windows, donde no se puede reemplazar un archivo abierto, se escribe
+          sobre el original
 
         Raises:
             IOError: Si existe un problema de escritura en el archivo.
         """
         file_path = self.file_map[model_class]
         columns = self.column_map[model_class]
-        with open(file_path, 'w', newline='', encoding=Reports.ENCODING) as f:
-            writer = csv.DictWriter(f, fieldnames=columns)
-            writer.writeheader()
-            writer.writerows([asdict(item) for item in data])
+        self.__pending_files.discard(model_class)
+        start = time.perf_counter()
+        if os.name == 'nt':
+            f = open(file_path, 'w', newline='', encoding=Reports.ENCODING)
+        else:
+            f = tempfile.NamedTemporaryFile(
+                'w',
+                dir=file_path.parent,
+                suffix='.tmp',
+                delete=False,
+                newline='',
+                encoding=Reports.ENCODING,
+            )
+        try:
+            with f:
+                writer = csv.DictWriter(f, fieldnames=columns)
+                writer.writeheader()
+                writer.writerows([asdict(item) for item in data])
+            if f.name != str(file_path):
+                os.replace(f.name, file_path)
+        except BaseException:
+            if f.name != str(file_path):
+                Path(f.name).unlink(missing_ok=True)
+            raise
+        self.__generations[model_class] += 1
+        self.__notify_io(IOEvents.WRITE, model_class, time.perf_counter() - start)
 
     def __parse_value(self, field_type: Any, value: str) -> Any:
         """
@@ -194,12 +345,128 @@ class CSVManager:
             return datetime.fromisoformat(value)
         elif field_type is str:
             return value  # Retorno sin conversión si es cadena
-        elif hasattr(field_type, '__origin__') and field_type.__origin__ is Optional:
+        elif get_origin(field_type) is Union:
             # Si el tipo es Optional (ejemplo: Optional[int]), procesamos el sub-tipo
-            return self.__parse_value(field_type.__args__[0], value)
+            sub_type = next(arg for arg in get_args(field_type) if arg is not type(None))
+            return self.__parse_value(sub_type, value)
 
         return value
 
+    def subscribe(self, model_class: Type[T], listener: Callable[[str, T], None]):
+        """
+        Registra una función que será notificada cada vez que cambie un modelo.
+
+        Args:
+            model_class (Type[T]): Clase de modelo a observar.
+            listener (Callable[[str, T], None]): Función que recibe el evento
+                (ver DataEvents) y el elemento afectado.
+
+        Comportamiento:
+        - Las notificaciones se emiten después de persistir el cambio en el CSV
+        - Un mismo listener puede registrarse para varios modelos
+        """
+        self.__listeners[model_class].append(listener)
+
+    def observe_io(self, listener: Callable[[str, Type, float], None]):
+        """
+        Registra una función que recibe la duración de cada lectura y escritura de un CSV.
+
+        Args:
+            listener (Callable[[str, Type, float], None]): Función que recibe la
+                operación (ver IOEvents), la clase de modelo y la duración en segundos.
+        """
+        self.__io_listeners.append(listener)
+
+    def __notify_io(self, operation: str, model_class: Type, seconds: float):
+        for listener in self.__io_listeners:
+            listener(operation, model_class, seconds)
+
+    def get_generation(self, model_class: Type[T]) -> int:
+        """
+        Devuelve la generación de un modelo: cuántas veces se ha escrito su CSV.
+
+        Crece de forma monótona con cada escritura y se consulta en memoria, por lo
+        que sirve para saber si una tabla cambió sin leer el archivo.
+
+        Args:
+            model_class (Type[T]): Clase de modelo a consultar.
+
+        Returns:
+            int: Generación actual del modelo (0 si no se ha escrito en esta instancia).
+        """
+        return self.__generations[model_class]
+
+    def get_version(self, model_class: Type[T]) -> Tuple[int, ...]:
+        """
+        Devuelve la versión de un modelo: cambia con cualquier escritura de su CSV,
+        también las de otro proceso con su propio manejador (p. ej. la interfaz y la
+        API con PORTALAPP_MODO=procesos).
+
+        Combina la generación con el estado del archivo (fecha de modificación en
+        nanosegundos, tamaño e inodo, que cambia al reemplazarlo). Solo consulta
+        `os.stat`, sin leer ni bloquear el archivo.
+
+        Args:
+            model_class (Type[T]): Clase de modelo a consultar.
+
+        Returns:
+            Tuple[int, ...]: Versión actual; dos versiones iguales indican que la
+                tabla no cambió entre ambas consultas.
+        """
+        try:
+            estado = os.stat(self.file_map[model_class])
+        except FileNotFoundError:
+            return (self.__generations[model_class], 0, 0, 0)
+        return (
+            self.__generations[model_class],
+            estado.st_mtime_ns,
+            estado.st_size,
+            estado.st_ino,
+        )
+
+    def __notify(self, model_class: Type[T], event: str, item: T):
+        """Notifica a los listeners registrados sobre un cambio en un modelo."""
+        for listener in self.__listeners[model_class]:
+            listener(event, item)
+
+    @contextmanager
+    def atomic(self):
+        """
+        Agrupa varias operaciones bajo el lock del manejador.
+
+        Los componentes que leen y luego escriben en función de lo leído lo usan para
+        que ninguna otra sesión intercale cambios entre ambas operaciones.
+
+        Ejemplo:
+            with csv_manager.atomic():
+                producto = csv_manager.get_data_by_id(Producto, 1)
+                csv_manager.put_data(Producto, 1, {'stock': producto.stock - 1})
+        """
+        with self.__lock:
+            yield self
+
+    def get_component(self, component_class: Type[Any]) -> Any:
+        """
+        Devuelve la instancia compartida de un componente asociado a este manejador.
+
+        Los componentes (ledgers, índices, etc.) reciben el manejador en su constructor
+        y se crean en el primer uso, de modo que todas las vistas y servicios que
+        comparten un CSVManager comparten también sus componentes.
+
+        Args:
+            component_class (Type[Any]): Clase del componente a recuperar.
+
+        Returns:
+            Any: La instancia única del componente para este manejador.
+
+        Ejemplo:
+            saldos = csv_manager.get_component(SaldosLedger)
+        """
+        with self.__lock:
+            if component_class not in self.__components:
+                self.__components[component_class] = component_class(self)
+            return self.__components[component_class]
+
     def add_data(self, item: T) -> T:
         """
         Agrega un nuevo elemento a un archivo CSV, asignando un ID único.
@@ -224,13 +491,170 @@ class CSVManager:
         - Agrega el elemento al final de la lista de datos
         - Guarda todos los datos en el archivo CSV
         """
-        model_class = type(item)
-        data = self.__read_file(model_class)
-        last_id = int(data[-1].id) if data else 0
-        item.id = last_id + 1
-        data.append(item)
-        self.__write_file(model_class, data)
-        return item
+        with self.__lock:
+            model_class = type(item)
+            data = self.__read_file(model_class)
+            last_id = int(data[-1].id) if data else 0
+            item.id = last_id + 1
+            data.append(item)
+            self.__write_file(model_class, data)
+            self.__notify(model_class, DataEvents.ADD, item)
+            return item
+
+    def add_batch(self, items: List[T]) -> List[T]:
+        """
+        Agrega varios elementos de un mismo modelo con una única escritura del CSV.
+
+        Args:
+            items (List[T]): Elementos del mismo modelo a agregar.
+
+        Returns:
+            List[T]: Los elementos agregados con sus IDs recién asignados.
+
+        Proceso:
+        - Lee los datos existentes una sola vez
+        - Asigna IDs consecutivos a partir del último
+        - Escribe el archivo una sola vez y notifica cada inserción
+        """
+        with self.__lock:
+            if not items:
+                return items
+            model_class = type(items[0])
+            data = self.__read_file(model_class)
+            last_id = int(data[-1].id) if data else 0
+            for offset, item in enumerate(items, start=1):
+                item.id = last_id + offset
+            data.extend(items)
+            self.__write_file(model_class, data)
+            for item in items:
+                self.__notify(model_class, DataEvents.ADD, item)
+            return items
+
+    def append_data(self, item: T) -> T:
+        """
+        Agrega un elemento escribiendo solo su fila al final del CSV.
+
+        A diferencia de `add_data` no lee ni reescribe el archivo: el ID se toma
+        de la última fila, por lo que el costo no depende del tamaño de la tabla.
+        Pensado para tablas que solo crecen (registros, versiones de acumulados).
+
+        Args:
+            item (T): El elemento del modelo de datos a agregar.
+
+        Returns:
+            T: El elemento agregado con un ID recién asignado.
+
+        Comportamiento:
+        - Notifica la inserción como `add_data`
+        - Si el encabezado del archivo no coincide con las columnas del modelo
+          (archivo previo a un campo nuevo), se reescribe completo una vez
+        """
+        with self.__lock:
+            model_class = type(item)
+            columns = self.column_map[model_class]
+            header, last_id = self.__tail(model_class)
+            item.id = last_id + 1
+            if header != columns:
+                self.__write_file(model_class, self.__read_file(model_class) + [item])
+            else:
+                start = time.perf_counter()
+                with open(
+                    self.file_map[model_class], 'a', newline='', encoding=Reports.ENCODING
+                ) as f:
+                    csv.DictWriter(f, fieldnames=columns).writerow(asdict(item))
+                self.__generations[model_class] += 1
+                self.__notify_io(IOEvents.WRITE, model_class, time.perf_counter() - start)
+            self.__notify(model_class, DataEvents.ADD, item)
+            return item
+
+    def read_columns(self, model_class: Type[T]) -> Dict[str, List[str]]:
+        """
+        Lee el CSV de un modelo como columnas de texto, sin construir instancias.
+
+        Pensado para cargas masivas (p. ej. arreglos de NumPy): el archivo se abre
+        con el lock tomado pero se lee y divide sin él, por lo que no bloquea las
+        escrituras mientras dura la carga. Devuelve el contenido que tenía la
+        tabla al abrirse.
+
+        Args:
+            model_class (Type[T]): La clase de modelo a leer.
+
+        Returns:
+            Dict[str, List[str]]: Valores de cada columna del archivo, como texto
+                ('' para los vacíos), en el orden de las filas.
+        """
+        with self.__lock:
+            f, size = self.__open_snapshot(model_class)
+        start = time.perf_counter()
+        with f:
+            text = f.read(size).decode(Reports.ENCODING).replace('\r\n', '\n')
+        header_line, _, body = text.partition('\n')
+        header = next(csv.reader([header_line]), [])
+        body = body.rstrip('\n')
+        if '"' not in body and '\n\n' not in body:
+            # Sin comillas ni líneas vacías cada coma separa un valor: se divide de una vez
+            values = body.replace('\n', ',').split(',') if body else []
+        else:
+            values = None
+        if values is None or (header and len(values) % len(header)):
+            rows = [row for row in csv.reader(io.StringIO(body)) if row]
+            values = [row[i] if i < len(row) else '' for row in rows for i in range(len(header))]
+        self.__notify_io(IOEvents.READ, model_class, time.perf_counter() - start)
+        return {name: values[i :: len(header)] for i, name in enumerate(header)}
+
+    def iter_data(self, model_class: Type[T]) -> Iterator[T]:
+        """
+        Recorre los datos de un modelo sin cargar la tabla completa en memoria.
+
+        El archivo se abre con el lock tomado al llamar al método y se lee fila a
+        fila sin él mientras se consume el iterador, por lo que no bloquea las
+        escrituras. Recorre el contenido que tenía la tabla al llamarse.
+
+        Args:
+            model_class (Type[T]): La clase de modelo a recorrer.
+
+        Returns:
+            Iterator[T]: Los elementos del modelo, en el orden del archivo.
+
+        Ejemplo:
+            for producto in csv_manager.iter_data(Producto): ...
+        """
+        with self.__lock:
+            f, size = self.__open_snapshot(model_class)
+        return self.__iter_file(model_class, f, size)
+
+    def get_last_id(self, model_class: Type[T]) -> int:
+        """
+        Devuelve el ID de la última fila de un modelo leyendo solo el final de su CSV.
+
+        Args:
+            model_class (Type[T]): La clase de modelo a consultar.
+
+        Returns:
+            int: El último ID asignado, 0 si la tabla está vacía.
+        """
+        with self.__lock:
+            return self.__tail(model_class)[1]
+
+    def set_data(self, model_class: Type[T], items: List[T]) -> List[T]:
+        """
+        Reemplaza por completo el contenido del CSV de un modelo.
+
+        Pensado para tablas derivadas (acumulados, índices persistidos) que se
+        reconstruyen desde cero. No emite notificaciones por elemento.
+
+        Args:
+            model_class (Type[T]): La clase de modelo cuyo archivo se reemplaza.
+            items (List[T]): Nuevo contenido; los IDs se reasignan desde 1.
+
+        Returns:
+            List[T]: Los elementos escritos con sus IDs asignados.
+        """
+        with self.__lock:
+            for new_id, item in enumerate(items, start=1):
+                item.id = new_id
+            self.__write_file(model_class, items)
+            return items
 
     def get_data(self, model_class: Type[T]) -> List[T]:
         """
@@ -253,7 +677,8 @@ class CSVManager:
         Ejemplo:
             productos = csv_manager.get_data(Producto)  # Recupera todos los productos
         """
-        return self.__read_file(model_class)
+        with self.__lock:
+            return self.__read_file(model_class)
 
     def get_data_by_id(self, model_class: Type[T], id_value: int) -> T:
         """
@@ -276,11 +701,12 @@ class CSVManager:
          - Itera sobre los elementos buscando coincidencia de ID
          - Lanza una excepción si no se encuentra el elemento
         """
-        data = self.__read_file(model_class)
-        for item in data:
-            if item.id == id_value:
-                return item
-        raise ValueError(f'Item with id {id_value} not found in {model_class.__name__}')
+        with self.__lock:
+            data = self.__read_file(model_class)
+            for item in data:
+                if item.id == id_value:
+                    return item
+            raise ValueError(f'Item with id {id_value} not found in {model_class.__name__}')
 
     def put_data(self, model_class: Type[T], id_value: int, updates: Dict[str, Any]) -> T:
         """
@@ -308,18 +734,54 @@ class CSVManager:
         Ejemplo:
             csv_manager.put_data(Producto, 5, {'precio': 1200, 'stock': 50})
         """
-        data = self.__read_file(model_class)
-        updated_item = None
-        for item in data:
-            if item.id == id_value:
-                for field, value in updates.items():
+        with self.__lock:
+            data = self.__read_file(model_class)
+            updated_item = None
+            for item in data:
+                if item.id == id_value:
+                    for field, value in updates.items():
+                        setattr(item, field, value)
+                    updated_item = item
+                    break
+            if updated_item:
+                self.__write_file(model_class, data)
+                self.__notify(model_class, DataEvents.PUT, updated_item)
+                return updated_item
+            raise ValueError(f'Item with id {id_value} not found in {model_class.__name__}')
+
+    def put_batch(self, model_class: Type[T], updates: Dict[int, Dict[str, Any]]) -> List[T]:
+        """
+        Actualiza varios elementos de un modelo con una única escritura del CSV.
+
+        Args:
+            model_class (Type[T]): La clase de modelo de los elementos a actualizar.
+            updates (Dict[int, Dict[str, Any]]): Actualizaciones indexadas por ID.
+
+        Returns:
+            List[T]: Los elementos actualizados.
+
+        Raises:
+            ValueError: Si alguno de los IDs no existe; en ese caso no se escribe nada.
+
+        Ejemplo:
+            csv_manager.put_batch(Producto, {1: {'stock': 4}, 7: {'stock': 0}})
+        """
+        with self.__lock:
+            data = self.__read_file(model_class)
+            by_id = {item.id: item for item in data}
+            missing = [id_value for id_value in updates if id_value not in by_id]
+            if missing:
+                raise ValueError(f'Items with ids {missing} not found in {model_class.__name__}')
+            updated_items = []
+            for id_value, item_updates in updates.items():
+                item = by_id[id_value]
+                for field, value in item_updates.items():
                     setattr(item, field, value)
-                updated_item = item
-                break
-        if updated_item:
+                updated_items.append(item)
             self.__write_file(model_class, data)
-            return updated_item
-        raise ValueError(f'Item with id {id_value} not found in {model_class.__name__}')
+            for item in updated_items:
+                self.__notify(model_class, DataEvents.PUT, item)
+            return updated_items
 
     def delete_data(self, model_class: Type[T], id_value: int) -> bool:
         """
@@ -343,9 +805,12 @@ class CSVManager:
         Ejemplo:
             eliminado = csv_manager.delete_data(Producto, 5)  # Retorna True/False
         """
-        data = self.__read_file(model_class)
-        new_data = [item for item in data if item.id != id_value]
-        if len(new_data) != len(data):
-            self.__write_file(model_class, new_data)
-            return True
-        return False
+        with self.__lock:
+            data = self.__read_file(model_class)
+            new_data = [item for item in data if item.id != id_value]
+            if len(new_data) != len(data):
+                self.__write_file(model_class, new_data)
+                deleted_item = next(item for item in data if item.id == id_value)
+                self.__notify(model_class, DataEvents.DELETE, deleted_item)
+                return True
+            return False
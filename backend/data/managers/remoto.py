@@ -0,0 +1,438 @@
+# backend/data/managers/remoto.py
+import functools
+import logging
+import os
+import queue
+import threading
+import uuid
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type
+
+from backend.app.enums.despliegue import Despliegue
+from backend.constants.application import __MAIN__
+
+logger = logging.getLogger(__name__)
+
+# Operaciones del CSVManager que los workers pueden pedir directamente
+OPERACIONES_MANEJADOR = (
+    'get_data',
+    'get_data_by_id',
+    'iter_data',
+    'get_last_id',
+    'read_columns',
+    'add_data',
+    'add_batch',
+    'append_data',
+    'put_data',
+    'put_batch',
+    'delete_data',
+    'set_data',
+)
+
+
+def clave_compartida() -> bytes:
+    """Secreto con el que se autentican el servidor de datos y los workers.
+
+    Returns:
+        bytes: El valor de la variable de entorno `Despliegue.CLAVE`.
+
+    Raises:
+        RuntimeError: Si la variable no está definida.
+    """
+    clave = os.environ.get(Despliegue.CLAVE)
+    if not clave:
+        raise RuntimeError(
+            f'{Despliegue.CLAVE} debe definirse con el mismo secreto en el servidor de datos '
+            'y en los workers de la API'
+        )
+    return clave.encode()
+
+
+class ServidorDatos:
+    """Proceso único dueño del CSVManager, al que los workers se conectan por IPC.
+
+    Escucha en un socket Unix (o una tubería con nombre en Windows) con
+    `multiprocessing.connection`; cada mensaje es una tupla serializada con
+    pickle. Cada conexión se abre en uno de dos modos:
+
+    - Solicitudes: `('llamar', servicio, metodo, args, kwargs)` ejecuta un método
+      de un servicio (o, con servicio vacío, una de `OPERACIONES_MANEJADOR`). La
+      respuesta incluye las generaciones de las tablas tras la llamada. Si el
+      resultado es un iterador (p. ej. un reporte por bloques) se devuelve un
+      identificador y el cliente lo recorre con `('siguiente', id)`.
+    - Eventos: el servidor envía `('evento', modelo, evento, item, generacion)`
+      por cada cambio notificado por el manejador y `('generaciones', {...})`
+      tras cada llamada, para que los workers mantengan sus componentes.
+
+    Todas las escrituras pasan por los servicios y componentes de este proceso
+    (reservas de inventario, acumulados, saldos), por lo que quedan
+    serializadas en un solo lugar aunque haya varios workers.
+
+    Las conexiones se autentican con un secreto compartido (`authkey`) antes de
+    recibir cualquier mensaje, y el socket se crea ya con permisos solo para el
+    usuario. Los iteradores abiertos por una conexión se descartan al cerrarse.
+
+    Args:
+        data_manager (CSVManager): Manejador de datos que se comparte.
+        servicios (Iterable[type]): Clases de servicio que se exponen; se crean
+            con el manejador y se identifican por su nombre.
+        direccion (str): Ruta del socket Unix o nombre de la tubería.
+        clave (Optional[bytes]): Secreto compartido; por defecto, `clave_compartida()`.
+    """
+
+    def __init__(
+        self,
+        data_manager,
+        servicios: Iterable[type],
+        direccion: str = Despliegue.DIRECCION,
+        clave: Optional[bytes] = None,
+    ):
+        self.data_manager = data_manager
+        self.direccion = direccion
+        self.__clave = clave or clave_compartida()
+        self.__servicios = {servicio.__name__: servicio(data_manager) for servicio in servicios}
+        self.__lock = threading.Lock()
+        self.__suscriptores: List[queue.Queue] = []
+        self.__iteradores: Dict[str, Iterator] = {}
+        self.__publicadas: Dict[type, int] = {}
+        self.__listener: Listener = None
+        for model_class in list(self.data_manager.file_map):
+            self.data_manager.subscribe(
+                model_class, functools.partial(self.__on_cambio, model_class)
+            )
+
+    def servir(self):
+        """Acepta conexiones hasta que se llame a `cerrar`; cada una en su propio hilo."""
+        if os.name != 'nt' and os.path.exists(self.direccion):
+            # Socket de una ejecución anterior
+            os.remove(self.direccion)
+        if os.name == 'nt':
+            self.__listener = Listener(self.direccion, authkey=self.__clave)
+        else:
+            # El socket se crea con permisos 0600 desde el bind, sin un chmod posterior
+            mascara = os.umask(0o177)
+            try:
+                self.__listener = Listener(self.direccion, authkey=self.__clave)
+            finally:
+                os.umask(mascara)
+        while True:
+            try:
+                conexion = self.__listener.accept()
+            except AuthenticationError:
+                logger.warning('Conexión rechazada: clave del servidor de datos incorrecta')
+                continue
+            except OSError:
+                return
+            threading.Thread(target=self.__atender, args=(conexion,), daemon=True).start()
+
+    def cerrar(self):
+        """Deja de aceptar conexiones."""
+        if self.__listener is not None:
+            self.__listener.close()
+
+    def __generaciones(self) -> Dict[type, int]:
+        return {
+            modelo: self.data_manager.get_generation(modelo)
+            for modelo in self.data_manager.file_map
+        }
+
+    def __publicar(self, mensaje: tuple):
+        with self.__lock:
+            for cola in self.__suscriptores:
+                cola.put(mensaje)
+
+    def __on_cambio(self, model_class: type, event: str, item: Any):
+        # Se ejecuta bajo el lock del manejador: solo se encola, el envío es de otro hilo
+        self.__publicar(
+            ('evento', model_class, event, item, self.data_manager.get_generation(model_class))
+        )
+
+    def __atender(self, conexion: Connection):
+        iteradores: Set[str] = set()
+        try:
+            modo = conexion.recv()
+            if modo == ('eventos',):
+                self.__enviar_eventos(conexion)
+            else:
+                self.__responder(conexion, iteradores)
+        except (EOFError, OSError):
+            pass
+        finally:
+            conexion.close()
+            # Iteradores que el worker no terminó de recorrer (p. ej. un worker caído)
+            for iterador_id in iteradores:
+                self.__descartar(iterador_id)
+
+    def __descartar(self, iterador_id: str):
+        with self.__lock:
+            iterador = self.__iteradores.pop(iterador_id, None)
+        if iterador is not None and hasattr(iterador, 'close'):
+            # Cierra el generador y lo que tenga abierto (p. ej. el CSV de `iter_data`)
+            iterador.close()
+
+    def __enviar_eventos(self, conexion: Connection):
+        cola: queue.Queue = queue.Queue()
+        with self.__lock:
+            self.__suscriptores.append(cola)
+        try:
+            conexion.send(('generaciones', self.__generaciones()))
+            while True:
+                conexion.send(cola.get())
+        finally:
+            with self.__lock:
+                self.__suscriptores.remove(cola)
+
+    def __responder(self, conexion: Connection, iteradores: Set[str]):
+        while True:
+            mensaje = conexion.recv()
+            try:
+                respuesta = self.__ejecutar(*mensaje)
+                if respuesta[0] == 'iterador':
+                    iteradores.add(respuesta[1])
+            except Exception as e:
+                if type(e).__module__ != 'builtins':
+                    # Solo se envían excepciones que el worker puede reconstruir
+                    e = RuntimeError(str(e))
+                conexion.send(('error', e, self.__generaciones()))
+                continue
+            generaciones = self.__generaciones()
+            conexion.send(respuesta + (generaciones,))
+            with self.__lock:
+                cambiaron = generaciones != self.__publicadas
+                self.__publicadas = generaciones
+            if cambiaron:
+                # Escrituras sin eventos por elemento (p. ej. set_data)
+                self.__publicar(('generaciones', generaciones))
+
+    def __ejecutar(self, operacion: str, *args) -> tuple:
+        if operacion == 'describir':
+            return ('ok', (self.data_manager.instance_id, dict(self.data_manager.file_map)))
+        if operacion == 'siguiente':
+            iterador_id, cantidad = args
+            with self.__lock:
+                iterador = self.__iteradores.get(iterador_id)
+            bloque = [item for _, item in zip(range(cantidad), iterador or ())]
+            if len(bloque) < cantidad:
+                self.__descartar(iterador_id)
+            return ('ok', bloque)
+        if operacion == 'cerrar':
+            self.__descartar(args[0])
+            return ('ok', None)
+
+        servicio, metodo, args, kwargs = args
+        if servicio:
+            if servicio not in self.__servicios or metodo.startswith('_'):
+                raise ValueError(f'Operación no permitida: {servicio}.{metodo}')
+            funcion = getattr(self.__servicios[servicio], metodo)
+        else:
+            if metodo not in OPERACIONES_MANEJADOR:
+                raise ValueError(f'Operación no permitida: {metodo}')
+            funcion = getattr(self.data_manager, metodo)
+        resultado = funcion(*args, **kwargs)
+        if isinstance(resultado, Iterator):
+            iterador_id = uuid.uuid4().hex
+            with self.__lock:
+                self.__iteradores[iterador_id] = resultado
+            return ('iterador', iterador_id)
+        return ('ok', resultado)
+
+
+class ServicioRemoto:
+    """Representante de un servicio que vive en el `ServidorDatos`.
+
+    Expone los mismos métodos públicos que el servicio original; cada llamada se
+    ejecuta en el servidor y devuelve su resultado (o relanza su excepción).
+
+    Args:
+        manejador (CSVManagerRemoto): Conexión con el servidor de datos.
+        servicio (type): Clase del servicio representado.
+    """
+
+    def __init__(self, manejador: 'CSVManagerRemoto', servicio: type):
+        self.__manejador = manejador
+        self.__nombre = servicio.__name__
+        self.__servicio = servicio
+
+    def __getattr__(self, metodo: str) -> Callable:
+        if metodo.startswith('_') or not hasattr(self.__servicio, metodo):
+            raise AttributeError(metodo)
+
+        def llamar(*args, **kwargs):
+            return self.__manejador.llamar(self.__nombre, metodo, *args, **kwargs)
+
+        return llamar
+
+
+class CSVManagerRemoto:
+    """Sustituto del CSVManager para los workers conectados a un `ServidorDatos`.
+
+    Las lecturas y escrituras se delegan al servidor; los componentes locales
+    (caché de respuestas, feed de cambios) se crean con `get_component` como en
+    el CSVManager y se mantienen con los eventos que envía el servidor. Las
+    generaciones de cada tabla se actualizan con cada respuesta, de modo que un
+    worker ve sus propias escrituras en la siguiente consulta.
+
+    Args:
+        direccion (str): Ruta del socket Unix o nombre de la tubería del servidor.
+        clave (Optional[bytes]): Secreto compartido; por defecto, `clave_compartida()`.
+
+    Attributes:
+        instance_id (str): Identificador de la instancia del servidor.
+        file_map (dict): Modelos registrados en el servidor y sus archivos CSV.
+
+    Note:
+        - Cada hilo usa su propia conexión de solicitudes.
+        - Los listeners se notifican desde el hilo de eventos con el lock del
+          manejador tomado, igual que en el CSVManager.
+    """
+
+    # Elementos pedidos por cada ida y vuelta al recorrer un iterador remoto
+    BLOQUE_ITERADOR: int = 16
+
+    def __init__(self, direccion: str = Despliegue.DIRECCION, clave: Optional[bytes] = None):
+        self.__direccion = direccion
+        self.__clave = clave or clave_compartida()
+        self.__local = threading.local()
+        self.__lock = threading.RLock()
+        self.__listeners: Dict[Type, List[Callable[[str, Any], None]]] = defaultdict(list)
+        self.__components: Dict[Type, Any] = {}
+        self.__generations: Dict[Type, int] = defaultdict(int)
+        self.instance_id, self.file_map = self.__enviar(('describir',))
+        self.column_map = {modelo: None for modelo in self.file_map}
+
+        self.__eventos = Client(self.__direccion, authkey=self.__clave)
+        self.__eventos.send(('eventos',))
+        threading.Thread(target=self.__recibir_eventos, daemon=True).start()
+
+    def servicio(self, servicio: type) -> ServicioRemoto:
+        """Representante del servicio indicado, ejecutado en el servidor."""
+        return ServicioRemoto(self, servicio)
+
+    def llamar(self, servicio: str, metodo: str, *args, **kwargs) -> Any:
+        """Ejecuta un método de un servicio del servidor (vacío: del manejador)."""
+        return self.__enviar(('llamar', servicio, metodo, args, kwargs))
+
+    def subscribe(self, model_class: Type, listener: Callable[[str, Any], None]):
+        """Registra un listener local para los cambios de un modelo en el servidor."""
+        self.__listeners[model_class].append(listener)
+
+    def get_generation(self, model_class: Type) -> int:
+        """Generación del modelo según la última respuesta o evento recibido."""
+        return self.__generations[model_class]
+
+    def get_version(self, model_class: Type) -> Tuple[int, ...]:
+        """Versión del modelo: todas las escrituras pasan por el servidor, que las notifica."""
+        return (self.__generations[model_class],)
+
+    @contextmanager
+    def atomic(self):
+        """Serializa operaciones locales; las escrituras ya se serializan en el servidor."""
+        with self.__lock:
+            yield self
+
+    def get_component(self, component_class: Type[Any]) -> Any:
+        """Devuelve la instancia local compartida de un componente."""
+        with self.__lock:
+            if component_class not in self.__components:
+                self.__components[component_class] = component_class(self)
+            return self.__components[component_class]
+
+    def __getattr__(self, metodo: str) -> Callable:
+        if metodo not in OPERACIONES_MANEJADOR:
+            raise AttributeError(metodo)
+        return functools.partial(self.llamar, '', metodo)
+
+    def __conexion(self) -> Connection:
+        conexion = getattr(self.__local, 'conexion', None)
+        if conexion is None:
+            conexion = Client(self.__direccion, authkey=self.__clave)
+            conexion.send(('solicitudes',))
+            self.__local.conexion = conexion
+        return conexion
+
+    def __enviar(self, mensaje: tuple) -> Any:
+        conexion = self.__conexion()
+        conexion.send(mensaje)
+        estado, valor, generaciones = conexion.recv()
+        self.__actualizar_generaciones(generaciones)
+        if estado == 'error':
+            raise valor
+        if estado == 'iterador':
+            return self.__iterar(valor)
+        return valor
+
+    def __iterar(self, iterador_id: str) -> Iterator:
+        try:
+            while True:
+                bloque = self.__enviar(('siguiente', iterador_id, self.BLOQUE_ITERADOR))
+                yield from bloque
+                if len(bloque) < self.BLOQUE_ITERADOR:
+                    return
+        finally:
+            # Si el cliente deja de leer (p. ej. se corta la descarga) se libera en el
+            # servidor; con una conexión propia, porque el cierre puede ocurrir al
+            # recolectar el generador en medio de otra solicitud de este hilo
+            with Client(self.__direccion, authkey=self.__clave) as conexion:
+                conexion.send(('solicitudes',))
+                conexion.send(('cerrar', iterador_id))
+                conexion.recv()
+
+    def __actualizar_generaciones(self, generaciones: Dict[Type, int]):
+        for modelo, generacion in generaciones.items():
+            if generacion > self.__generations[modelo]:
+                self.__generations[modelo] = generacion
+
+    def __recibir_eventos(self):
+        while True:
+            try:
+                mensaje = self.__eventos.recv()
+            except (EOFError, OSError):
+                return
+            if mensaje[0] == 'generaciones':
+                self.__actualizar_generaciones(mensaje[1])
+                continue
+            _, model_class, event, item, generacion = mensaje
+            with self.__lock:
+                self.__actualizar_generaciones({model_class: generacion})
+                for listener in self.__listeners[model_class]:
+                    try:
+                        listener(event, item)
+                    except Exception:
+                        # Un listener con error no debe detener el hilo de eventos
+                        logger.exception('Error notificando %s de %s', event, model_class.__name__)
+
+
+def servidor_portalapp(data_manager, direccion: str = Despliegue.DIRECCION) -> ServidorDatos:
+    """Servidor de datos con los servicios que usa la API."""
+    from backend.app.services.analitica import AnaliticaService
+    from backend.app.services.deudas import DeudaService
+    from backend.app.services.deudores import DeudorService
+    from backend.app.services.productos import ProductoService
+    from backend.app.services.reportes import ReporteService
+    from backend.app.services.ventas import VentaService
+
+    return ServidorDatos(
+        data_manager,
+        [
+            ProductoService,
+            VentaService,
+            DeudorService,
+            DeudaService,
+            ReporteService,
+            AnaliticaService,
+        ],
+        direccion,
+    )
+
+
+if __name__ == __MAIN__:
+    from backend.data.managers.csv_manager import CSVManager
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    servidor = servidor_portalapp(CSVManager())
+    logger.info('Servidor de datos escuchando en %s', servidor.direccion)
+    servidor.servir()
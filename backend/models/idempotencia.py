@@ -0,0 +1,25 @@
+from datetime import datetime
+from dataclasses import dataclass
+from backend.models.base_model import BaseModel
+
+
+@dataclass
+class ClaveIdempotencia(BaseModel):
+    """Clase que representa una clave de idempotencia ya usada para crear una venta.
+
+    Esta clase hereda de BaseModel y utiliza dataclass para recordar qué venta
+    produjo cada clave enviada por un cliente, de modo que un reintento con la
+    misma clave devuelva la venta original en lugar de registrarla de nuevo.
+
+    Args:
+        clave (str): Clave de idempotencia enviada por el cliente.
+        huella (str): Hash de la solicitud original; detecta claves reutilizadas
+            para ventas distintas.
+        id_venta (int): Identificador de la venta creada con la clave.
+        fecha (datetime): Fecha y hora en que se registró la clave.
+    """
+
+    clave: str
+    huella: str
+    id_venta: int
+    fecha: datetime
@@ -16,6 +16,8 @@ class Producto(BaseModel):
         coste (int): Costo de adquisición o producción del producto.
         imagen_ruta (Optional[str], optional): Ruta al archivo de imagen del
             producto. Por defecto es None.
+        stock_minimo (Optional[int], optional): Umbral de reposición propio del
+            producto. Si es None se usa Inventario.STOCK_MINIMO.
 
     Note:
         - La ganancia por producto se puede calcular como precio - coste
@@ -28,3 +30,4 @@ class Producto(BaseModel):
     stock: int
     coste: int
     imagen_ruta: Optional[str] = None
+    stock_minimo: Optional[int] = None
@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+from typing import Optional
+from backend.models.base_model import BaseModel
+
+
+@dataclass
+class ResumenVentas(BaseModel):
+    """Clase que representa el acumulado de ventas de un periodo.
+
+    Esta clase hereda de BaseModel y utiliza dataclass para guardar los totales
+    precalculados de un periodo, de modo que los reportes no necesiten recorrer
+    todo el historial de ventas.
+
+    Args:
+        periodo (str): Periodo acumulado ('YYYY-MM-DD' para días, 'YYYY-MM' para meses).
+        ventas (int): Número de ventas registradas en el periodo.
+        unidades (int): Unidades de producto vendidas en el periodo.
+        total (int): Suma de `Venta.total` en el periodo.
+        ganancia (int): Suma de `Venta.ganancia` en el periodo.
+        ultima_venta (Optional[int]): ID de la última venta acumulada al escribir la fila.
+        ultima_linea (Optional[int]): ID de la última línea (VentaProducto) acumulada
+            al escribir la fila.
+    """
+
+    periodo: str
+    ventas: int
+    unidades: int
+    total: int
+    ganancia: int
+    ultima_venta: Optional[int] = None
+    ultima_linea: Optional[int] = None
+
+
+@dataclass
+class ResumenDiario(ResumenVentas):
+    """Acumulado de ventas de un día."""
+
+
+@dataclass
+class ResumenMensual(ResumenVentas):
+    """Acumulado de ventas de un mes."""
@@ -1 +1,639 @@
-"""en este apartado se realizaran pruebas del backend"""
\ No newline at end of file
+"""en este apartado se realizaran pruebas del backend"""
+
+import asyncio
+import hashlib
+import json
+import importlib.util
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Tuple
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+from unittest import mock
+
+from pydantic import ValidationError
+
+from backend.app.cache.respuestas import CacheRespuestas
+from backend.app.cambios.productos import CambiosProductos
+from backend.app.enums.application import Portalapp
+from backend.app.enums.imagenes import Imagenes
+from backend.app.enums.reports import Reports
+from backend.app.schemas.productos import ProductoActualizacion
+from backend.app.services.analitica import AnaliticaService
+from backend.app.services.reportes import ReporteService
+from backend.app.services.ventas import VentaService
+from backend.constants.application import __MAIN__
+from backend.data.imagenes.almacen import AlmacenImagenes
+from backend.data.indexes.busqueda import BusquedaProductos
+from backend.data.indexes.columnas import ColumnasVentas
+from backend.data.ledgers.idempotencia import IdempotenciaVentas
+from backend.data.ledgers.inventario import InventarioLedger
+from backend.data.indexes.ventas import VentasIndex
+from backend.data.ledgers.resumenes import ResumenesVentas
+from backend.data.managers.csv_manager import CSVManager
+from backend.data.managers.remoto import CSVManagerRemoto, ServidorDatos
+from backend.models.idempotencia import ClaveIdempotencia
+from backend.models.producto import Producto
+from backend.models.resumen import ResumenDiario
+from backend.models.venta import Venta
+from backend.models.venta_producto import VentaProducto
+
+RAIZ = Path(__file__).resolve().parents[2]
+
+# Segundos que puede añadir api.py al importarse, descontando FastAPI (que
+# domina el arranque); importar Flet por sí solo supera este presupuesto
+PRESUPUESTO_API = 0.3
+
+
+def importar(modulo: str, codigo: str = '') -> Tuple[Dict[str, float], str, Path]:
+    """Importa un módulo en un intérprete nuevo, con un directorio de trabajo vacío.
+
+    Args:
+        modulo (str): Módulo a importar.
+        codigo (str): Código a ejecutar después de importarlo.
+
+    Returns:
+        Tuple[Dict[str, float], str, Path]: Tiempo acumulado de importación de
+            cada módulo en segundos, la salida estándar y el directorio de trabajo.
+    """
+    directorio = Path(tempfile.mkdtemp())
+    (directorio / Portalapp.DATABASE_PATH).mkdir(parents=True)
+    entorno = {**os.environ, 'PYTHONPATH': str(RAIZ)}
+    entorno.pop('PORTALAPP_MODO', None)
+    resultado = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {modulo}\n{codigo}'],
+        cwd=directorio,
+        env=entorno,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    tiempos = {}
+    for linea in resultado.stderr.splitlines():
+        if linea.startswith('import time:') and '|' in linea:
+            _, acumulado, nombre = linea.split('|')
+            if acumulado.strip().isdigit():
+                tiempos[nombre.strip()] = int(acumulado) / 1_000_000
+    return tiempos, resultado.stdout, directorio
+
+
+class TestArranque(unittest.TestCase):
+    def test_api_arranca_sin_flet_ni_interfaz(self):
+        tiempos, _, _ = importar('api')
+        cargados = [m for m in tiempos if m.split('.')[0] in ('flet', 'flet_core', 'frontend')]
+        self.assertEqual(cargados, [])
+
+    def test_api_no_abre_archivos_de_datos(self):
+        _, _, directorio = importar('api')
+        self.assertEqual(list((directorio / Portalapp.DATABASE_PATH).iterdir()), [])
+
+    def test_api_presupuesto_de_importacion(self):
+        tiempos, _, _ = importar('api')
+        propio = tiempos['api'] - tiempos['fastapi']
+        self.assertLessEqual(propio, PRESUPUESTO_API, f'api.py tardó {propio:.3f} s')
+
+    @unittest.skipIf(importlib.util.find_spec('flet') is None, 'flet no está instalado')
+    def test_vistas_se_importan_al_navegar(self):
+        _, salida, _ = importar('frontend.app.portalapp', 'import sys\nprint(*sys.modules)')
+        vistas = [m for m in salida.split() if m.startswith('frontend.') and m.endswith('.view')]
+        self.assertEqual(vistas, [])
+
+
+class ConDatos(unittest.TestCase):
+    """Caso de prueba con un CSVManager sobre un directorio de datos temporal."""
+
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directorio, ignore_errors=True)
+        parche = mock.patch.object(Portalapp, 'DATABASE_PATH', self.directorio)
+        parche.start()
+        self.addCleanup(parche.stop)
+        self.data_manager = CSVManager()
+
+    def producto(self, stock: int, precio: int = 100) -> Producto:
+        return self.data_manager.add_data(
+            Producto(id=-1, nombre=f'P{stock}', precio=precio, coste=precio // 2, stock=stock)
+        )
+
+
+class TestInventario(ConDatos):
+    def setUp(self):
+        super().setUp()
+        self.inventario: InventarioLedger = self.data_manager.get_component(InventarioLedger)
+
+    def test_reservas_concurrentes_no_venden_de_mas(self):
+        producto = self.producto(stock=5)
+        barrera = threading.Barrier(20)
+        reservas, rechazos = [], []
+
+        def reservar():
+            barrera.wait()
+            try:
+                reservas.append(
+                    self.inventario.reserve([{'id_producto': producto.id, 'cantidad': 1}])
+                )
+            except ValueError:
+                rechazos.append(1)
+
+        hilos = [threading.Thread(target=reservar) for _ in range(20)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        self.assertEqual((len(reservas), len(rechazos)), (5, 15))
+        self.assertEqual(self.inventario.disponible(producto.id), 0)
+
+        for reserva in reservas:
+            self.inventario.commit(reserva)
+        self.assertEqual(self.data_manager.get_data_by_id(Producto, producto.id).stock, 0)
+        self.assertEqual(self.inventario.disponible(producto.id), 0)
+
+    def test_reserva_todo_o_nada(self):
+        con_stock, sin_stock = self.producto(stock=3), self.producto(stock=1)
+        with self.assertRaises(ValueError):
+            self.inventario.reserve(
+                [
+                    {'id_producto': con_stock.id, 'cantidad': 2},
+                    {'id_producto': sin_stock.id, 'cantidad': 2},
+                ]
+            )
+        self.assertEqual(self.inventario.disponible(con_stock.id), 3)
+        self.assertEqual(self.inventario.disponible(sin_stock.id), 1)
+
+    def test_reserva_liberada_no_puede_confirmarse(self):
+        producto = self.producto(stock=2)
+        reserva = self.inventario.reserve([{'id_producto': producto.id, 'cantidad': 2}])
+        self.inventario.release(reserva)
+        self.assertEqual(self.inventario.disponible(producto.id), 2)
+        with self.assertRaises(ValueError):
+            self.inventario.commit(reserva)
+
+    def test_venta_fallida_libera_la_reserva(self):
+        producto = self.producto(stock=4)
+        with mock.patch.object(self.data_manager, 'add_batch', side_effect=OSError('disco lleno')):
+            with self.assertRaises(OSError):
+                VentaService(self.data_manager).create_venta(
+                    [{'id_producto': producto.id, 'cantidad': 3}], monto_pagado=300
+                )
+        self.assertEqual(self.inventario.disponible(producto.id), 4)
+        self.assertEqual(self.data_manager.get_data_by_id(Producto, producto.id).stock, 4)
+
+    def test_ventas_de_otro_proceso_no_se_pierden(self):
+        # Con PORTALAPP_MODO=procesos la API y la interfaz tienen cada una su manejador
+        producto = self.producto(stock=5)
+        otro = CSVManager()
+        servicios = [VentaService(self.data_manager), VentaService(otro), VentaService(otro)]
+        for servicio in servicios:
+            servicio.create_venta([{'id_producto': producto.id, 'cantidad': 1}], monto_pagado=100)
+        self.assertEqual(self.data_manager.get_data_by_id(Producto, producto.id).stock, 2)
+
+        # La tabla en memoria de este proceso aún cree que quedan 4
+        reserva = self.inventario.reserve([{'id_producto': producto.id, 'cantidad': 3}])
+        with self.assertRaises(ValueError):
+            self.inventario.commit(reserva)
+        self.assertEqual(self.data_manager.get_data_by_id(Producto, producto.id).stock, 2)
+
+
+class TestPaginacionVentas(ConDatos):
+    def setUp(self):
+        super().setUp()
+        # Tres ventas comparten fecha: el ID desempata el orden
+        fechas = [datetime(2024, 1, dia) for dia in (1, 2, 2, 2, 3, 4)]
+        self.ventas = [
+            self.data_manager.add_data(Venta(id=-1, fecha=fecha, total=10, ganancia=10))
+            for fecha in fechas
+        ]
+        self.servicio = VentaService(self.data_manager)
+
+    def ids(self, ventas):
+        return [venta.id for venta in ventas]
+
+    def test_recorre_todas_las_paginas_sin_repetir(self):
+        esperadas = [6, 5, 4, 3, 2, 1]
+        for limite in (1, 2, 3, 4, 6, 10):
+            recorridas, cursor = [], None
+            while True:
+                pagina = self.servicio.get_ventas(limite, despues_de=cursor)
+                self.assertLessEqual(len(pagina.ventas), limite)
+                recorridas.extend(self.ids(pagina.ventas))
+                cursor = pagina.siguiente
+                if cursor is None:
+                    break
+            self.assertEqual(recorridas, esperadas, f'limite={limite}')
+
+    def test_fecha_repetida_se_desempata_por_id(self):
+        pagina = self.servicio.get_ventas(3, despues_de=(datetime(2024, 1, 3), 5))
+        self.assertEqual(self.ids(pagina.ventas), [4, 3, 2])
+        self.assertEqual(pagina.siguiente, (datetime(2024, 1, 2), 2))
+        siguiente = self.servicio.get_ventas(3, despues_de=pagina.siguiente)
+        self.assertEqual(self.ids(siguiente.ventas), [1])
+
+    def test_siguiente_solo_si_hay_mas_ventas(self):
+        # Con exactamente `limite` ventas restantes no hay página siguiente
+        self.assertIsNone(self.servicio.get_ventas(6).siguiente)
+        pagina = self.servicio.get_ventas(5)
+        self.assertEqual(pagina.siguiente, (datetime(2024, 1, 2), 2))
+        self.assertEqual(self.ids(self.servicio.get_ventas(5, pagina.siguiente).ventas), [1])
+
+    def test_rango_de_fechas_inclusivo(self):
+        indice: VentasIndex = self.data_manager.get_component(VentasIndex)
+        ventas = indice.paginar(10, desde=datetime(2024, 1, 2), hasta=datetime(2024, 1, 3))
+        self.assertEqual(self.ids(ventas), [5, 4, 3, 2])
+        ventas = indice.paginar(2, desde=datetime(2024, 1, 2), hasta=datetime(2024, 1, 3))
+        self.assertEqual(self.ids(ventas), [5, 4])
+
+    def test_indice_sigue_ventas_nuevas_y_editadas(self):
+        indice: VentasIndex = self.data_manager.get_component(VentasIndex)
+        nueva = self.data_manager.add_data(
+            Venta(id=-1, fecha=datetime(2024, 1, 2), total=10, ganancia=10)
+        )
+        self.data_manager.put_data(Venta, 6, {'fecha': datetime(2023, 12, 31)})
+        self.assertEqual(self.ids(indice.paginar(10)), [5, nueva.id, 4, 3, 2, 1, 6])
+
+
+class TestResumenes(ConDatos):
+    def venta(self, data_manager: CSVManager, fecha: datetime, unidades: int):
+        venta = data_manager.add_data(Venta(id=-1, fecha=fecha, total=100, ganancia=100))
+        data_manager.add_batch(
+            [
+                VentaProducto(id=-1, id_venta=venta.id, id_producto=1, cantidad=1, fecha=fecha)
+                for _ in range(unidades)
+            ]
+        )
+
+    def totales(self, resumenes: ResumenesVentas):
+        return [(r.periodo, r.ventas, r.unidades, r.total) for r in resumenes.get_diarios()]
+
+    def test_acumula_altas_escritas_por_cualquier_via(self):
+        resumenes: ResumenesVentas = self.data_manager.get_component(ResumenesVentas)
+        self.venta(self.data_manager, datetime(2024, 5, 1, 10), unidades=2)
+        self.venta(self.data_manager, datetime(2024, 5, 1, 12), unidades=3)
+        self.venta(self.data_manager, datetime(2024, 5, 2), unidades=1)
+        esperados = [('2024-05-01', 2, 5, 200), ('2024-05-02', 1, 1, 100)]
+        self.assertEqual(self.totales(resumenes), esperados)
+        self.assertEqual([(r.ventas, r.unidades) for r in resumenes.get_mensuales()], [(3, 6)])
+
+        # Al recargar, la última fila de cada periodo es la vigente
+        recargados = ResumenesVentas(self.data_manager)
+        self.assertEqual(self.totales(recargados), esperados)
+
+    def test_compacta_al_superar_el_presupuesto_de_filas(self):
+        with mock.patch.object(ResumenesVentas, 'COMPACTAR_FILAS', 6):
+            resumenes: ResumenesVentas = self.data_manager.get_component(ResumenesVentas)
+            for hora in range(5):
+                self.venta(self.data_manager, datetime(2024, 5, 1, hora), unidades=2)
+            # 15 versiones del día: se compactó al llegar a 6 anteriores, y luego se agregaron
+            filas = len(self.data_manager.get_data(ResumenDiario))
+            self.assertLessEqual(filas, 1 + 6)
+            self.assertEqual(self.totales(resumenes), [('2024-05-01', 5, 10, 500)])
+            self.assertEqual(
+                self.totales(ResumenesVentas(self.data_manager)), [('2024-05-01', 5, 10, 500)]
+            )
+
+    def test_suma_ventas_escritas_sin_el_componente(self):
+        self.data_manager.get_component(ResumenesVentas)
+        self.venta(self.data_manager, datetime(2024, 5, 1), unidades=1)
+        # Otro proceso (p. ej. un script) escribe con su propio manejador
+        self.venta(CSVManager(), datetime(2024, 5, 1), unidades=4)
+        resumenes = ResumenesVentas(CSVManager())
+        self.assertEqual(self.totales(resumenes), [('2024-05-01', 2, 5, 200)])
+
+    def test_editar_una_venta_reconstruye(self):
+        resumenes: ResumenesVentas = self.data_manager.get_component(ResumenesVentas)
+        self.venta(self.data_manager, datetime(2024, 5, 1), unidades=1)
+        self.data_manager.put_data(Venta, 1, {'fecha': datetime(2024, 6, 1)})
+        self.assertEqual(self.totales(resumenes), [('2024-06-01', 1, 1, 100)])
+
+
+class TestEsquemas(unittest.TestCase):
+    def test_actualizacion_rechaza_nulos_en_campos_obligatorios(self):
+        for campo in ('nombre', 'precio', 'stock', 'coste', 'stock_minimo'):
+            with self.assertRaises(ValidationError, msg=campo):
+                ProductoActualizacion.model_validate({campo: None})
+        cambios = ProductoActualizacion.model_validate({'precio': 5, 'imagen_ruta': None})
+        self.assertEqual(cambios.model_dump(exclude_unset=True), {'precio': 5, 'imagen_ruta': None})
+
+
+class TestBusqueda(ConDatos):
+    def test_limite_devuelve_los_primeros_del_mismo_orden(self):
+        nombres = ['Café', 'Café Molido', 'Arroz', 'Arroz con café', 'Cafetera', 'Decaf', 'Cafe']
+        self.data_manager.add_batch(
+            [Producto(id=-1, nombre=n, precio=1, coste=1, stock=1) for n in nombres]
+        )
+        busqueda: BusquedaProductos = self.data_manager.get_component(BusquedaProductos)
+        # Idéntico, empieza por el término, palabra que empieza y contenido, y parecidos
+        for termino in ['', 'caf', 'cafe', 'ar', 'arroz caf', 'ecaf', 'cafr']:
+            todos = [p.id for p in busqueda.buscar(termino)]
+            self.assertEqual(busqueda.contar(termino), len(todos))
+            for limite in range(len(nombres) + 1):
+                primeros = [p.id for p in busqueda.buscar(termino, limite)]
+                self.assertEqual(primeros, todos[:limite], (termino, limite))
+
+
+class TestAnalitica(ConDatos):
+    def linea(self, id_producto: int, cantidad: int, fecha: datetime = datetime(2024, 1, 1)):
+        return VentaProducto(
+            id=-1, id_venta=1, id_producto=id_producto, cantidad=cantidad, fecha=fecha
+        )
+
+    def unidades(self, **rango):
+        return AnaliticaService(self.data_manager).unidades_por_producto(**rango).tolist()
+
+    def test_columnas_coinciden_con_el_csv(self):
+        self.data_manager.add_batch([self.linea(1, 2), self.linea(2, 5), self.linea(1, 1)])
+        columnas = self.data_manager.read_columns(VentaProducto)
+        self.assertEqual(columnas['id'], ['1', '2', '3'])
+        self.assertEqual(columnas['cantidad'], ['2', '5', '1'])
+        self.assertEqual(self.unidades(), [0, 3, 5])
+
+    def test_aplica_altas_ediciones_y_bajas_sin_recargar(self):
+        self.data_manager.add_batch([self.linea(1, 2), self.linea(2, 5)])
+        self.unidades()
+        with mock.patch.object(self.data_manager, 'read_columns') as leer:
+            self.data_manager.add_data(self.linea(2, 1, datetime(2024, 3, 1)))
+            self.data_manager.put_data(VentaProducto, 1, {'cantidad': 4})
+            self.data_manager.delete_data(VentaProducto, 2)
+            self.assertEqual(self.unidades(), [0, 4, 1])
+            self.assertEqual(self.unidades(desde=datetime(2024, 2, 1)), [0, 0, 1])
+            leer.assert_not_called()
+        self.assertEqual(len(self.data_manager.get_component(ColumnasVentas).lineas()[0]), 2)
+
+    def test_join_con_productos_sigue_sus_cambios(self):
+        producto = self.producto(stock=10, precio=100)
+        self.data_manager.add_data(self.linea(producto.id, 3))
+        analitica = AnaliticaService(self.data_manager)
+        self.assertEqual(analitica.top_vendidos()[0].ingresos, 300)
+        self.data_manager.put_data(Producto, producto.id, {'precio': 200})
+        self.assertEqual(analitica.top_vendidos()[0].ingresos, 600)
+        self.data_manager.delete_data(Producto, producto.id)
+        self.assertIsNone(analitica.top_vendidos()[0].nombre)
+
+
+class TestReportes(ConDatos):
+    def exportar(self, tipo: str, formato: str) -> str:
+        bloques = ReporteService(self.data_manager).exportar(tipo, formato)
+        return b''.join(bloques).decode(Reports.ENCODING)
+
+    def test_fechas_en_iso_en_csv_y_jsonl(self):
+        self.data_manager.add_data(
+            Venta(id=-1, fecha=datetime(2024, 5, 1, 10, 30), total=100, ganancia=100)
+        )
+        self.assertIn('2024-05-01T10:30:00', self.exportar(Reports.VENTAS, Reports.CSV))
+        self.assertIn('"2024-05-01T10:30:00"', self.exportar(Reports.VENTAS, Reports.JSONL))
+
+    def test_inventario_se_lee_fila_a_fila(self):
+        self.producto(stock=3)
+        self.data_manager.put_data(Producto, 1, {'nombre': 'Café, "molido"\nfino'})
+        self.producto(stock=0)
+        with mock.patch.object(self.data_manager, 'get_data') as get_data:
+            reporte = self.exportar(Reports.INVENTARIO, Reports.JSONL)
+            get_data.assert_not_called()
+        filas = reporte.splitlines()
+        self.assertEqual(len(filas), 2)
+        self.assertIn('Café, \\"molido\\"\\nfino', filas[0])
+
+    def test_sincronizacion_no_entrega_ventas_sin_sus_lineas(self):
+        indice = self.data_manager.get_component(VentasIndex)
+        leyendo, venta_escrita = threading.Event(), threading.Event()
+        posteriores = indice.posteriores
+
+        def posteriores_tras_la_venta(*args):
+            # La página se lee entre la escritura de la venta y la de sus líneas
+            leyendo.set()
+            venta_escrita.wait(timeout=0.2)
+            return posteriores(*args)
+
+        bloques = []
+        with mock.patch.object(indice, 'posteriores', posteriores_tras_la_venta):
+            hilo = threading.Thread(
+                target=lambda: bloques.extend(
+                    ReporteService(self.data_manager).sincronizar_ventas()
+                )
+            )
+            hilo.start()
+            leyendo.wait()
+            with self.data_manager.atomic():
+                venta = self.data_manager.add_data(
+                    Venta(id=-1, fecha=datetime.now(), total=100, ganancia=100)
+                )
+                venta_escrita.set()
+                time.sleep(0.05)
+                self.data_manager.add_batch(
+                    [
+                        VentaProducto(
+                            id=-1, id_venta=venta.id, id_producto=1, cantidad=2, fecha=venta.fecha
+                        )
+                    ]
+                )
+            hilo.join()
+        filas = [json.loads(fila) for fila in b''.join(bloques).decode(Reports.ENCODING).split()]
+        ventas = {fila['id'] for fila in filas if fila['tabla'] == 'ventas'}
+        self.assertEqual(ventas, {fila['id_venta'] for fila in filas if 'id_venta' in fila})
+
+
+class TestVersiones(ConDatos):
+    def test_version_cambia_con_escrituras_de_otro_proceso(self):
+        self.producto(stock=1)
+        version = self.data_manager.get_version(Producto)
+        self.assertEqual(self.data_manager.get_version(Producto), version)
+        # Con PORTALAPP_MODO=procesos la interfaz escribe con su propio manejador
+        CSVManager().put_data(Producto, 1, {'stock': 2})
+        self.assertNotEqual(self.data_manager.get_version(Producto), version)
+
+    def test_cache_no_sirve_respuestas_tras_escrituras_de_otro_proceso(self):
+        self.producto(stock=1)
+        cache = self.data_manager.get_component(CacheRespuestas)
+
+        @cache.cacheado(Producto)
+        def stock():
+            return CSVManager().get_data_by_id(Producto, 1).stock
+
+        self.assertEqual(stock(), 1)
+        CSVManager().put_data(Producto, 1, {'stock': 2})
+        self.assertEqual(stock(), 2)
+        self.assertEqual(stock(), 2)
+        self.assertEqual(cache.estadisticas()['aciertos'], 1)
+
+
+class TestCambiosProductos(ConDatos):
+    def test_esperar_despierta_con_una_escritura_de_otro_hilo(self):
+        cambios = CambiosProductos(self.data_manager)
+
+        async def esperar():
+            threading.Timer(0.05, self.producto, args=(3,)).start()
+            return await cambios.esperar(0, timeout=5)
+
+        pendientes = asyncio.run(esperar())
+        self.assertEqual([(c.secuencia, c.stock) for c in pendientes], [(1, 3)])
+
+    def test_esperar_sin_cambios_ni_historial(self):
+        cambios = CambiosProductos(self.data_manager, historial=1)
+        self.assertEqual(asyncio.run(cambios.esperar(0, timeout=0.01)), [])
+        self.producto(3)
+        self.producto(4)
+        self.assertIsNone(asyncio.run(cambios.esperar(0, timeout=0.01)))
+
+
+@unittest.skipIf(os.name == 'nt', 'Usa un socket Unix')
+class TestServidorDatos(ConDatos):
+    CLAVE = b'secreto-de-prueba'
+
+    def setUp(self):
+        super().setUp()
+        self.direccion = os.path.join(self.directorio, 'datos.sock')
+        self.servidor = ServidorDatos(self.data_manager, [], self.direccion, clave=self.CLAVE)
+        threading.Thread(target=self.servidor.servir, daemon=True).start()
+        self.addCleanup(self.servidor.cerrar)
+        while not os.path.exists(self.direccion):
+            time.sleep(0.01)
+
+    def iteradores(self) -> dict:
+        return self.servidor._ServidorDatos__iteradores
+
+    def test_socket_solo_para_el_usuario(self):
+        self.assertEqual(os.stat(self.direccion).st_mode & 0o777, 0o600)
+
+    def test_requiere_la_clave_compartida(self):
+        self.producto(3)
+        remoto = CSVManagerRemoto(self.direccion, clave=self.CLAVE)
+        self.assertEqual([p.stock for p in remoto.get_data(Producto)], [3])
+        with self.assertRaises(AuthenticationError):
+            Client(self.direccion, authkey=b'otra')
+        # El servidor sigue atendiendo después de rechazar la conexión
+        self.assertEqual(remoto.get_last_id(Producto), 1)
+        self.assertEqual(
+            CSVManagerRemoto(self.direccion, clave=self.CLAVE).get_last_id(Producto), 1
+        )
+
+    def test_iteradores_se_descartan_al_desconectarse(self):
+        self.producto(3)
+        with Client(self.direccion, authkey=self.CLAVE) as conexion:
+            conexion.send(('solicitudes',))
+            conexion.send(('llamar', '', 'iter_data', (Producto,), {}))
+            estado, iterador_id, _ = conexion.recv()
+            self.assertEqual(estado, 'iterador')
+            self.assertIn(iterador_id, self.iteradores())
+        for _ in range(100):
+            if iterador_id not in self.iteradores():
+                break
+            time.sleep(0.01)
+        self.assertNotIn(iterador_id, self.iteradores())
+
+
+class TestIdempotencia(ConDatos):
+    def setUp(self):
+        super().setUp()
+        self.producto(stock=5)
+        self.servicio = VentaService(self.data_manager)
+
+    def vender(self, cantidad: int = 1, clave: str = 'clave-1') -> Venta:
+        return self.servicio.create_venta(
+            [{'id_producto': 1, 'cantidad': cantidad}], 1000, clave_idempotencia=clave
+        )
+
+    def test_reintento_devuelve_la_venta_original(self):
+        venta = self.vender()
+        with mock.patch.object(self.data_manager, 'set_data') as set_data:
+            self.assertEqual(self.vender().id, venta.id)
+            set_data.assert_not_called()
+        self.assertEqual(len(self.data_manager.get_data(Venta)), 1)
+        self.assertEqual(len(self.data_manager.get_data(ClaveIdempotencia)), 1)
+        self.assertEqual(self.data_manager.get_data_by_id(Producto, 1).stock, 4)
+
+    def test_misma_clave_con_otra_venta(self):
+        self.vender(cantidad=1)
+        with self.assertRaises(ValueError):
+            self.vender(cantidad=2)
+        self.assertEqual(len(self.data_manager.get_data(Venta)), 1)
+
+    def test_venta_fallida_libera_la_clave(self):
+        with mock.patch.object(self.data_manager, 'add_batch', side_effect=OSError):
+            with self.assertRaises(OSError):
+                self.vender()
+        venta = self.vender()
+        self.assertEqual(self.vender().id, venta.id)
+        self.assertEqual(self.data_manager.get_data_by_id(Producto, 1).stock, 4)
+
+    def test_compacta_al_duplicar_el_limite(self):
+        idempotencia = IdempotenciaVentas(self.data_manager, max_claves=2)
+        for i in range(1, 5):
+            idempotencia.reclamar(f'c{i}', 'h')
+            idempotencia.registrar(f'c{i}', 'h', i)
+        claves = [fila.clave for fila in self.data_manager.get_data(ClaveIdempotencia)]
+        self.assertEqual(claves, ['c3', 'c4'])
+        self.assertIsNone(idempotencia.reclamar('c1', 'h'))
+        self.assertEqual(idempotencia.reclamar('c4', 'h'), 4)
+
+
+class TestImagenes(ConDatos):
+    def setUp(self):
+        super().setUp()
+        self.imagenes = Path(self.directorio) / 'imagenes'
+        self.imagenes.mkdir()
+
+    def almacen(self, data_manager: CSVManager = None) -> AlmacenImagenes:
+        return AlmacenImagenes(
+            data_manager or self.data_manager, self.imagenes, self.imagenes / 'miniaturas'
+        )
+
+    def imagen(self, letra: str, antigua: bool = True) -> str:
+        nombre = letra * 64 + '.png'
+        (self.imagenes / nombre).write_bytes(b'png')
+        if antigua:
+            hace = time.time() - 2 * Imagenes.GRACIA
+            os.utime(self.imagenes / nombre, (hace, hace))
+        return nombre
+
+    def esperar_borrado(self, nombre: str, segundos: float = 2) -> bool:
+        for _ in range(int(segundos * 100)):
+            if not (self.imagenes / nombre).exists():
+                return True
+            time.sleep(0.01)
+        return False
+
+    def test_purga_una_sola_vez_por_periodo(self):
+        huerfana = self.imagen('a')
+        reciente = self.imagen('b', antigua=False)
+        self.almacen()
+        self.assertTrue(self.esperar_borrado(huerfana))
+        self.assertTrue((self.imagenes / reciente).exists())
+        # Otro proceso que arranca dentro del periodo de gracia no vuelve a purgar
+        otra = self.imagen('c')
+        self.almacen(CSVManager())
+        self.assertFalse(self.esperar_borrado(otra, segundos=0.3))
+
+    def test_no_borra_imagenes_que_otro_proceso_usa(self):
+        compartida, propia = self.imagen('a'), self.imagen('b')
+        (self.imagenes / Imagenes.MARCA_PURGA).touch()
+        producto = self.producto(3)
+        self.data_manager.put_data(Producto, producto.id, {'imagen_ruta': propia})
+        self.almacen()
+        self.data_manager.put_data(Producto, producto.id, {'imagen_ruta': compartida})
+        self.assertTrue(self.esperar_borrado(propia))
+        # Otro proceso asigna la imagen a un producto que este almacén no conoce
+        CSVManager().add_data(
+            Producto(id=-1, nombre='B', precio=1, coste=1, stock=1, imagen_ruta=compartida)
+        )
+        self.data_manager.put_data(Producto, producto.id, {'imagen_ruta': None})
+        self.assertFalse(self.esperar_borrado(compartida, segundos=0.3))
+
+    def test_guardar_una_imagen_existente_renueva_su_gracia(self):
+        origen = Path(self.directorio) / 'origen.png'
+        origen.write_bytes(b'png')
+        existente = self.imagen('a')
+        nombre = hashlib.sha256(b'png').hexdigest() + '.png'
+        os.replace(self.imagenes / existente, self.imagenes / nombre)
+        self.assertEqual(self.almacen().guardar(origen), nombre)
+        self.assertLess(time.time() - (self.imagenes / nombre).stat().st_mtime, 60)
+
+
+if __name__ == __MAIN__:
+    unittest.main()
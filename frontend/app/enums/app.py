@@ -25,3 +25,19 @@ class AppLabels:
     DEUDORES: str = 'Deudores'
     REPORTES: str = 'Reportes'
     NOT_FOUND: str = 'Página no encontrada'
+
+
+class Catalogo:
+    # Tarjetas de productos que se cargan por página al desplazarse
+    PAGINA: int = 40
+    # Distancia (px) al final de la lista desde la que se carga la página siguiente
+    MARGEN_CARGA: int = 600
+    # Milisegundos mínimos entre eventos de desplazamiento enviados por el cliente
+    INTERVALO_SCROLL: int = 100
+    # Tarjetas ya construidas que se conservan para reutilizarlas entre búsquedas
+    MAX_TARJETAS: int = 1000
+
+
+class Sesion:
+    # Cambios que se acumulan para una vista oculta; con más se reconstruye completa
+    MAX_CAMBIOS: int = 1000
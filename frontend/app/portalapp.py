@@ -1,17 +1,47 @@
 # frontend\app\portalapp.py
+import importlib
+import threading
+import weakref
+from dataclasses import dataclass, field
+from functools import partial
 import flet as fl
-from typing import Callable
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 from frontend.app.enums.config import conf
 from frontend.app.enums.app import AppRoutes
 from frontend.app.enums.app import AppLabels
+from frontend.app.enums.app import Sesion
 
 from backend.data.managers.csv_manager import CSVManager
+from backend.models.abono import Abono
+from backend.models.deuda import Deuda
+from backend.models.deudor import Deudor
+from backend.models.producto import Producto
+
+# Módulo y función de cada vista, y modelos que muestra. Las vistas se importan al
+# navegar a ellas por primera vez y reciben los cambios de sus modelos al volver a
+# mostrarse (ventas sigue los cambios de productos por su cuenta y conserva la venta en curso)
+VISTAS: Dict[str, Tuple[str, str, Tuple[Type, ...]]] = {
+    AppRoutes.HOME: ('frontend.home.view', 'mostrar_inicio', ()),
+    AppRoutes.PRODUCTOS: ('frontend.productos.view', 'mostrar_productos', (Producto,)),
+    AppRoutes.VENTAS: ('frontend.ventas.view', 'mostrar_ventas', ()),
+    AppRoutes.DEUDORES: ('frontend.deudores.view', 'mostrar_deudores', (Deudor, Deuda, Abono)),
+    AppRoutes.REPORTES: ('frontend.reportes.view', 'mostrar_reportes', ()),
+}
+
+
+@dataclass(eq=False)
+class CambiosPendientes:
+    """Notificaciones recibidas por una vista guardada mientras no se muestra.
 
-from frontend.deudores.view import mostrar_deudores
-from frontend.home.view import mostrar_inicio
-from frontend.productos.view import mostrar_productos
-from frontend.ventas.view import mostrar_ventas
+    Attributes:
+        modelos (Tuple[Type, ...]): Modelos que muestra la vista.
+        cambios (Optional[List[Tuple[Type, str, Any]]]): Modelo, evento y elemento
+            de cada notificación, o None si superaron `Sesion.MAX_CAMBIOS`.
+    """
+
+    modelos: Tuple[Type, ...]
+    cambios: Optional[List[Tuple[Type, str, Any]]] = field(default_factory=list)
 
 
 class Portalapp:
@@ -21,21 +51,33 @@ class Portalapp:
     de la aplicación. Define la estructura base de la interfaz gráfica incluyendo
     la barra de navegación inferior.
 
+    Cada sesión conserva las vistas que ya visitó, con sus presentadores: al
+    cambiar de pestaña se muestra la misma vista sin volver a construirla ni
+    leer sus tablas. Las notificaciones de sus modelos se acumulan mientras la
+    vista está oculta y, al volver a ella, se entregan a la función guardada en
+    `View.data`, que actualiza solo lo que cambió. Una vista sin esa función, o
+    con más de `Sesion.MAX_CAMBIOS` cambios acumulados, se reconstruye.
+
+    Args:
+        data_manager (Optional[CSVManager]): Manejador de datos a compartir con la
+            API cuando ambas corren en el mismo proceso; si no se indica, se crea uno.
+
     Attributes:
         __sql_manager (CSVManager): Instancia del manejador de datos CSV.
         __app_routes (dict[str, Callable]): Diccionario que mapea rutas a funciones
-            que generan las vistas correspondientes.
+            que generan las vistas correspondientes; se completa a medida que se
+            visita cada vista (ver `VISTAS`).
     """
 
-    def __init__(self):
+    def __init__(self, data_manager: Optional[CSVManager] = None):
         """Inicializa la aplicación configurando el manejador de datos y las rutas."""
-        self.__sql_manager: CSVManager = CSVManager()
-        self.__app_routes: dict[str, Callable] = {
-            AppRoutes.HOME: mostrar_inicio,
-            AppRoutes.PRODUCTOS: mostrar_productos,
-            AppRoutes.VENTAS: mostrar_ventas,
-            AppRoutes.DEUDORES: mostrar_deudores,
-        }
+        self.__sql_manager: CSVManager = data_manager if data_manager else CSVManager()
+        self.__app_routes: dict[str, Callable] = {}
+        # Cambios pendientes de las vistas guardadas; se descartan junto con su sesión
+        self.__lock = threading.Lock()
+        self.__pendientes: weakref.WeakSet[CambiosPendientes] = weakref.WeakSet()
+        for modelo in {m for *_, modelos in VISTAS.values() for m in modelos}:
+            self.__sql_manager.subscribe(modelo, partial(self.__on_cambio, modelo))
 
     async def main(self, page: fl.Page):
         """Método principal que configura y arranca la aplicación.
@@ -79,18 +121,23 @@ class Portalapp:
                     icon=fl.icons.PEOPLE_OUTLINED,
                     selected_icon=fl.icons.PEOPLE,
                 ),
+                fl.NavigationBarDestination(
+                    label=AppLabels.REPORTES,
+                    icon=fl.icons.ASSESSMENT_OUTLINED,
+                    selected_icon=fl.icons.ASSESSMENT,
+                ),
             ],
             on_change=self.navigation_changed,
         )
 
+        # Vistas de esta sesión por ruta, con los cambios recibidos desde que se mostraron
+        vistas: Dict[str, Tuple[fl.View, CambiosPendientes]] = {}
+
         async def route_change(e: fl.RouteChangeEvent):
+            route = e.route if e.route in VISTAS else AppRoutes.HOME
+            vista = self.__vista_de_sesion(vistas, route, page)
             page.views.clear()
-            route = e.route
-            page.views.append(
-                self.__app_routes[route](page, self.__sql_manager)
-                if route in self.__app_routes
-                else mostrar_inicio(page, self.__sql_manager)
-            )
+            page.views.append(vista)
 
             page.views[-1].navigation_bar = nav_rail
             page.update()
@@ -110,8 +157,60 @@ class Portalapp:
                 el nuevo índice seleccionado.
 
         Note:
-            La navegación se realiza usando las rutas definidas en __app_routes
+            La navegación se realiza usando las rutas definidas en `VISTAS`
             correspondientes al índice seleccionado en la barra de navegación.
         """
-        added_routes = list(self.__app_routes.keys())
+        added_routes = list(VISTAS.keys())
         e.page.go(added_routes[e.control.selected_index])
+
+    def __vista(self, route: str) -> Callable:
+        """Función que genera la vista de una ruta, importando su módulo la primera vez."""
+        vista = self.__app_routes.get(route)
+        if vista is None:
+            modulo, funcion, _ = VISTAS[route]
+            vista = getattr(importlib.import_module(modulo), funcion)
+            self.__app_routes[route] = vista
+        return vista
+
+    def __vista_de_sesion(
+        self, vistas: Dict[str, Tuple[fl.View, CambiosPendientes]], route: str, page: fl.Page
+    ) -> fl.View:
+        """Vista de una ruta en la sesión, con los cambios recibidos mientras estuvo oculta.
+
+        Args:
+            vistas (Dict[str, Tuple[fl.View, CambiosPendientes]]): Vistas de la sesión.
+            route (str): Ruta a mostrar.
+            page (fl.Page): Página de la sesión.
+
+        Returns:
+            fl.View: La vista guardada y actualizada, o una nueva si no existía o si
+                no puede aplicar los cambios.
+        """
+        guardada = vistas.get(route)
+        if guardada is not None:
+            vista, pendientes = guardada
+            with self.__lock:
+                cambios, pendientes.cambios = pendientes.cambios, []
+            if cambios is not None and (not cambios or callable(vista.data)):
+                if cambios:
+                    vista.data(cambios)
+                return vista
+        # Se registra antes de construir: lo que cambie durante la construcción se
+        # aplica la próxima vez (aplicar un cambio ya incluido no tiene efecto)
+        pendientes = CambiosPendientes(VISTAS[route][2])
+        with self.__lock:
+            self.__pendientes.add(pendientes)
+        vista = self.__vista(route)(page, self.__sql_manager)
+        vistas[route] = (vista, pendientes)
+        return vista
+
+    def __on_cambio(self, modelo: Type, event: str, item: Any):
+        # Se ejecuta en el hilo de la escritura: solo se encola
+        with self.__lock:
+            for pendientes in self.__pendientes:
+                if pendientes.cambios is None or modelo not in pendientes.modelos:
+                    continue
+                if len(pendientes.cambios) >= Sesion.MAX_CAMBIOS:
+                    pendientes.cambios = None
+                else:
+                    pendientes.cambios.append((modelo, event, item))
@@ -1,7 +1,9 @@
 # frontend\deudores\presenter.py
 from backend.data.managers.csv_manager import CSVManager
-from backend.models.deudor import Deudor
-from backend.models.deuda import Deuda
+from backend.data.indexes.busqueda import BusquedaDeudores
+from backend.data.indexes.deudas import DeudasIndex
+from backend.data.ledgers.saldos import SaldosLedger
+from backend.app.services.deudas import AntiguedadDeudor, DeudaService
 from backend.models.abono import Abono
 from datetime import datetime
 
@@ -11,13 +13,17 @@ class DeudoresPresenter:
 
     Esta clase actúa como intermediario entre la vista y los datos de deudores,
     proporcionando métodos para consultar y manipular información de deudas y abonos.
+    Los deudores, deudas, abonos y saldos se leen de los índices del manejador, que
+    se mantienen al día con sus notificaciones: el presentador no guarda copias.
 
     Attributes:
         view: La vista asociada con el presentador.
         data_manager (CSVManager): Gestor de datos para manejar operaciones
         de lectura y escritura de datos.
-        deudores (list): Lista de deudores cargados desde el gestor de datos.
-        deudas (list): Lista de deudas cargadas desde el gestor de datos.
+        deudores (BusquedaDeudores): Deudores por ID.
+        deudas (DeudasIndex): Deudas y abonos agrupados por deudor.
+        saldos (SaldosLedger): Saldos materializados por deudor.
+        antiguedad (dict): Saldo por antigüedad de cada deudor con saldo pendiente.
     """
 
     def __init__(self, view, data_manager: CSVManager):
@@ -30,8 +36,26 @@ class DeudoresPresenter:
         """
         self.view = view
         self.data_manager = data_manager
-        self.deudores = self.data_manager.get_data(Deudor)
-        self.deudas = self.data_manager.get_data(Deuda)
+        self.deudores: BusquedaDeudores = self.data_manager.get_component(BusquedaDeudores)
+        self.deudas: DeudasIndex = self.data_manager.get_component(DeudasIndex)
+        self.saldos: SaldosLedger = self.data_manager.get_component(SaldosLedger)
+        self.deuda_service = DeudaService(self.data_manager)
+        self.antiguedad: dict[int, AntiguedadDeudor] = {}
+
+    def cargar_antiguedad(self):
+        """Calcula la antigüedad de saldos de todos los deudores en una sola pasada."""
+        self.antiguedad = {a.id_deudor: a for a in self.deuda_service.get_antiguedad()}
+
+    def antiguedad_de_deudor(self, deudor_id: int) -> AntiguedadDeudor | None:
+        """Obtiene el saldo por antigüedad de un deudor.
+
+        Args:
+            deudor_id (int): Identificador único del deudor.
+
+        Returns:
+            AntiguedadDeudor | None: Saldo por tramo, None si no tiene saldo pendiente.
+        """
+        return self.antiguedad.get(deudor_id)
 
     def obtener_deudores_con_deuda(self):
         """Obtiene la lista de deudores que tienen deudas pendientes.
@@ -39,8 +63,7 @@ class DeudoresPresenter:
         Returns:
             list: Lista de deudores con al menos una deuda asociada.
         """
-        deudores_con_deuda = {d.id_deudor for d in self.deudas}
-        return [d for d in self.deudores if d.id in deudores_con_deuda]
+        return [d for d in self.deudores.listar() if self.deudas.get_deudas(d.id)]
 
     def total_deudas_de_deudor(self, deudor_id: int) -> int:
         """Calcula el total de deudas para un deudor específico.
@@ -51,8 +74,7 @@ class DeudoresPresenter:
         Returns:
             int: Suma total de las deudas del deudor.
         """
-        deudas_de_deudor = [d for d in self.deudas if d.id_deudor == deudor_id]
-        return sum(d.valor_deuda for d in deudas_de_deudor)
+        return self.saldos.get_saldo(deudor_id).total_deudas
 
     def total_abonos_de_deudor(self, deudor_id: int) -> int:
         """Calcula el total de abonos realizados por un deudor.
@@ -63,9 +85,7 @@ class DeudoresPresenter:
         Returns:
             int: Suma total de los abonos del deudor.
         """
-        abonos = self.data_manager.get_data(Abono)
-        abonos_de_deudor = [a for a in abonos if a.id_deudor == deudor_id]
-        return sum(a.valor_abono for a in abonos_de_deudor)
+        return self.saldos.get_saldo(deudor_id).total_abonos
 
     def saldo_de_deudor(self, deudor_id: int) -> int:
         """Calcula el saldo pendiente de un deudor.
@@ -77,9 +97,7 @@ class DeudoresPresenter:
             int: Saldo pendiente del deudor (deudas menos abonos).
             Nunca retorna valores negativos.
         """
-        return max(
-            self.total_deudas_de_deudor(deudor_id) - self.total_abonos_de_deudor(deudor_id), 0
-        )
+        return self.saldos.get_saldo(deudor_id).saldo
 
     def registrar_abono_deudor(self, deudor_id: int, valor_abono: int):
         """Registra un nuevo abono para un deudor.
@@ -100,7 +118,7 @@ class DeudoresPresenter:
             fecha_abono=datetime.now(),
         )
         self.data_manager.add_data(nuevo_abono)
-        self.view.actualizar_vista()
+        self.view.actualizar_vista([deudor_id])
 
     def obtener_abonos_de_deudor(self, deudor_id: int):
         """Recupera todos los abonos de un deudor específico.
@@ -111,8 +129,7 @@ class DeudoresPresenter:
         Returns:
             list: Lista de abonos realizados por el deudor.
         """
-        abonos = self.data_manager.get_data(Abono)
-        return [a for a in abonos if a.id_deudor == deudor_id]
+        return self.deudas.get_abonos(deudor_id)
 
     def obtener_deudas_de_deudor(self, deudor_id: int):
         """Recupera todas las deudas de un deudor específico.
@@ -123,4 +140,4 @@ class DeudoresPresenter:
         Returns:
             list: Lista de deudas asociadas al deudor.
         """
-        return [d for d in self.deudas if d.id_deudor == deudor_id]
+        return self.deudas.get_deudas(deudor_id)
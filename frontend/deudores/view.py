@@ -1,6 +1,8 @@
 # frontend\deudores\view.py
 import flet as ft
 import flet as ft
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+from backend.app.enums.manager import DataEvents
 from backend.data.managers.csv_manager import CSVManager
 from backend.models.deudor import Deudor
 from frontend.deudores.presenter import DeudoresPresenter
@@ -29,7 +31,9 @@ class DeudoresView:
     """Clase que implementa la vista de deudores con Flet.
 
     Esta clase maneja la interfaz gráfica para mostrar y gestionar deudores,
-    incluyendo sus deudas y abonos.
+    incluyendo sus deudas y abonos. El panel de cada deudor se reutiliza hasta
+    que cambian sus datos; los cambios hechos mientras la vista está oculta se
+    aplican con `aplicar_cambios` (guardada en `View.data`) al volver a mostrarla.
 
     Args:
         page (ft.Page): Instancia de la página de Flet.
@@ -40,6 +44,8 @@ class DeudoresView:
         self.page = page
         self.presenter = DeudoresPresenter(self, data_manager)
         self.deudores_list = ft.ListView(spacing=10, padding=20, expand=True)
+        # Panel construido de cada deudor (None si no tiene saldo pendiente)
+        self.__paneles: Dict[int, Optional[ft.ExpansionPanel]] = {}
         self.init_view()
 
     def mostrar_modal_deudas(self, deudor_id: int):
@@ -148,8 +154,29 @@ class DeudoresView:
             )
         )
 
+        # Saldo pendiente por antigüedad (los abonos cubren primero lo más antiguo)
+        antiguedad = self.presenter.antiguedad_de_deudor(deudor.id)
+        antiguedad_content = ft.Row(
+            [
+                ft.Column(
+                    [
+                        ft.Text(f"{tramo} días", size=11, color=ft.colors.GREY_600),
+                        ft.Text(
+                            f"${valor}",
+                            weight=ft.FontWeight.W_500,
+                            color=ft.colors.ERROR if tramo == '90+' and valor else None,
+                        ),
+                    ],
+                    spacing=2,
+                    horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                )
+                for tramo, valor in (antiguedad.tramos.items() if antiguedad else [])
+            ],
+            alignment=ft.MainAxisAlignment.SPACE_AROUND,
+        )
+
         # Content del panel
-        panel_content = ft.Column([abonos_content], spacing=15)
+        panel_content = ft.Column([antiguedad_content, abonos_content], spacing=15)
 
         # Header con el saldo total y botón de abonar
         nombre = (
@@ -209,25 +236,29 @@ class DeudoresView:
     def init_view(self):
         """Inicializa la vista cargando todos los deudores con deuda activa."""
         self.deudores_list.controls.clear()
+        self.presenter.cargar_antiguedad()
         deudores = self.presenter.obtener_deudores_con_deuda()
+        paneles = (self.__panel_deudor(deudor) for deudor in deudores)
         panel_list = ft.ExpansionPanelList(
             expand=False,
-            controls=[
-                self.crear_panel_deudor(deudor)
-                for deudor in deudores
-                if self.crear_panel_deudor(deudor)
-            ],
+            controls=[panel for panel in paneles if panel],
         )
         self.deudores_list.controls.append(panel_list)
         self.page.update()
 
+    def __panel_deudor(self, deudor: Deudor) -> Optional[ft.ExpansionPanel]:
+        """Panel del deudor, construido solo si no existe o si sus datos cambiaron."""
+        if deudor.id not in self.__paneles:
+            self.__paneles[deudor.id] = self.crear_panel_deudor(deudor)
+        return self.__paneles[deudor.id]
+
     def build(self):
         """Construye y retorna la vista principal de deudores.
 
         Returns:
             ft.View: Vista completa de deudores con su AppBar y lista.
         """
-        return ft.View(
+        view = ft.View(
             "/deudores",
             [
                 ft.AppBar(
@@ -242,12 +273,47 @@ class DeudoresView:
             ],
             bgcolor=ft.colors.SURFACE_VARIANT,
         )
+        view.data = self.aplicar_cambios
+        return view
+
+    def aplicar_cambios(self, cambios: List[Tuple[Type, str, Any]]):
+        """Aplica los cambios de deudores, deudas y abonos notificados mientras la
+        vista estaba oculta, reconstruyendo solo los paneles de los deudores afectados.
+
+        Args:
+            cambios (List[Tuple[Type, str, Any]]): Modelo, evento y elemento de cada
+                notificación, en el orden en que se recibieron.
+        """
+        afectados = set()
+        for modelo, evento, item in cambios:
+            if modelo is Deudor:
+                afectados.add(item.id)
+            elif evento == DataEvents.ADD:
+                afectados.add(item.id_deudor)
+            else:
+                # Una edición puede mover la deuda o el abono de deudor
+                afectados = None
+                break
+        self.__descartar_paneles(afectados)
+        self.init_view()
+
+    def actualizar_vista(self, deudores: Optional[Iterable[int]] = None):
+        """Actualiza la vista recargando los datos de deudores.
 
-    def actualizar_vista(self):
-        """Actualiza la vista recargando los datos de deudores."""
+        Args:
+            deudores (Optional[Iterable[int]]): IDs de los deudores cuyos datos
+                cambiaron; si no se indican, se reconstruyen todos los paneles.
+        """
+        self.__descartar_paneles(deudores)
         self.init_view()
         self.page.update()
 
+    def __descartar_paneles(self, deudores: Optional[Iterable[int]]):
+        if deudores is None:
+            self.__paneles.clear()
+        for deudor_id in deudores or ():
+            self.__paneles.pop(deudor_id, None)
+
     def mostrar_error(self, mensaje: str):
         """Muestra un mensaje de error o éxito al usuario.
 
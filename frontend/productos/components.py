@@ -1,7 +1,8 @@
 # productos/components.py #
 import flet as fl
 from backend.models.producto import Producto
-from typing import Callable
+from backend.data.indexes.stock import umbral_de
+from typing import Callable, Optional
 
 from frontend.app.enums.app import AppParams
 
@@ -14,8 +15,10 @@ class ProductoCard(fl.Card):
 
     Args:
         producto (Producto): Objeto que contiene la información del producto (nombre, precio, stock, ruta de la imagen).
+            Se conserva en `self.producto`.
         on_edit (Callable[[Producto], None]): Función de callback que se ejecuta al hacer clic en el botón de editar.
         on_delete (Callable[[Producto], None]): Función de callback que se ejecuta al hacer clic en el botón de eliminar.
+        imagen (Optional[str]): Ruta de la imagen a mostrar, normalmente su miniatura.
     """
 
     def __init__(
@@ -23,6 +26,7 @@ class ProductoCard(fl.Card):
         producto: Producto,
         on_edit: Callable[[Producto], None],
         on_delete: Callable[[Producto], None],
+        imagen: Optional[str] = None,
     ):
         """Inicializa una instancia de ProductoCard con los datos del producto y callbacks.
 
@@ -32,9 +36,13 @@ class ProductoCard(fl.Card):
             producto (Producto): Objeto que contiene la información del producto.
             on_edit (Callable[[Producto], None]): Callback para manejar la acción de edición.
             on_delete (Callable[[Producto], None]): Callback para manejar la acción de eliminación.
+            imagen (Optional[str]): Ruta de la imagen a mostrar (p. ej. su miniatura); por
+                defecto, la imagen original del producto.
         """
         super().__init__()
-        stock_color = fl.colors.BLACK54 if producto.stock >= 5 else fl.colors.ERROR
+        # Permite a la vista reutilizar la tarjeta mientras el producto no cambie
+        self.producto = producto
+        stock_color = fl.colors.ERROR if producto.stock <= umbral_de(producto) else fl.colors.BLACK54
         
         self.content = fl.Container(
             content=(
@@ -44,7 +52,8 @@ class ProductoCard(fl.Card):
                             [
                                 fl.Container(
                                     content=fl.Image(
-                                        src=f'{AppParams.APP_ASSETS_PATH}/productos/{producto.imagen_ruta}',
+                                        src=imagen
+                                        or f'{AppParams.APP_ASSETS_PATH}/productos/{producto.imagen_ruta}',
                                         fit=fl.ImageFit.COVER,
                                     ),
                                     width=150,
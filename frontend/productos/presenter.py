@@ -1,7 +1,10 @@
 # productos/presenter.py #
-from typing import List, Optional
+from bisect import bisect_left
+from typing import Iterable, List, Optional
 from backend.models.producto import Producto
 from backend.data.managers.csv_manager import CSVManager
+from backend.data.indexes.busqueda import BusquedaProductos
+from backend.data.imagenes.almacen import AlmacenImagenes
 
 import flet as fl
 
@@ -33,17 +36,77 @@ class ProductosPresenter:
     def load_productos(self) -> List[Producto]:
         """Carga y retorna la lista de productos desde el backend, con un filtro opcional.
 
-        Si hay un término de búsqueda activo, devuelve solo los productos que coincidan.
+        Si hay un término de búsqueda activo, devuelve solo los productos cuyo nombre
+        coincide, ordenados por relevancia según el índice de búsqueda.
 
         Returns:
             List[Producto]: Lista de productos cargados y filtrados.
         """
-        self.__all_productos = self.__sql_manager.get_data(Producto)
-        return (
-            self.__all_productos
-            if not self.__search_term
-            else [p for p in self.__all_productos if p.nombre.lower() in self.__search_term.lower()]
-        )
+        busqueda: BusquedaProductos = self.__sql_manager.get_component(BusquedaProductos)
+        self.__all_productos = busqueda.buscar(self.__search_term)
+        return self.__all_productos
+
+    def aplicar_cambios(self, producto_ids: Iterable[int]):
+        """Actualiza los productos cargados con los cambios notificados de algunos productos.
+
+        Sin término de búsqueda, cada producto se reemplaza, inserta o quita en su
+        posición (la lista está ordenada por ID) con su estado actual en el índice
+        de búsqueda. Con un término activo, la relevancia depende de los nombres
+        de todos los productos y la búsqueda se repite en el índice.
+
+        Args:
+            producto_ids (Iterable[int]): IDs de los productos que cambiaron.
+        """
+        if self.__search_term:
+            self.load_productos()
+            return
+        busqueda: BusquedaProductos = self.__sql_manager.get_component(BusquedaProductos)
+        for producto_id in dict.fromkeys(producto_ids):
+            actual = busqueda.get_producto(producto_id)
+            pos = bisect_left(self.__all_productos, producto_id, key=lambda p: p.id)
+            existe = pos < len(self.__all_productos) and self.__all_productos[pos].id == producto_id
+            if existe and actual is None:
+                del self.__all_productos[pos]
+            elif existe:
+                self.__all_productos[pos] = actual
+            elif actual is not None:
+                self.__all_productos.insert(pos, actual)
+
+    def load_pagina(self, desplazamiento: int, limite: int) -> List[Producto]:
+        """Retorna una página de los productos obtenidos por `load_productos`.
+
+        Args:
+            desplazamiento (int): Productos omitidos antes de la página.
+            limite (int): Tamaño máximo de la página.
+
+        Returns:
+            List[Producto]: Productos de la página, en el mismo orden.
+        """
+        return self.__all_productos[desplazamiento : desplazamiento + limite]
+
+    @property
+    def total_productos(self) -> int:
+        """Número de productos que cumplen la búsqueda actual."""
+        return len(self.__all_productos)
+
+    def guardar_imagen(self, ruta_origen: str) -> str:
+        """Guarda la imagen elegida en el almacén de imágenes.
+
+        Args:
+            ruta_origen (str): Ruta del archivo elegido por el usuario.
+
+        Returns:
+            str: Nombre de la imagen, a usar como `imagen_ruta` del producto.
+        """
+        almacen: AlmacenImagenes = self.__sql_manager.get_component(AlmacenImagenes)
+        return almacen.guardar(ruta_origen)
+
+    def ruta_miniatura(self, producto: Producto) -> Optional[str]:
+        """Ruta de la imagen a mostrar en la tarjeta del producto (su miniatura si ya existe)."""
+        if not producto.imagen_ruta:
+            return None
+        almacen: AlmacenImagenes = self.__sql_manager.get_component(AlmacenImagenes)
+        return almacen.miniatura(producto.imagen_ruta)
 
     def search_productos(self, term: str):
         """Actualiza el término de búsqueda y refresca la vista con productos filtrados.
@@ -55,7 +118,13 @@ class ProductosPresenter:
         self.__view.refresh_productos()  # Actualiza la vista con productos filtrados
 
     def validate_product(
-        self, nombre: str, precio: str, coste: str, stock: str, imagen_ruta: str = None
+        self,
+        nombre: str,
+        precio: str,
+        coste: str,
+        stock: str,
+        imagen_ruta: str = None,
+        stock_minimo: str = '',
     ) -> tuple[bool, Optional[Producto]]:
         """Valida los datos de un producto antes de guardarlo o actualizarlo.
 
@@ -64,6 +133,7 @@ class ProductosPresenter:
             precio (str): Precio en formato de cadena (se convierte a entero).
             stock (str): Stock en formato de cadena (se convierte a entero).
             imagen_ruta (str, optional): Ruta a la imagen del producto. Por defecto, None.
+            stock_minimo (str, optional): Umbral de reposición; vacío usa el global.
 
         Returns:
             tuple[bool, Optional[Producto]]:
@@ -78,6 +148,7 @@ class ProductosPresenter:
             stock_val = self.__validate_stock(stock)
             coste_val = self.__validate_coste(coste, precio_val)
             self.__validate_imagen(imagen_ruta)
+            stock_minimo_val = self.__validate_stock_minimo(stock_minimo)
 
             return True, Producto(
                 id=-1,
@@ -86,6 +157,7 @@ class ProductosPresenter:
                 coste=coste_val,
                 stock=stock_val,
                 imagen_ruta=imagen_ruta,
+                stock_minimo=stock_minimo_val,
             )
         except ValueError as e:
             self.__view.show_error(str(e))
@@ -139,6 +211,28 @@ class ProductosPresenter:
         except ValueError:
             raise ValueError('Stock debe ser un número entero positivo')
 
+    def __validate_stock_minimo(self, stock_minimo: str) -> Optional[int]:
+        """Valida el umbral de reposición propio del producto.
+
+        Args:
+            stock_minimo (str): Umbral ingresado como cadena, vacío si no tiene.
+
+        Returns:
+            Optional[int]: Umbral validado, o None para usar el umbral global.
+
+        Raises:
+            ValueError: Si el umbral no es un número válido o es negativo.
+        """
+        if not stock_minimo or not str(stock_minimo).strip():
+            return None
+        try:
+            stock_minimo_val = int(stock_minimo)
+            if stock_minimo_val < 0:
+                raise ValueError()
+            return stock_minimo_val
+        except ValueError:
+            raise ValueError('Stock mínimo debe ser un número entero positivo')
+
     def __validate_coste(self, coste: str, precio: int) -> int:
         try:
             coste_val = int(coste)
@@ -156,6 +250,7 @@ class ProductosPresenter:
         stock: str,
         imagen_ruta: str = None,
         id_producto: int = None,
+        stock_minimo: str = '',
     ) -> bool:
         """Guarda o actualiza un producto en la base de datos.
 
@@ -165,20 +260,24 @@ class ProductosPresenter:
             stock (str): Cantidad de stock.
             imagen_ruta (str, optional): Ruta a la imagen del producto. Por defecto, None.
             id_producto (int, optional): ID del producto a actualizar. Por defecto, None.
+            stock_minimo (str, optional): Umbral de reposición; vacío usa el global.
 
         Returns:
             bool: True si la operación fue exitosa, False si falló.
         """
-        is_valid, nuevo_producto = self.validate_product(nombre, precio, coste, stock, imagen_ruta)
+        is_valid, nuevo_producto = self.validate_product(
+            nombre, precio, coste, stock, imagen_ruta, stock_minimo
+        )
         if not is_valid:
             return False
 
         datos_producto = {
-            'nombre': nombre,
-            'precio': precio,
-            'coste': coste,
-            'stock': stock,
-            'imagen_ruta': imagen_ruta,
+            'nombre': nuevo_producto.nombre,
+            'precio': nuevo_producto.precio,
+            'coste': nuevo_producto.coste,
+            'stock': nuevo_producto.stock,
+            'imagen_ruta': nuevo_producto.imagen_ruta,
+            'stock_minimo': nuevo_producto.stock_minimo,
         }
 
         if id_producto:
@@ -1,9 +1,10 @@
 # productos/view.py
-import shutil
-import uuid
+from collections import OrderedDict
+from typing import Any, List, Tuple, Type
 import flet as ft
-from frontend.app.enums.app import AppParams, AppRoutes
+from frontend.app.enums.app import AppRoutes, Catalogo
 from backend.data.managers.csv_manager import CSVManager
+from backend.app.enums.inventario import Inventario
 
 from frontend.productos.components import ProductoCard
 from frontend.productos.presenter import ProductosPresenter
@@ -33,6 +34,13 @@ class ProductosView:
     """Representa la vista de productos, mostrando una lista de productos y proporcionando
     la funcionalidad de búsqueda, agregar, editar y eliminar productos.
 
+    El catálogo se muestra por páginas de `Catalogo.PAGINA` tarjetas que se cargan
+    al acercarse al final de la lista. Las tarjetas se reutilizan mientras su
+    producto no cambie, de modo que al refrescar o buscar solo se construyen (y
+    se envían al cliente) las tarjetas nuevas o modificadas. Los cambios de
+    productos hechos mientras la vista está oculta se aplican con
+    `aplicar_cambios` (guardada en `view.data`) al volver a mostrarla.
+
     Args:
         page (ft.Page): La página principal donde se renderiza la vista.
         sql_manager (CSVManager): El administrador para manejar los datos de productos.
@@ -49,7 +57,11 @@ class ProductosView:
         self.presenter: ProductosPresenter = ProductosPresenter(self, sql_manager)
         self.productos_list = ft.ListView(
             expand=True,
+            on_scroll=self.handle_scroll,
+            on_scroll_interval=Catalogo.INTERVALO_SCROLL,
         )
+        # Tarjetas construidas por ID de producto, de la menos a la más usada
+        self.__tarjetas: OrderedDict[int, ProductoCard] = OrderedDict()
         self.init_view()
 
     def init_view(self):
@@ -66,6 +78,7 @@ class ProductosView:
             ],
             padding=0,
         )
+        self.view.data = self.aplicar_cambios
         self.refresh_productos()
         return self.view
 
@@ -123,17 +136,83 @@ class ProductosView:
             expand=True,  # El container |principal también se expande
         )
 
-    def refresh_productos(self):
+    def refresh_productos(self, conservar: bool = False):
         """Actualiza la lista de productos en la vista.
 
-        Obtiene los productos del presentador y los agrega a la lista de controles de la vista.
+        Obtiene los productos del presentador y muestra la primera página, o las
+        páginas ya cargadas si `conservar` es True (tras editar o eliminar).
+
+        Args:
+            conservar (bool): Mantener el número de productos mostrados.
         """
-        productos = self.presenter.load_productos()
-        self.productos_list.controls = [
-            ProductoCard(p, on_edit=self.show_product_dialog, on_delete=self.handle_delete)
-            for p in productos
-        ]
-        self.page.update()
+        mostrados = len(self.productos_list.controls) if conservar else 0
+        self.presenter.load_productos()
+        self.__mostrar(mostrados)
+
+    def aplicar_cambios(self, cambios: List[Tuple[Type, str, Any]]):
+        """Aplica los cambios de productos notificados mientras la vista estaba oculta.
+
+        Solo se vuelven a construir las tarjetas de los productos que cambiaron;
+        se conservan las páginas ya cargadas.
+
+        Args:
+            cambios (List[Tuple[Type, str, Any]]): Modelo, evento y producto de cada
+                notificación, en el orden en que se recibieron.
+        """
+        self.presenter.aplicar_cambios(producto.id for _, _, producto in cambios)
+        self.__mostrar(len(self.productos_list.controls))
+
+    def __mostrar(self, mostrados: int):
+        """Muestra los primeros productos cargados, al menos una página."""
+        productos = self.presenter.load_pagina(0, max(mostrados, Catalogo.PAGINA))
+        self.productos_list.controls = self.__build_tarjetas(productos)
+        self.__update_list()
+
+    def handle_scroll(self, e: ft.OnScrollEvent):
+        """Carga la página siguiente de productos al acercarse al final de la lista.
+
+        Args:
+            e (ft.OnScrollEvent): Evento con la posición del desplazamiento.
+        """
+        mostrados = len(self.productos_list.controls)
+        if mostrados >= self.presenter.total_productos:
+            return
+        if e.pixels < e.max_scroll_extent - Catalogo.MARGEN_CARGA:
+            return
+        productos = self.presenter.load_pagina(mostrados, Catalogo.PAGINA)
+        self.productos_list.controls.extend(self.__build_tarjetas(productos))
+        self.__update_list()
+
+    def __build_tarjetas(self, productos: List[Producto]) -> List[ProductoCard]:
+        """Obtiene las tarjetas de los productos, reutilizando las que no cambiaron.
+
+        Args:
+            productos (List[Producto]): Productos a mostrar.
+
+        Returns:
+            List[ProductoCard]: Una tarjeta por producto, en el mismo orden.
+        """
+        tarjetas = []
+        for producto in productos:
+            tarjeta = self.__tarjetas.get(producto.id)
+            if tarjeta is None or tarjeta.producto != producto:
+                tarjeta = ProductoCard(
+                    producto,
+                    on_edit=self.show_product_dialog,
+                    on_delete=self.handle_delete,
+                    imagen=self.presenter.ruta_miniatura(producto),
+                )
+                self.__tarjetas[producto.id] = tarjeta
+            self.__tarjetas.move_to_end(producto.id)
+            tarjetas.append(tarjeta)
+        while len(self.__tarjetas) > Catalogo.MAX_TARJETAS:
+            self.__tarjetas.popitem(last=False)
+        return tarjetas
+
+    def __update_list(self):
+        # Solo se envía la diferencia de la lista; antes de montar la vista no hay nada que enviar
+        if self.productos_list.page:
+            self.productos_list.update()
 
     def show_error(self, message: str):
         """Muestra un mensaje de error en la vista.
@@ -154,7 +233,7 @@ class ProductosView:
             self.presenter.delete_producto(producto)
             dialog.open = False
             self.page.update()
-            self.refresh_productos()
+            self.refresh_productos(conservar=True)
 
         dialog = ft.AlertDialog(
             modal=True,
@@ -196,14 +275,11 @@ class ProductosView:
             if not e.files or not e.files[0].path:
                 return
 
-            file_path = e.files[0].path
-            new_filename = f"{uuid.uuid4()}.{file_path.split('.')[-1]}"
-            new_path = f'{AppParams.APP_ASSETS_PATH}/productos/{new_filename}'
-
-            # Copiar archivo
-            shutil.copy(file_path, new_path)
-            # Actualizamos la imagen seleccionada
-            imagen_seleccionada = new_filename
+            # Se guarda por contenido: la misma imagen se comparte entre productos
+            try:
+                imagen_seleccionada = self.presenter.guardar_imagen(e.files[0].path)
+            except ValueError as error:
+                self.show_error(str(error))
 
         image_picker = ft.FilePicker(on_result=on_file_picked)
         self.page.overlay.append(image_picker)
@@ -226,6 +302,14 @@ class ProductosView:
             value=str(producto.stock) if producto else '',
             keyboard_type=ft.KeyboardType.NUMBER,
         )
+        stock_minimo_field = ft.TextField(
+            label='Stock mínimo',
+            hint_text=f'Vacío: {Inventario.STOCK_MINIMO}',
+            value=(
+                str(producto.stock_minimo) if producto and producto.stock_minimo is not None else ''
+            ),
+            keyboard_type=ft.KeyboardType.NUMBER,
+        )
 
         def handle_save(e):
             # Creamos o actualizamos el producto
@@ -236,6 +320,7 @@ class ProductosView:
                 stock_field.value,
                 imagen_seleccionada,  # Pasamos la imagen actual o la nueva
                 producto.id if producto else None,
+                stock_minimo_field.value,
             )
 
             if success:
@@ -244,7 +329,7 @@ class ProductosView:
                 self.page.overlay.remove(image_picker)
                 self.page.update()
                 # Refrescamos la lista de productos
-                self.refresh_productos()
+                self.refresh_productos(conservar=True)
 
         dialog = ft.AlertDialog(
             modal=True,
@@ -272,6 +357,7 @@ class ProductosView:
                     precio_field,
                     coste_field,
                     stock_field,
+                    stock_minimo_field,
                 ],
                 tight=True,
                 spacing=20,
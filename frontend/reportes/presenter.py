@@ -0,0 +1,65 @@
+# frontend\reportes\presenter.py
+from datetime import datetime, time
+from typing import Optional
+
+from backend.app.routes.reportes import ReporteRoutes
+from backend.app.services.reportes import ReporteService
+from backend.data.managers.csv_manager import CSVManager
+
+
+class ReportesPresenter:
+    """Presentador para exportar reportes de ventas, inventario y deudas.
+
+    Attributes:
+        view: La vista asociada con el presentador.
+        reporte_routes (ReporteRoutes): Rutas del backend que generan los reportes.
+    """
+
+    def __init__(self, view, data_manager: CSVManager):
+        """Inicializa el presentador de reportes.
+
+        Args:
+            view: La vista asociada con este presentador.
+            data_manager (CSVManager): Gestor de datos para generar los reportes.
+        """
+        self.view = view
+        self.reporte_routes = ReporteRoutes(ReporteService(data_manager))
+
+    def nombre_archivo(self, tipo: str, formato: str) -> str:
+        """Nombre sugerido para guardar el reporte."""
+        return self.reporte_routes.nombre_archivo(tipo, formato)
+
+    def exportar(self, tipo: str, formato: str, desde: str, hasta: str, ruta: str):
+        """Exporta un reporte escribiéndolo por bloques en la ruta indicada.
+
+        Args:
+            tipo (str): Tipo de reporte.
+            formato (str): Formato de exportación.
+            desde (str): Fecha inicial 'YYYY-MM-DD' o vacío.
+            hasta (str): Fecha final 'YYYY-MM-DD' o vacío (se incluye el día completo).
+            ruta (str): Ruta del archivo de destino.
+        """
+        try:
+            fecha_desde = self.__parse_fecha(desde)
+            fecha_hasta = self.__parse_fecha(hasta, fin_del_dia=True)
+            bloques = self.reporte_routes.exportar(tipo, formato, fecha_desde, fecha_hasta)
+            with open(ruta, 'wb') as archivo:
+                for bloque in bloques:
+                    archivo.write(bloque)
+            self.view.mostrar_mensaje(f'Reporte guardado en {ruta}')
+        except ValueError as e:
+            self.view.mostrar_mensaje(str(e))
+        except OSError as e:
+            self.view.mostrar_mensaje(f'No se pudo guardar el reporte: {e}')
+
+    @staticmethod
+    def __parse_fecha(valor: str, fin_del_dia: bool = False) -> Optional[datetime]:
+        """Convierte una fecha 'YYYY-MM-DD' en datetime; vacío significa sin límite."""
+        valor = (valor or '').strip()
+        if not valor:
+            return None
+        try:
+            fecha = datetime.strptime(valor, '%Y-%m-%d')
+        except ValueError:
+            raise ValueError('Las fechas deben tener el formato AAAA-MM-DD')
+        return datetime.combine(fecha.date(), time.max) if fin_del_dia else fecha
@@ -0,0 +1,121 @@
+# frontend\reportes\view.py
+import flet as ft
+
+from backend.app.enums.reports import Reports
+from backend.data.managers.csv_manager import CSVManager
+from frontend.app.enums.app import AppRoutes
+from frontend.reportes.presenter import ReportesPresenter
+
+
+def mostrar_reportes(page: ft.Page, data_manager: CSVManager) -> ft.View:
+    """Función principal para mostrar la vista de reportes.
+
+    Args:
+        page (ft.Page): Instancia de la página de Flet donde se mostrará la vista.
+        data_manager (CSVManager): Instancia del manejador de datos CSV.
+
+    Returns:
+        ft.View: Vista construida con el formulario de exportación.
+    """
+    view = ReportesView(page, data_manager)
+    return view.build()
+
+
+class ReportesView:
+    """Vista para exportar reportes a CSV, JSON Lines o PDF.
+
+    Args:
+        page (ft.Page): Instancia de la página de Flet.
+        data_manager (CSVManager): Manejador de datos CSV.
+    """
+
+    def __init__(self, page: ft.Page, data_manager: CSVManager):
+        self.page = page
+        self.presenter = ReportesPresenter(self, data_manager)
+
+        self.tipo_input = ft.Dropdown(
+            label='Reporte',
+            value=Reports.VENTAS,
+            options=[
+                ft.dropdown.Option(key=Reports.VENTAS, text='Ventas'),
+                ft.dropdown.Option(key=Reports.INVENTARIO, text='Inventario'),
+                ft.dropdown.Option(key=Reports.DEUDAS, text='Deudas'),
+            ],
+        )
+        self.formato_input = ft.Dropdown(
+            label='Formato',
+            value=Reports.CSV,
+            options=[
+                ft.dropdown.Option(key=Reports.CSV, text='CSV'),
+                ft.dropdown.Option(key=Reports.JSONL, text='JSON Lines'),
+                ft.dropdown.Option(key=Reports.PDF, text='PDF (resumen)'),
+            ],
+        )
+        self.desde_input = ft.TextField(label='Desde (AAAA-MM-DD)', expand=True)
+        self.hasta_input = ft.TextField(label='Hasta (AAAA-MM-DD)', expand=True)
+        self.file_picker = ft.FilePicker(on_result=self._on_ruta_seleccionada)
+        self.page.overlay.append(self.file_picker)
+
+    def build(self):
+        """Construye y retorna la vista de reportes.
+
+        Returns:
+            ft.View: Vista completa de reportes con su AppBar y formulario.
+        """
+        return ft.View(
+            AppRoutes.REPORTES,
+            [
+                ft.AppBar(title=ft.Text('Reportes 📊'), center_title=True),
+                ft.Container(
+                    content=ft.Column(
+                        [
+                            self.tipo_input,
+                            self.formato_input,
+                            ft.Row([self.desde_input, self.hasta_input]),
+                            ft.Text(
+                                'El rango de fechas solo aplica al reporte de ventas.',
+                                size=12,
+                                color=ft.colors.GREY_600,
+                            ),
+                            ft.ElevatedButton(
+                                'Exportar',
+                                icon=ft.icons.DOWNLOAD,
+                                on_click=self._on_exportar,
+                            ),
+                        ],
+                        spacing=15,
+                    ),
+                    padding=20,
+                ),
+            ],
+        )
+
+    def _on_exportar(self, e):
+        """Abre el diálogo para elegir dónde guardar el reporte."""
+        self.file_picker.save_file(
+            dialog_title='Guardar reporte',
+            file_name=self.presenter.nombre_archivo(
+                self.tipo_input.value, self.formato_input.value
+            ),
+        )
+
+    def _on_ruta_seleccionada(self, e: ft.FilePickerResultEvent):
+        """Exporta el reporte a la ruta elegida por el usuario."""
+        if not e.path:
+            return
+        self.presenter.exportar(
+            self.tipo_input.value,
+            self.formato_input.value,
+            self.desde_input.value,
+            self.hasta_input.value,
+            e.path,
+        )
+
+    def mostrar_mensaje(self, mensaje: str):
+        """Muestra un mensaje de error o éxito al usuario.
+
+        Args:
+            mensaje (str): El mensaje que se desea mostrar al usuario.
+        """
+        self.page.open(ft.SnackBar(content=ft.Text(mensaje)))
+        self.page.update()
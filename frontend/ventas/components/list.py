@@ -16,6 +16,7 @@ class VentaList:
     Métodos:
         _get_header(): Crea y devuelve la fila de cabecera de la lista.
         update_items(items): Actualiza la lista con los productos y sus detalles.
+        _crear_fila(item): Crea la fila de un producto que entra a la venta.
         _handle_decrease(e): Maneja la disminución de la cantidad de un producto.
         _handle_increase(e): Maneja el incremento de la cantidad de un producto.
         clear(): Limpia la lista, pero mantiene la cabecera visible.
@@ -35,6 +36,8 @@ class VentaList:
             height=200,
             controls=[self._get_header()],
         )
+        # Filas visibles por ID de producto, en el orden de la venta
+        self._filas = {}
 
     def _get_header(self):
         """Genera la cabecera de la lista de productos.
@@ -68,57 +71,80 @@ class VentaList:
     def update_items(self, items):
         """Actualiza la lista de productos con los datos proporcionados.
 
-        Crea filas para cada producto con su nombre, cantidad y total. Los botones de incremento y
-        decremento permiten modificar la cantidad de productos.
+        Las filas se identifican por 'producto_id': las existentes solo cambian
+        sus textos (nombre, cantidad y total), y únicamente se crean o quitan filas
+        para productos que entran o salen de la venta. Así, al enviar la lista,
+        Flet transmite solo los textos modificados.
 
         Args:
             items (List[dict]): Lista de diccionarios que representan los productos a mostrar,
                                  donde cada diccionario debe contener 'nombre', 'cantidad',
                                  'total', y 'producto_id'.
         """
-        controls = [self._get_header()]
-
+        filas = {}
         for item in items:
-            row = ft.Row(
-                [
-                    # Columna Producto (izquierda)
-                    ft.Text(item['nombre'], expand=True),
-                    # Columna Cantidad (centro)
-                    ft.Container(
-                        content=ft.Row(
-                            [
-                                ft.IconButton(
-                                    ft.icons.REMOVE_CIRCLE_OUTLINE,
-                                    data=item['producto_id'],
-                                    on_click=self._handle_decrease,
-                                ),
-                                ft.Container(
-                                    content=ft.Text(
-                                        str(item['cantidad']),
-                                        text_align=ft.TextAlign.CENTER,
-                                    ),
-                                    width=30,  # Ancho fijo para el número
-                                    alignment=ft.alignment.center,
-                                ),
-                                ft.IconButton(
-                                    ft.icons.ADD_CIRCLE_OUTLINE,
-                                    data=item['producto_id'],
-                                    on_click=self._handle_increase,
-                                ),
-                            ],
-                            alignment=ft.MainAxisAlignment.CENTER,  # Centrar horizontalmente
-                        ),
-                        expand=True,  # Para que tome el espacio disponible
-                        alignment=ft.alignment.center,  # Centrar el contenedor
-                    ),
-                    # Columna Total (derecha)
-                    ft.Text(f"${item['total']:.2f}", text_align=ft.TextAlign.RIGHT, expand=True),
-                ],
-                alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
-            )
-            controls.append(row)
+            fila = self._filas.get(item['producto_id'])
+            if fila is None:
+                fila = self._crear_fila(item)
+            fila.nombre_text.value = item['nombre']
+            fila.cantidad_text.value = str(item['cantidad'])
+            fila.total_text.value = f"${item['total']:.2f}"
+            filas[item['producto_id']] = fila
+
+        if list(filas) != list(self._filas):
+            self.list_view.controls = [self.list_view.controls[0], *filas.values()]
+        self._filas = filas
+
+    def _crear_fila(self, item) -> ft.Row:
+        """Crea la fila de un producto con sus controles de cantidad.
 
-        self.list_view.controls = controls
+        Args:
+            item (dict): Producto con 'producto_id'.
+
+        Returns:
+            ft.Row: Fila con sus textos en `nombre_text`, `cantidad_text` y `total_text`.
+        """
+        nombre_text = ft.Text(expand=True)
+        cantidad_text = ft.Text(text_align=ft.TextAlign.CENTER)
+        total_text = ft.Text(text_align=ft.TextAlign.RIGHT, expand=True)
+        row = ft.Row(
+            [
+                # Columna Producto (izquierda)
+                nombre_text,
+                # Columna Cantidad (centro)
+                ft.Container(
+                    content=ft.Row(
+                        [
+                            ft.IconButton(
+                                ft.icons.REMOVE_CIRCLE_OUTLINE,
+                                data=item['producto_id'],
+                                on_click=self._handle_decrease,
+                            ),
+                            ft.Container(
+                                content=cantidad_text,
+                                width=30,  # Ancho fijo para el número
+                                alignment=ft.alignment.center,
+                            ),
+                            ft.IconButton(
+                                ft.icons.ADD_CIRCLE_OUTLINE,
+                                data=item['producto_id'],
+                                on_click=self._handle_increase,
+                            ),
+                        ],
+                        alignment=ft.MainAxisAlignment.CENTER,  # Centrar horizontalmente
+                    ),
+                    expand=True,  # Para que tome el espacio disponible
+                    alignment=ft.alignment.center,  # Centrar el contenedor
+                ),
+                # Columna Total (derecha)
+                total_text,
+            ],
+            alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+        )
+        row.nombre_text = nombre_text
+        row.cantidad_text = cantidad_text
+        row.total_text = total_text
+        return row
 
     def _handle_decrease(self, e):
         """Disminuye la cantidad del producto seleccionado.
@@ -150,3 +176,4 @@ class VentaList:
         Este método remueve todos los productos de la lista, pero deja la cabecera visible.
         """
         self.list_view.controls = [self._get_header()]
+        self._filas = {}
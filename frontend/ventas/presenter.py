@@ -1,6 +1,7 @@
+import weakref
 from datetime import datetime
-from dataclasses import dataclass
-from typing import Optional, List
+from dataclasses import dataclass, replace
+from typing import Optional, List, Set
 import flet as ft
 
 from backend.data.managers.csv_manager import CSVManager
@@ -8,6 +9,12 @@ from backend.models.deudor import Deudor
 from backend.models.producto import Producto
 from backend.models.venta import Venta
 
+from backend.data.indexes.busqueda import BusquedaDeudores
+from backend.data.indexes.stock import AlertaStock, StockIndex
+from backend.app.cambios.productos import CambioProducto, CambiosProductos
+from backend.app.enums.cambios import Cambios
+from backend.app.enums.manager import DataEvents
+
 from backend.app.routes.productos import ProductoRoutes
 from backend.app.services.productos import ProductoService
 from backend.app.routes.ventas import VentaRoutes
@@ -55,6 +62,9 @@ class VentasPresenter:
         total_actual (float): Monto total de la venta actual.
     """
 
+    # Número máximo de deudores sugeridos mientras se escribe el nombre
+    SUGERENCIAS_DEUDORES: int = 8
+
     def __init__(self, view, data_manager: CSVManager):
         """Inicializa el presentador de ventas.
 
@@ -77,10 +87,25 @@ class VentasPresenter:
         self.producto_routes = ProductoRoutes(self.producto_service)
 
         self.productos = self.producto_routes.get_productos_disponibles()
-
-        self.deudores: list[Deudor] = data_manager.get_data(Deudor)
-
-        self.indice_deudor: Deudor | None = None
+        # Opciones del dropdown y lista de productos con la que se construyeron
+        self._opciones: List[ft.dropdown.Option] = []
+        self._productos_opciones: Optional[List[Producto]] = None
+
+        # Alertas de stock bajo de los productos de la venta que se está registrando
+        # (las de otras sesiones o de ediciones de productos se ignoran)
+        self.alertas_stock: List[AlertaStock] = []
+        self._ids_registrando: Set[int] = set()
+        data_manager.get_component(StockIndex).subscribe_alertas(self._on_alerta_stock)
+
+        # Cambios de stock y precio hechos por otras sesiones mientras se vende: se
+        # aplican en el event loop de esta sesión, no en el hilo de quien escribe
+        self._cambios: CambiosProductos = data_manager.get_component(CambiosProductos)
+        self._secuencia = self._cambios.secuencia
+        self.view.page.run_task(self._seguir_cambios, weakref.ref(self), self._cambios)
+
+        self.busqueda_deudores: BusquedaDeudores = data_manager.get_component(BusquedaDeudores)
+        self.deudor_seleccionado: Deudor | None = None
+        self._ids_sugeridos: List[int] = []
 
         self._init_deuda_dialog()
 
@@ -93,24 +118,20 @@ class VentasPresenter:
 
         Attributes:
             busqueda_activa (bool): Indica si está en modo búsqueda o adición de deudor.
-            nombre_input (ft.AutoComplete): Campo de entrada de nombre con autocompletado.
+            nombre_input (ft.TextField): Campo de entrada de nombre con autocompletado.
+            sugerencias (ft.Column): Deudores sugeridos para el nombre escrito.
             telefono_input (ft.TextField): Campo de entrada de teléfono.
             buscar_icon (ft.IconButton): Botón para alternar modos de búsqueda/adición.
             deuda_dialog (ft.AlertDialog): Diálogo principal para gestionar deudas.
 
         Notes:
-            - Utiliza AutoComplete para sugerencias de deudores existentes.
+            - Sugiere deudores existentes con el índice de prefijos a medida que se escribe.
             - Incluye un botón para cambiar entre búsqueda y adición de nuevos deudores.
         """
         self.busqueda_activa = True
 
-        self.nombre_input = ft.AutoComplete(
-            suggestions=[
-                ft.AutoCompleteSuggestion(key=deudor.nombre, value=deudor.nombre)
-                for deudor in self.deudores
-            ],
-            on_select=lambda e: self.set_deudor_seleccionado(e.control),
-        )
+        self.nombre_input = self._crear_input_busqueda()
+        self.sugerencias = ft.Column(spacing=0, tight=True)
 
         self.telefono_input = ft.TextField(label='Teléfono', width=200)
 
@@ -123,22 +144,7 @@ class VentasPresenter:
 
         self.deuda_dialog = ft.AlertDialog(
             title=ft.Text("Generar deuda"),
-            content=ft.Column(
-                [
-                    ft.Text(
-                        "El monto ingresado es insuficiente para realizar la venta."
-                    ),
-                    # Primera fila con el nombre_input y el botón de búsqueda
-                    ft.Row(
-                        [
-                            ft.Column([self.nombre_input], width=200),
-                            ft.Column([self.buscar_icon], width=80),
-                        ],
-                    ),
-                    ft.Row([ft.Column([self.telefono_input], width=200)]),
-                ],
-                tight=True,
-            ),
+            content=self._get_deuda_dialog_content(),
             actions=[
                 ft.TextButton("Confirmar deuda", on_click=self._confirmar_deuda),
                 ft.TextButton("Cancelar", on_click=lambda _: self._cerrar_dialog()),
@@ -149,7 +155,7 @@ class VentasPresenter:
         """Alterna entre modos de búsqueda y adición de nuevo deudor.
 
         Cambia dinámicamente entre:
-        - Modo búsqueda: Usa AutoComplete con lista de deudores existentes
+        - Modo búsqueda: Sugiere deudores existentes a medida que se escribe
         - Modo adición: Usa TextField para ingresar nuevo deudor
 
         Args:
@@ -161,14 +167,10 @@ class VentasPresenter:
             - Fuerza una actualización de la página.
         """
         self.busqueda_activa = not self.busqueda_activa
+        self.deudor_seleccionado = None
+        self._mostrar_sugerencias([])
         if self.busqueda_activa:
-            self.nombre_input = ft.AutoComplete(
-                suggestions=[
-                    ft.AutoCompleteSuggestion(key=deudor.nombre, value=deudor.nombre)
-                    for deudor in self.deudores
-                ],
-                on_select=lambda e: self.set_deudor_seleccionado(e.control),
-            )
+            self.nombre_input = self._crear_input_busqueda()
             self.buscar_icon.icon = ft.icons.ADD
         else:
             # Cambiar a agregar nuevo deudor (TextField)
@@ -179,14 +181,10 @@ class VentasPresenter:
         self.view.page.update()
 
     def _get_deuda_dialog_content(self):
-        """Establece el índice del deudor seleccionado.
-
-        Args:
-            datos_deudor (ft.AutoComplete): Control de autocompletado con el deudor seleccionado.
+        """Construye el contenido del diálogo de deuda.
 
-        Notes:
-            - Imprime información de depuración.
-            - Guarda el índice del deudor seleccionado.
+        Returns:
+            ft.Column: Mensaje, campo de nombre con sus sugerencias y teléfono.
         """
         return ft.Column(
             [
@@ -198,35 +196,88 @@ class VentasPresenter:
                         ft.Column([self.buscar_icon], width=80),
                     ],
                 ),
+                ft.Container(self.sugerencias, width=280),
                 ft.Row([ft.Column([self.telefono_input], width=200)]),
             ],
             tight=True,
         )
 
-    def set_deudor_seleccionado(self, datos_deudor: ft.AutoComplete):
+    def _crear_input_busqueda(self) -> ft.TextField:
+        """Crea el campo de nombre que sugiere deudores mientras se escribe."""
+        return ft.TextField(
+            label="Buscar deudor",
+            width=200,
+            on_change=lambda e: self.handle_busqueda_deudor(e.control.value),
+        )
+
+    def handle_busqueda_deudor(self, texto: str):
+        """Actualiza las sugerencias de deudores para el texto escrito.
+
+        Solo se consultan y envían las `SUGERENCIAS_DEUDORES` mejores coincidencias,
+        y las sugerencias se redibujan únicamente si cambiaron.
+
+        Args:
+            texto (str): Texto escrito en el campo de nombre.
         """
-            Establece el índice del deudor seleccionado.
+        if self.deudor_seleccionado and texto != self.deudor_seleccionado.nombre:
+            # El texto ya no corresponde al deudor elegido
+            self.deudor_seleccionado = None
+        self._mostrar_sugerencias(
+            self.busqueda_deudores.sugerir(texto, self.SUGERENCIAS_DEUDORES)
+        )
+
+    def _mostrar_sugerencias(self, deudores: List[Deudor]):
+        """Reemplaza las sugerencias visibles si la lista de deudores cambió.
 
         Args:
-            datos_deudor (ft.AutoComplete): Objeto de autocompletado con información del deudor.
+            deudores (List[Deudor]): Deudores a sugerir, en orden de relevancia.
         """
+        ids = [deudor.id for deudor in deudores]
+        if ids == self._ids_sugeridos:
+            return
+        self._ids_sugeridos = ids
+        self.sugerencias.controls = [
+            ft.ListTile(
+                title=ft.Text(deudor.nombre),
+                subtitle=ft.Text(deudor.telefono) if deudor.telefono else None,
+                dense=True,
+                on_click=lambda _, d=deudor: self.set_deudor_seleccionado(d),
+            )
+            for deudor in deudores
+        ]
+        if self.sugerencias.page:
+            self.sugerencias.update()
 
-        print(datos_deudor)
-        print(datos_deudor.data)
-        self.indice_deudor = datos_deudor.selected_index
+    def set_deudor_seleccionado(self, deudor: Deudor):
+        """Establece el deudor seleccionado entre las sugerencias.
+
+        Args:
+            deudor (Deudor): Deudor elegido por el usuario.
+        """
+        self.deudor_seleccionado = deudor
+        self.nombre_input.value = deudor.nombre
+        self.telefono_input.value = deudor.telefono or ''
+        self._mostrar_sugerencias([])
+        self.view.page.update()
 
     def filtrar_productos_con_stock(self) -> List[ft.dropdown.Option]:
         """
         Crea las opciones del dropdown solo con productos que tienen stock.
 
+        Las opciones se reutilizan mientras `self.productos` no se reemplace, de
+        modo que la vista sabe que no cambiaron y no las reenvía.
+
         Returns:
             List[ft.dropdown.Option]: Lista de opciones de dropdown para productos con stock disponible.
         """
-        return [
-            ft.dropdown.Option(key=str(p.id), text=p.nombre)
-            for p in self.productos
-            if p.stock > 0
-        ]
+        if self._productos_opciones is not self.productos:
+            self._opciones = [
+                ft.dropdown.Option(key=str(p.id), text=p.nombre)
+                for p in self.productos
+                if p.stock > 0
+            ]
+            self._productos_opciones = self.productos
+        return self._opciones
 
     def handle_producto_seleccionado(self, producto_id: str):
         """
@@ -319,19 +370,14 @@ class VentasPresenter:
 
     def _actualizar_vista(self):
         """
-        Procesa una venta, ya sea completa o a crédito.
-
-        Verifica si hay productos en la venta y si el monto pagado es suficiente.
-        Si no es suficiente, muestra un diálogo para crear una deuda.
+        Refleja en la vista la venta en curso: filas, total y productos disponibles.
 
-        Args:
-            monto_pagado (float, optional): Monto pagado por el cliente. Defaults to 0.
+        La vista envía solo las filas y textos que cambiaron, en una única actualización.
         """
         # Calcular nuevo total
         self.total_actual = sum(pv.total for pv in self.productos_venta)
-        self.view.actualizar_total(self.total_actual)
 
-        # Actualizar lista de ventas
+        # Actualizar lista de ventas, total y opciones del dropdown en un solo envío
         items_venta = [
             {
                 "nombre": pv.producto.nombre,
@@ -341,13 +387,9 @@ class VentasPresenter:
             }
             for pv in self.productos_venta
         ]
-        self.view.venta_list.update_items(items_venta)
-
-        # Actualizar opciones del dropdown
-        self.view.actualizar_productos_disponibles(self.filtrar_productos_con_stock())
-
-        # Forzar actualización de la página
-        self.view.page.update()
+        self.view.actualizar_carrito(
+            items_venta, self.total_actual, self.filtrar_productos_con_stock()
+        )
 
     def handle_vender(self, monto_pagado: float = 0):
         """
@@ -377,24 +419,25 @@ class VentasPresenter:
                 for item in self.productos_venta
             ]
 
-            self.venta_routes.create_venta(
-                {"productos": productos, "monto_pagado": monto_pagado}
-            )
+            self._ids_registrando = {p["id_producto"] for p in productos}
+            self.venta_routes.create_venta({"productos": productos, "monto_pagado": monto_pagado})
 
             # Recargar productos para tener el stock actualizado
-            self.productos = self.producto_routes.get_productos_disponibles()
+            self._recargar_productos()
 
             # Limpiar estado y UI
             self.productos_venta.clear()
             self._actualizar_vista()
             self.view.limpiar_formulario()
-            self.view.mostrar_error("Venta registrada correctamente")
+            self.view.mostrar_error(self._mensaje_con_alertas("Venta registrada correctamente"))
 
         except ValueError as e:
             self.view.mostrar_error(str(e))
         except Exception as e:
             print(e)
             self.view.mostrar_error(f"Error al procesar la venta: {str(e)}")
+        finally:
+            self._terminar_registro()
 
     def _mostrar_dialog_deuda(self):
         """
@@ -419,22 +462,22 @@ class VentasPresenter:
             Exception: Si ocurre un error al registrar la venta a crédito.
         """
         if self.busqueda_activa:
-            # Si es búsqueda, se usa el AutoComplete para seleccionar
-            if self.indice_deudor is None:
+            # Si es búsqueda, se usa el deudor elegido entre las sugerencias
+            if self.deudor_seleccionado is None:
                 # Mostrar un error si no se seleccionó un deudor
-                self.view.show_error("Por favor, seleccione un deudor.")
+                self.view.mostrar_error("Por favor, seleccione un deudor.")
                 return
-            nombre_deudor = self.deudores[self.indice_deudor].nombre
-            telefono_deudor = self.deudores[self.indice_deudor].telefono
+            id_deudor = self.deudor_seleccionado.id
+            nombre_deudor = self.deudor_seleccionado.nombre
+            telefono_deudor = self.deudor_seleccionado.telefono
         else:
             # Si no es búsqueda, se usa el TextField para agregar un nuevo deudor
             nombre_deudor = self.nombre_input.value.strip()
             telefono_deudor = self.telefono_input.value.strip()
             if not self.validar_deudor(nombre_deudor, telefono_deudor):
                 return
-            # Guardar nuevo deudor en el sistema
-            nuevo_deudor = Deudor(id=-1, nombre=nombre_deudor, telefono=telefono_deudor)
-            self.deudores.append(nuevo_deudor)
+            # El nuevo deudor se guarda al registrar la venta
+            id_deudor = None
             self.view.mostrar_error(f"Nuevo deudor agregado: {nombre_deudor}")
 
         if not nombre_deudor:
@@ -449,26 +492,151 @@ class VentasPresenter:
             ]
 
             # Crear venta a crédito
+            self._ids_registrando = {p["id_producto"] for p in productos}
             self.venta_routes.create_venta(
                 {
                     "productos": productos,
                     "monto_pagado": 0,
                     "deudor_info": {
+                        "id": id_deudor,
                         "nombre": nombre_deudor,
                         "telefono": telefono_deudor,
                     },
                 }
             )
 
+            # Recargar productos para tener el stock actualizado
+            self._recargar_productos()
+
             # Limpiar estado y UI
             self.productos_venta.clear()
             self._actualizar_vista()
             self.view.limpiar_formulario()
             self._cerrar_dialog()
-            self.view.mostrar_error("Venta a crédito registrada correctamente")
+            self.deudor_seleccionado = None
+            self.nombre_input.value = ''
+            self.telefono_input.value = ''
+            self.view.mostrar_error(
+                self._mensaje_con_alertas("Venta a crédito registrada correctamente")
+            )
 
         except Exception as e:
             self.view.mostrar_error(f"Error al registrar la venta a crédito: {str(e)}")
+        finally:
+            self._terminar_registro()
+
+    def _on_alerta_stock(self, alerta: AlertaStock):
+        """Guarda una alerta de stock bajo para mostrarla al terminar la venta.
+
+        Solo se guardan las de los productos de la venta que se está registrando.
+
+        Args:
+            alerta (AlertaStock): Producto que cruzó su umbral de reposición.
+        """
+        if alerta.producto.id in self._ids_registrando:
+            self.alertas_stock.append(alerta)
+
+    def _terminar_registro(self):
+        """Deja de recoger alertas y descarta las que no se mostraron."""
+        self._ids_registrando = set()
+        self.alertas_stock.clear()
+
+    def _recargar_productos(self):
+        """Recarga los productos disponibles y descarta los cambios que ya incluyen."""
+        secuencia = self._cambios.secuencia
+        self.productos = self.producto_routes.get_productos_disponibles()
+        self._secuencia = max(self._secuencia, secuencia)
+
+    @staticmethod
+    async def _seguir_cambios(referencia: weakref.ref, cambios: CambiosProductos):
+        """Aplica los cambios de productos publicados mientras exista el presentador.
+
+        Se ejecuta con `page.run_task` en el event loop de la sesión y guarda
+        solo una referencia débil al presentador, de modo que termina cuando la
+        sesión se descarta.
+
+        Args:
+            referencia (weakref.ref): Referencia débil al presentador.
+            cambios (CambiosProductos): Feed de cambios de productos.
+        """
+        while (presentador := referencia()) is not None:
+            secuencia = presentador._secuencia
+            del presentador
+            pendientes = await cambios.esperar(secuencia, Cambios.HEARTBEAT)
+            presentador = referencia()
+            if presentador is None or presentador._secuencia != secuencia:
+                # Sesión descartada, o una venta propia ya recargó los productos
+                continue
+            if pendientes is None:
+                # Demasiados cambios para el historial: se recargan completos
+                presentador._recargar_productos()
+                presentador.view.actualizar_productos_disponibles(
+                    presentador.filtrar_productos_con_stock()
+                )
+            for cambio in pendientes or []:
+                presentador._on_cambio_producto(cambio)
+                presentador._secuencia = cambio.secuencia
+            del presentador
+
+    def _on_cambio_producto(self, cambio: CambioProducto):
+        """Aplica en el lugar un cambio de stock o precio hecho por otra sesión.
+
+        Actualiza la lista de productos disponibles y ajusta la venta en curso:
+        toma el precio nuevo y limita la cantidad al stock restante, quitando
+        los productos que se agotaron.
+
+        Args:
+            cambio (CambioProducto): Cambio publicado por el feed de productos.
+
+        Note:
+            Los cambios de la venta propia no llegan aquí: al registrarla, los
+            productos se recargan completos y se avanza la secuencia.
+        """
+        productos = {p.id: p for p in self.productos}
+        actual = productos.pop(cambio.id, None)
+        if cambio.evento != DataEvents.DELETE and cambio.stock and cambio.stock > 0:
+            # Se reemplaza el producto: el original pertenece al índice de stock
+            if actual is not None:
+                actual = replace(actual, stock=cambio.stock, precio=cambio.precio)
+            else:
+                actual = Producto(
+                    id=cambio.id,
+                    nombre=cambio.nombre,
+                    precio=cambio.precio,
+                    stock=cambio.stock,
+                    coste=None,
+                )
+            productos[cambio.id] = actual
+        self.productos = sorted(productos.values(), key=lambda p: p.id)
+
+        item = next((pv for pv in self.productos_venta if pv.producto.id == cambio.id), None)
+        if item is None:
+            self.view.actualizar_productos_disponibles(self.filtrar_productos_con_stock())
+            return
+        if cambio.id not in productos:
+            self.productos_venta.remove(item)
+            self.view.mostrar_error(f"{cambio.nombre} se agotó y se quitó de la venta")
+        else:
+            item.producto = productos[cambio.id]
+            item.cantidad = min(item.cantidad, item.producto.stock)
+        self._actualizar_vista()
+
+    def _mensaje_con_alertas(self, mensaje: str) -> str:
+        """Agrega al mensaje los productos que quedaron con stock bajo.
+
+        Args:
+            mensaje (str): Mensaje base a mostrar.
+
+        Returns:
+            str: Mensaje con las alertas pendientes, que se descartan al usarlas.
+        """
+        if not self.alertas_stock:
+            return mensaje
+        bajos = ', '.join(
+            f'{a.producto.nombre} ({a.producto.stock})' for a in self.alertas_stock
+        )
+        self.alertas_stock.clear()
+        return f'{mensaje}. Stock bajo: {bajos}'
 
     def validar_deudor(self, nombre: str, telefono: str):
         """Valida los datos de un deudor antes de guardarlo.
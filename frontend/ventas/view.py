@@ -97,15 +97,43 @@ class VentasView:
             ],
         )
 
-    def actualizar_productos_disponibles(self, opciones):
+    def actualizar_productos_disponibles(self, opciones, enviar: bool = True):
         """Actualiza las opciones disponibles en el dropdown de productos.
 
+        Reemplazar las opciones obliga a reenviarlas todas al cliente, por lo que
+        solo se hace si el presentador entrega una lista distinta.
+
         Args:
             opciones (list): Lista de opciones de productos a mostrar en el dropdown.
+            enviar (bool): Enviar el dropdown al cliente; False si se envía junto a
+                otros cambios.
         """
-        self.venta_form.producto_list.options = opciones
+        if opciones is not self.venta_form.producto_list.options:
+            self.venta_form.producto_list.options = opciones
         self.venta_form.producto_list.value = None  # Limpiar selección actual
-        self.page.update()
+        if enviar and self.venta_form.producto_list.page:
+            self.venta_form.producto_list.update()
+
+    def actualizar_carrito(self, items, total: float, opciones):
+        """Refleja un cambio de la venta en curso con una sola actualización.
+
+        Solo se envían al cliente la lista de productos, el total y el dropdown,
+        y de ellos únicamente las propiedades que cambiaron.
+
+        Args:
+            items (List[dict]): Productos de la venta (ver `VentaList.update_items`).
+            total (float): Total de la venta.
+            opciones (list): Opciones de productos para el dropdown.
+        """
+        self.venta_list.update_items(items)
+        self.actualizar_total(total)
+        self.actualizar_productos_disponibles(opciones, enviar=False)
+        if self.venta_list.list_view.page:
+            self.page.update(
+                self.venta_list.list_view,
+                self.venta_form.total_text,
+                self.venta_form.producto_list,
+            )
 
     # Métodos privados para procesar eventos de UI
     def _on_producto_change(self, e):
@@ -145,7 +173,7 @@ class VentasView:
             e (ft.ControlEvent): El evento del clic en el botón de vender.
         """
         self.venta_form.total_text.value = f'${total:.2f}'
-        # No llamamos a page.update() aquí porque se hará en _actualizar_vista
+        # No llamamos a page.update() aquí porque se hará en actualizar_carrito
 
     def actualizar_devolucion(self, devolucion: float):
         """Actualiza el texto de la devolución en el formulario de venta.
@@ -1,10 +1,15 @@
 # main.py
+import os
+import threading
+
 import flet as fl
 from flet_core.types import AppView
 
 
 from frontend.app.portalapp import Portalapp
+from backend.app.enums.despliegue import Despliegue
 from backend.constants.application import __MAIN__
+from backend.data.managers.csv_manager import CSVManager
 
 
 def main() -> None:
@@ -15,8 +20,17 @@ def main() -> None:
     - Crea una instancia de la aplicación Portal
     - Lanza la aplicación utilizando el framework Flet
     - Configura la vista de la aplicación como una aplicación Flet nativa
+    - Con PORTALAPP_MODO=servidor, atiende además a los workers de la API como
+      servidor de datos, compartiendo el mismo CSVManager con la interfaz; los
+      workers deben usar el mismo secreto en PORTALAPP_CLAVE
     """
-    app: Portalapp = Portalapp()
+    data_manager = CSVManager()
+    if os.environ.get(Despliegue.VARIABLE) == Despliegue.SERVIDOR:
+        from backend.data.managers.remoto import servidor_portalapp
+
+        servidor = servidor_portalapp(data_manager)
+        threading.Thread(target=servidor.servir, daemon=True).start()
+    app: Portalapp = Portalapp(data_manager)
     fl.app(
         target=app.main,
         view=fl.AppView.WEB_BROWSER,